@@ -2,7 +2,7 @@
 Anthropic provider implementation.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base import BaseProvider, ProviderRequest
 
@@ -79,4 +79,17 @@ class AnthropicProvider(BaseProvider):
         Returns:
             str: Extracted content
         """
-        return response["content"][0]["text"] 
\ No newline at end of file
+        return response["content"][0]["text"]
+    
+    def extract_stream_delta(self, event: Dict[str, Any]) -> Optional[str]:
+        """Extract the text delta from an Anthropic streaming event.
+        
+        Args:
+            event: Streamed Messages API event
+            
+        Returns:
+            Optional[str]: Text delta, if any
+        """
+        if event.get("type") != "content_block_delta":
+            return None
+        return event.get("delta", {}).get("text")
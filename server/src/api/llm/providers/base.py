@@ -5,9 +5,10 @@ This module defines the base interface and common functionality for all LLM prov
 """
 
 from abc import ABC, abstractmethod
+import json
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 
 import httpx
 from fastapi import HTTPException, status
@@ -17,6 +18,9 @@ from pydantic import BaseModel
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Connection pool for each provider's shared client
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
 
 class Message(BaseModel):
     """Message model for chat completion."""
@@ -57,8 +61,26 @@ class BaseProvider(ABC):
         """
         self.timeout = timeout
         self.name = self.__class__.__name__.lower().replace('provider', '')
+        self._client: Optional[httpx.AsyncClient] = None
         logger.info(f"Initialized {self.name} provider")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the provider's HTTP client, creating it on first use.
+        
+        The client is kept for the life of the provider so calls reuse pooled
+        connections (and multiplex over HTTP/2) instead of paying a TCP and
+        TLS handshake each time.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout, http2=True, limits=HTTP_LIMITS)
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the provider's HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     @abstractmethod
     async def prepare_request(self, request: ProviderRequest) -> Dict[str, Any]:
         """Prepare the request payload for the provider API.
@@ -117,6 +139,94 @@ class BaseProvider(ABC):
         Raises:
             HTTPException: If the request fails
         """
+        request = self.build_request(payload, api_key)
+        
+        # Call the provider API
+        response = await self.call(request)
+        
+        # Return the raw response
+        return response.raw_response
+    
+    async def generate_stream(self, payload: Dict[str, Any], api_key: str = None) -> AsyncIterator[str]:
+        """Generate a completion, yielding text as the provider streams it.
+        
+        Closing the iterator early (``aclose()``) closes the HTTP response, so
+        callers can stop reading once they have what they need.
+        
+        Args:
+            payload: Request payload
+            api_key: Optional API key to override the default
+            
+        Yields:
+            str: Completion text deltas
+            
+        Raises:
+            HTTPException: If the request fails
+        """
+        request = self.build_request(payload, api_key)
+        body = await self.prepare_request(request)
+        body["stream"] = True
+        headers = await self.prepare_headers(request)
+        api_url = await self.get_api_url()
+        
+        logger.info(f"Streaming {self.name} API with model {request.model}, timeout: {self.timeout}s")
+        try:
+            async with self._get_client().stream("POST", api_url, json=body, headers=headers) as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    text = self.extract_stream_delta(json.loads(data))
+                    if text:
+                        yield text
+        except httpx.HTTPStatusError as e:
+            logger.error(f"{self.name} API error: {e.response.status_code} - {e.response.text}")
+            raise HTTPException(
+                status_code=e.response.status_code,
+                detail=f"{self.name.capitalize()} API error: {e.response.text}"
+            )
+        except httpx.TimeoutException as e:
+            logger.error(f"{self.name} API stream timed out (configured timeout: {self.timeout}s): {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"{self.name.capitalize()} API request timed out after {self.timeout}s. Please try again later."
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Error communicating with {self.name} API: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Error communicating with {self.name.capitalize()} API: {str(e)}"
+            )
+    
+    def extract_stream_delta(self, event: Dict[str, Any]) -> Optional[str]:
+        """Extract the text delta from one streamed event.
+        
+        Args:
+            event: Decoded ``data:`` payload of a server-sent event
+            
+        Returns:
+            Optional[str]: Text delta, or None for events without text
+        """
+        return None
+    
+    def build_request(self, payload: Dict[str, Any], api_key: str = None) -> ProviderRequest:
+        """Validate a request payload and convert it to a ProviderRequest.
+        
+        Args:
+            payload: Request payload
+            api_key: Optional API key to override the default
+            
+        Returns:
+            ProviderRequest: Provider request parameters
+            
+        Raises:
+            HTTPException: If the payload is invalid for this provider
+        """
         # Optional normalization: some providers (e.g., Anthropic) expect a
         # top-level `system` parameter rather than a message with role "system".
         # Allow per-call override with payload["normalize_system_top_level"].
@@ -174,11 +284,7 @@ class BaseProvider(ABC):
                     ),
                 )
         
-        # Call the provider API
-        response = await self.call(request)
-        
-        # Return the raw response
-        return response.raw_response
+        return request
     
     async def call(self, request: ProviderRequest) -> ProviderResponse:
         """Call the provider API.
@@ -211,33 +317,32 @@ class BaseProvider(ABC):
             
             start_time = time.time()
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    api_url,
-                    json=payload,
-                    headers=headers,
-                )
-                
-                # Check for errors
-                response.raise_for_status()
-                
-                # Parse response
-                response_data = response.json()
-                
-                # Calculate request duration
-                duration = time.time() - start_time
-                logger.info(f"{self.name} API call completed in {duration:.2f}s")
-                
-                # Extract content
-                content = await self.extract_content(response_data)
-                logger.debug(f"Response content length: {len(content)} chars")
-                
-                return ProviderResponse(
-                    content=content,
-                    provider=self.name,
-                    model=request.model,
-                    raw_response=response_data
-                )
+            response = await self._get_client().post(
+                api_url,
+                json=payload,
+                headers=headers,
+            )
+            
+            # Check for errors
+            response.raise_for_status()
+            
+            # Parse response
+            response_data = response.json()
+            
+            # Calculate request duration
+            duration = time.time() - start_time
+            logger.info(f"{self.name} API call completed in {duration:.2f}s")
+            
+            # Extract content
+            content = await self.extract_content(response_data)
+            logger.debug(f"Response content length: {len(content)} chars")
+            
+            return ProviderResponse(
+                content=content,
+                provider=self.name,
+                model=request.model,
+                raw_response=response_data
+            )
                 
         except httpx.HTTPStatusError as e:
             # Forward provider error response
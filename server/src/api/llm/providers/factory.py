@@ -4,7 +4,7 @@ Provider factory module.
 This module provides a factory for creating provider instances.
 """
 
-from typing import Dict, Type
+from typing import Dict, Optional, Tuple, Type
 
 from .base import BaseProvider
 from .openai_provider import OpenAIProvider
@@ -19,10 +19,15 @@ class ProviderFactory:
         "anthropic": AnthropicProvider,
     }
     
+    # Provider instances are shared so their HTTP clients keep connections alive
+    _instances: Dict[Tuple[str, Optional[float]], BaseProvider] = {}
+    
     @classmethod
     def get_provider(cls, provider_name: str, timeout: float = None) -> BaseProvider:
         """Get a provider instance by name.
         
+        Instances are cached per provider and timeout.
+        
         Args:
             provider_name: Name of the provider
             timeout: Optional timeout in seconds. If not provided, uses provider default.
@@ -33,16 +38,31 @@ class ProviderFactory:
         Raises:
             ValueError: If the provider is not supported
         """
-        provider_class = cls._providers.get(provider_name.lower())
+        key = (provider_name.lower(), timeout)
+        provider = cls._instances.get(key)
+        if provider is not None:
+            return provider
+        
+        provider_class = cls._providers.get(key[0])
         if not provider_class:
             supported = ", ".join(cls._providers.keys())
             raise ValueError(f"Unsupported provider: {provider_name}. Supported providers: {supported}")
         
         # Pass timeout if provided, otherwise use default
         if timeout is not None:
-            return provider_class(timeout=timeout)
+            provider = provider_class(timeout=timeout)
         else:
-            return provider_class()
+            provider = provider_class()
+        cls._instances[key] = provider
+        return provider
+    
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close the HTTP clients of all cached provider instances."""
+        instances = list(cls._instances.values())
+        cls._instances.clear()
+        for provider in instances:
+            await provider.aclose()
     
     @classmethod
     def register_provider(cls, name: str, provider_class: Type[BaseProvider]) -> None:
@@ -52,4 +72,7 @@ class ProviderFactory:
             name: Name of the provider
             provider_class: Provider class
         """
-        cls._providers[name.lower()] = provider_class 
\ No newline at end of file
+        cls._providers[name.lower()] = provider_class
+        # Drop instances of a provider class that was replaced
+        for key in [k for k in cls._instances if k[0] == name.lower()]:
+            del cls._instances[key] 
\ No newline at end of file
@@ -2,7 +2,7 @@
 OpenAI provider implementation.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .base import BaseProvider, ProviderRequest
 
@@ -64,4 +64,18 @@ class OpenAIProvider(BaseProvider):
         Returns:
             str: Extracted content
         """
-        return response["choices"][0]["message"]["content"] 
\ No newline at end of file
+        return response["choices"][0]["message"]["content"]
+    
+    def extract_stream_delta(self, event: Dict[str, Any]) -> Optional[str]:
+        """Extract the text delta from an OpenAI chat completion chunk.
+        
+        Args:
+            event: Streamed chat completion chunk
+            
+        Returns:
+            Optional[str]: Text delta, if any
+        """
+        choices = event.get("choices") or []
+        if not choices:
+            return None
+        return choices[0].get("delta", {}).get("content")
@@ -12,6 +12,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from src.api.auth import router as auth_router
 from src.api.llm.proxy.router import router as llm_router
 from src.api.exception_handlers import register_exception_handlers
+from src.api.llm.providers import ProviderFactory
+from src.core.llm.anthropic_provider import close_all_clients as close_anthropic_clients
+from src.core.external_mcp.external_mcp_client import close_shared_sessions
 from src.config.settings import settings
 
 # Configure logging using our centralized logging module
@@ -20,7 +23,11 @@ from src.utils.logging import configure_logging, get_logger
 # Ensure log directory exists
 os.makedirs(settings.log_dir, exist_ok=True)
 
-configure_logging(settings.log_level)
+configure_logging(
+    settings.log_level,
+    buffer_size=settings.log_buffer_size,
+    syslog_address=settings.log_syslog_address,
+)
 logger = get_logger(__name__)
 
 # Create FastAPI app
@@ -49,6 +56,19 @@ app.include_router(llm_router, prefix="/api/v1")
 register_exception_handlers(app)
 
 
+@app.on_event("shutdown")
+async def close_llm_clients():
+    """Close pooled LLM provider connections."""
+    await ProviderFactory.close_all()
+    await close_anthropic_clients()
+
+
+@app.on_event("shutdown")
+async def close_mcp_sessions():
+    """Close pooled external MCP server connections."""
+    await close_shared_sessions()
+
+
 @app.get("/", include_in_schema=False)
 async def root():
     """Root endpoint."""
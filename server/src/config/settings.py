@@ -61,6 +61,31 @@ class Settings(BaseSettings):
         env="PDF_PARSING_MODEL_OPENAI",
         description="Fast OpenAI model for PDF parsing"
     )
+    pdf_llm_cache_size: int = Field(
+        default=256,
+        env="PDF_LLM_CACHE_SIZE",
+        description="Max cached LLM resume parses keyed by text hash and model (0 disables)"
+    )
+    pdf_llm_cache_ttl: int = Field(
+        default=604800,
+        env="PDF_LLM_CACHE_TTL",
+        description="Seconds a cached LLM resume parse stays valid"
+    )
+    pdf_llm_cache_backend: str = Field(
+        default="memory",
+        env="PDF_LLM_CACHE_BACKEND",
+        description="Where cached LLM resume parses are stored: memory or redis"
+    )
+    llm_use_batch_api: bool = Field(
+        default=False,
+        env="LLM_USE_BATCH_API",
+        description="Send bulk resume parsing jobs through the provider Batch API"
+    )
+    llm_batch_min_items: int = Field(
+        default=16,
+        env="LLM_BATCH_MIN_ITEMS",
+        description="Smallest bulk job that uses the Batch API; smaller jobs parse synchronously"
+    )
 
     # Agentic framework settings
     agentic_max_retries: int = Field(default=3, env="AGENTIC_MAX_RETRIES")
@@ -76,6 +101,16 @@ class Settings(BaseSettings):
     log_level: str = Field(default="DEBUG", env="LOG_LEVEL")
     log_format: str = Field(default="json", env="LOG_FORMAT")
     log_dir: str = Field(default="logs", env="LOG_DIR")
+    log_buffer_size: int = Field(
+        default=0,
+        env="LOG_BUFFER_SIZE",
+        description="Buffer this many records before writing to stdout (0 writes each record immediately)"
+    )
+    log_syslog_address: Optional[str] = Field(
+        default=None,
+        env="LOG_SYSLOG_ADDRESS",
+        description="Send logs to syslog at this UNIX socket path (e.g. /dev/log) instead of stdout"
+    )
     
     # Verbose logging controls
     log_plugin_details: bool = Field(
@@ -125,6 +160,18 @@ class Settings(BaseSettings):
         description="URL of external LinkedIn MCP server (for Docker deployments)"
     )
 
+    # External MCP servers
+    mcp_session_cache_ttl: int = Field(
+        default=300,
+        env="MCP_SESSION_CACHE_TTL",
+        description="Seconds an MCP session ID is reused before a new handshake (0 disables)"
+    )
+    mcp_tools_cache_ttl: int = Field(
+        default=600,
+        env="MCP_TOOLS_CACHE_TTL",
+        description="Seconds a server's tool list is cached (0 disables)"
+    )
+
     # Docker/deployment specific
     docker_env: bool = Field(default=False, env="DOCKER_ENV")
 
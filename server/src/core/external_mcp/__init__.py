@@ -1,6 +1,6 @@
 """External MCP integration components."""
 
-from .external_mcp_client import ExternalMCPClient
+from .external_mcp_client import ExternalMCPClient, invalidate_tools_cache
 from .external_mcp_process import ExternalMCPProcess
 from .external_mcp_models import MCPToolCall, MCPToolResponse
 
@@ -9,4 +9,5 @@ __all__ = [
     "ExternalMCPProcess",
     "MCPToolCall",
     "MCPToolResponse",
+    "invalidate_tools_cache",
 ]
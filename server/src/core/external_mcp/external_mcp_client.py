@@ -6,24 +6,36 @@ running in streamable-http mode, translating between our plugin interface and MC
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import copy
+import itertools
+import logging
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 import aiohttp
+import orjson
+import xxhash
 from src.utils.logging import get_structured_logger
 
 from .external_mcp_models import MCPToolResponse
-from ..protocol.sse_parser import SSEParser, SSEParseError
+from ..protocol.sse_parser import IncrementalSSEParser, SSEParser, SSEParseError
 from ..protocol.mcp_constants import (
     MCP_PROTOCOL_VERSION,
     MCP_CLIENT_NAME,
     MCP_CLIENT_VERSION,
     DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_MAX_RETRIES,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_CAP,
     HEALTHY_STATUS_CODES,
     SUCCESS_STATUS_CODES,
     MCP_BASE_ENDPOINT,
     MCPMethod,
     MCPHeaders,
     CONTENT_TYPE_JSON,
+    ACCEPT_SSE,
     ACCEPT_EVENT_STREAM,
     JSONRPC_VERSION,
     DEFAULT_REQUEST_ID,
@@ -34,6 +46,159 @@ from ..exceptions import MCPProtocolError
 
 logger = get_structured_logger(__name__)
 
+# HTTP sessions shared by every client of the same server and timeout, so
+# connections to the server are pooled and kept alive across clients
+_SHARED_SESSIONS: Dict[Tuple[str, int], aiohttp.ClientSession] = {}
+
+
+def _get_shared_session(server_url: str, timeout: int) -> aiohttp.ClientSession:
+    """Get the shared HTTP session for a server, creating it on first use.
+    
+    Args:
+        server_url: Base URL of the MCP server
+        timeout: Request timeout in seconds
+        
+    Returns:
+        aiohttp.ClientSession: Open session for the server
+    """
+    key = (server_url, timeout)
+    session = _SHARED_SESSIONS.get(key)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=256,
+            limit_per_host=64,
+            keepalive_timeout=75,
+            ttl_dns_cache=300
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            # A bounded connect phase so an unreachable server fails fast
+            # instead of using the whole request budget
+            timeout=aiohttp.ClientTimeout(
+                total=timeout,
+                connect=min(DEFAULT_CONNECT_TIMEOUT, timeout)
+            )
+        )
+        _SHARED_SESSIONS[key] = session
+    return session
+
+
+# Session IDs from completed handshakes: server_url -> (session_id, expires_at)
+_MCP_SESSION_CACHE: Dict[str, Tuple[Optional[str], float]] = {}
+
+# Tool lists by server: server_url -> (tools, expires_at)
+_TOOLS_CACHE: Dict[str, Tuple[List[Dict[str, Any]], float]] = {}
+
+# JSON-RPC request IDs, unique per process so a response can never be
+# mistaken for the reply to another request in the same MCP session
+_REQUEST_IDS = itertools.count(DEFAULT_REQUEST_ID)
+
+# Tool responses kept per client when callers opt in with cache_ttl
+MAX_CACHED_TOOL_RESPONSES = 256
+
+# Request headers that never change; aiohttp copies headers per request, so
+# these can be passed as-is
+_INITIALIZE_HEADERS: Dict[str, str] = {
+    MCPHeaders.ACCEPT.value: ACCEPT_SSE,
+    MCPHeaders.CONTENT_TYPE.value: CONTENT_TYPE_JSON
+}
+_HEALTH_CHECK_HEADERS: Dict[str, str] = {
+    MCPHeaders.ACCEPT.value: ACCEPT_EVENT_STREAM,
+    MCPHeaders.CONTENT_TYPE.value: CONTENT_TYPE_JSON
+}
+
+# Status a streamable-http server returns for a session ID it does not know
+SESSION_NOT_FOUND_STATUS = 404
+
+
+def _compute_backoff(
+    attempt: int,
+    base: float = RETRY_BACKOFF_BASE,
+    cap: float = RETRY_BACKOFF_CAP
+) -> float:
+    """Get the delay before retrying after a failed attempt.
+    
+    Exponential backoff with equal jitter: the delay is drawn from the
+    upper half of the exponential step, so clients that failed together
+    do not all retry at the same moment.
+    
+    Args:
+        attempt: Zero-based index of the attempt that failed
+        base: Delay step for the first retry, in seconds
+        cap: Maximum delay, in seconds
+        
+    Returns:
+        float: Delay in seconds
+    """
+    delay = min(cap, base * (2 ** attempt))
+    return random.uniform(delay / 2, delay)
+
+
+def _decode_mcp_message(data: bytes) -> Optional[Dict[str, Any]]:
+    """Decode an SSE data payload if it is a JSON-RPC response."""
+    try:
+        message = orjson.loads(data)
+    except ValueError:
+        logger.warning("Failed to parse SSE data as JSON", data=data[:200])
+        return None
+    if isinstance(message, dict) and ("result" in message or "error" in message):
+        return message
+    # Server notifications (e.g. progress) can precede the response
+    return None
+
+
+async def _read_mcp_message(response: aiohttp.ClientResponse) -> Dict[str, Any]:
+    """Read the JSON-RPC response from an MCP HTTP response.
+    
+    SSE bodies are parsed as chunks arrive and reading stops at the first
+    event carrying the response, instead of buffering the whole stream.
+    
+    Args:
+        response: Response to a JSON-RPC request
+        
+    Returns:
+        Dict[str, Any]: JSON-RPC response message
+        
+    Raises:
+        SSEParseError: If the body holds no JSON-RPC response
+    """
+    if response.content_type == CONTENT_TYPE_JSON:
+        message = _decode_mcp_message(await response.read())
+        if message is None:
+            raise SSEParseError("No MCP response in JSON body")
+        return message
+    
+    parser = IncrementalSSEParser()
+    async for chunk in response.content.iter_any():
+        for _, data in parser.feed(chunk):
+            message = _decode_mcp_message(data)
+            if message is not None:
+                return message
+    event = parser.close()
+    if event:
+        message = _decode_mcp_message(event[1])
+        if message is not None:
+            return message
+    raise SSEParseError("No MCP response found in SSE stream")
+
+
+def invalidate_tools_cache(server_url: str) -> None:
+    """Drop the cached tool list of a server so the next list_tools fetches it.
+    
+    Args:
+        server_url: Base URL of the MCP server
+    """
+    _TOOLS_CACHE.pop(server_url.rstrip('/'), None)
+
+
+async def close_shared_sessions() -> None:
+    """Close the shared HTTP sessions of all MCP clients (at app shutdown)."""
+    sessions = list(_SHARED_SESSIONS.values())
+    _SHARED_SESSIONS.clear()
+    for session in sessions:
+        if not session.closed:
+            await session.close()
+
 
 class ExternalMCPClient:
     """HTTP client for communicating with external MCP servers."""
@@ -55,43 +220,80 @@ class ExternalMCPClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.session: Optional[aiohttp.ClientSession] = None
-        self.session_id: Optional[str] = None
+        # LinkedIn MCP server uses /mcp/ endpoint with trailing slash
+        self._endpoint = f"{self.server_url}/mcp/"
+        self._health_check_url = f"{self.server_url}/mcp{MCP_BASE_ENDPOINT}"
+        # Headers for requests within the session, kept in sync by session_id
+        self._headers: Dict[str, str] = dict(_INITIALIZE_HEADERS)
+        self.session_id = None
         self.initialized: bool = False
-        
+        # Initialized notification still in flight after a handshake
+        self._notification_task: Optional[asyncio.Task] = None
+        # Responses of deterministic tool calls: key -> (response, expires_at)
+        self._response_cache: "OrderedDict[str, Tuple[MCPToolResponse, float]]" = OrderedDict()
+        
+    @property
+    def session_id(self) -> Optional[str]:
+        """MCP session ID assigned by the server, if any."""
+        return self._session_id
+    
+    @session_id.setter
+    def session_id(self, session_id: Optional[str]) -> None:
+        self._session_id = session_id
+        if session_id:
+            self._headers[MCPHeaders.SESSION_ID.value] = session_id
+        else:
+            self._headers.pop(MCPHeaders.SESSION_ID.value, None)
+    
     async def __aenter__(self) -> "ExternalMCPClient":
-        """Enter async context manager and create HTTP session.
+        """Enter async context manager and attach the shared HTTP session.
         
         Returns:
             Self for use in async with statement.
         """
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout)
-        )
+        self.session = _get_shared_session(self.server_url, self.timeout)
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit async context manager and cleanup resources.
         
+        The shared HTTP session stays open for other clients; it is closed
+        by close_shared_sessions.
+        
         Args:
             exc_type: Exception type if an exception occurred.
             exc_val: Exception value if an exception occurred.
             exc_tb: Exception traceback if an exception occurred.
         """
-        if self.session:
-            await self.session.close()
+        self._cancel_notification()
+        self.session = None
             
-    async def initialize_session(self) -> None:
+    async def initialize_session(self, refresh: bool = False) -> None:
         """Initialize MCP session with the external server.
         
         This method performs the MCP handshake:
         1. Gets a session ID from the server
         2. Sends the initialize request
-        3. Sends the initialized notification
+        3. Sends the initialized notification (completed in the background
+           and awaited before the first request)
+        
+        Does nothing if this client already has a session (including one
+        whose notification is still in flight). Otherwise a session from a
+        recent handshake with the same server is reused, for up to
+        settings.mcp_session_cache_ttl seconds.
+        
+        Args:
+            refresh: Always perform the handshake, e.g. after the server
+                was restarted and cached session IDs are no longer valid.
         
         Raises:
             MCPSessionError: If session initialization fails.
             MCPProtocolError: If protocol communication fails.
         """
+        if refresh:
+            _MCP_SESSION_CACHE.pop(self.server_url, None)
+        elif self.initialized:
+            return
         await self._initialize_mcp_session()
     
 
@@ -104,7 +306,7 @@ class ExternalMCPClient:
         """
         return {
             "jsonrpc": JSONRPC_VERSION,
-            "id": DEFAULT_REQUEST_ID,
+            "id": next(_REQUEST_IDS),
             "method": MCPMethod.INITIALIZE,
             "params": {
                 "protocolVersion": MCP_PROTOCOL_VERSION,
@@ -125,19 +327,16 @@ class ExternalMCPClient:
         Raises:
             Exception: If initialization fails
         """
-        headers = {
-            MCPHeaders.ACCEPT.value: "application/json, text/event-stream"
-        }
         # Don't include session ID in initialize request headers
-        # Don't set Content-Type manually - aiohttp will set it when using json parameter
+        headers = _INITIALIZE_HEADERS
+        endpoint = self._endpoint
         
-        # LinkedIn MCP server uses /mcp/ endpoint with trailing slash
-        endpoint = f"{self.server_url}/mcp/"
-        
-        # Log request details for debugging
+        # Log request details for debugging; the header and body dumps
+        # are only built when the record would actually be emitted
         from src.config.settings import settings
-        if settings.log_http_details:
-            logger.info(
+        log_details = settings.log_http_details and logger.isEnabledFor(logging.DEBUG)
+        if log_details:
+            logger.debug(
                 "Sending initialize request",
                 endpoint=endpoint,
                 headers=headers,
@@ -151,13 +350,12 @@ class ExternalMCPClient:
         
         async with self.session.post(
             endpoint,
-            json=init_request,
+            data=orjson.dumps(init_request),
             headers=headers
         ) as response:
             # Log response details
-            from src.config.settings import settings
-            if settings.log_http_details:
-                logger.info(
+            if log_details:
+                logger.debug(
                     "Received response",
                     status=response.status,
                     response_headers=dict(response.headers),
@@ -177,20 +375,20 @@ class ExternalMCPClient:
                     logger.debug("Got session ID from initialize response", session_id=session_id)
                 
                 # Read and parse SSE response
-                text = await response.text()
                 try:
-                    success, result, error_msg = SSEParser.parse_mcp_result(text)
-                    if not success:
-                        raise MCPProtocolError(
-                            MCPMethod.INITIALIZE,
-                            f"MCP initialization error: {error_msg}",
-                            result
-                        )
+                    message = await _read_mcp_message(response)
                 except SSEParseError as e:
                     raise MCPProtocolError(
                         MCPMethod.INITIALIZE,
                         f"Failed to parse MCP response: {e}",
-                        {"raw_data": text}
+                        {"status": response.status}
+                    )
+                success, result, error_msg = SSEParser.parse_mcp_message(message)
+                if not success:
+                    raise MCPProtocolError(
+                        MCPMethod.INITIALIZE,
+                        f"MCP initialization error: {error_msg}",
+                        result
                     )
             else:
                 raise MCPProtocolError(
@@ -205,20 +403,121 @@ class ExternalMCPClient:
         This internal method orchestrates the session initialization:
         1. Builds and sends the initialize request
         2. Retrieves session ID from the initialize response
-        3. Sends the initialized notification to complete handshake
+        3. Starts sending the initialized notification to complete handshake
         
-        The session is marked as initialized only after all steps succeed.
+        The notification is sent in the background so that work between the
+        handshake and the first RPC overlaps its round trip; _post_rpc waits
+        for it before sending, since servers reject requests that arrive
+        before the notification. A cached session for the server skips the
+        handshake.
         """
+        cached = _MCP_SESSION_CACHE.get(self.server_url)
+        if cached and cached[1] > time.monotonic():
+            self.session_id = cached[0]
+            self.initialized = True
+            logger.debug("Reusing cached MCP session", session_id=self.session_id)
+            return
+        
         logger.debug("Starting MCP session initialization")
         
         init_request = self._build_initialize_request()
         await self._send_initialize_request(init_request)
         
+        self._cancel_notification()
+        self._notification_task = asyncio.create_task(self._complete_handshake())
+        self.initialized = True
+    
+    async def _complete_handshake(self) -> None:
+        """Send the initialized notification and cache the new session.
+        
+        The session is cached only once the server has accepted the
+        notification, so other clients never reuse a half-open session.
+        """
+        from src.config.settings import settings
+        
         await self._send_initialized_notification()
         
-        self.initialized = True
+        if settings.mcp_session_cache_ttl > 0:
+            _MCP_SESSION_CACHE[self.server_url] = (
+                self.session_id,
+                time.monotonic() + settings.mcp_session_cache_ttl
+            )
         logger.debug("MCP session initialized successfully", session_id=self.session_id)
     
+    async def _await_handshake(self) -> None:
+        """Wait for the initialized notification of the last handshake.
+        
+        The task stays in place until it has finished, so every request
+        sent meanwhile (from any coroutine sharing this client) waits for
+        it too. It is shielded so a cancelled caller does not cancel the
+        notification for the others.
+        
+        Raises:
+            MCPProtocolError: If the server rejected the notification; the
+                session is then marked as not initialized.
+        """
+        task = self._notification_task
+        try:
+            await asyncio.shield(task)
+        except Exception:
+            if self._notification_task is task:
+                self._notification_task = None
+                self.initialized = False
+            raise
+        if self._notification_task is task:
+            self._notification_task = None
+    
+    def _cancel_notification(self) -> None:
+        """Cancel an initialized notification that is still in flight."""
+        task, self._notification_task = self._notification_task, None
+        if task is not None and not task.done():
+            task.cancel()
+    
+    async def _renew_session(self) -> None:
+        """Drop the cached session and perform a new handshake."""
+        logger.info("MCP session not found on server, re-initializing", server_url=self.server_url)
+        _MCP_SESSION_CACHE.pop(self.server_url, None)
+        self.session_id = None
+        self.initialized = False
+        await self._initialize_mcp_session()
+    
+    async def _post_rpc(self, request_data: Dict[str, Any]) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Send a JSON-RPC request within the MCP session.
+        
+        Waits for a pending initialized notification first, and redoes the
+        handshake if an earlier notification failed. If the server no
+        longer knows the session ID (e.g. it restarted while the ID was
+        cached), the handshake is redone once and the request resent.
+        
+        Args:
+            request_data: JSON-RPC request
+            
+        Returns:
+            Tuple[int, Optional[Dict[str, Any]]]: HTTP status, and the
+            JSON-RPC response for status 200
+            
+        Raises:
+            SSEParseError: If a 200 response holds no JSON-RPC response
+            MCPProtocolError: If the handshake fails
+        """
+        if not self.initialized:
+            await self._initialize_mcp_session()
+        renewed = False
+        while True:
+            if self._notification_task is not None:
+                await self._await_handshake()
+            async with self.session.post(
+                self._endpoint,
+                data=orjson.dumps(request_data),
+                headers=self._build_mcp_headers()
+            ) as response:
+                if response.status == 200:
+                    return response.status, await _read_mcp_message(response)
+                if response.status != SESSION_NOT_FOUND_STATUS or renewed or not self.session_id:
+                    return response.status, None
+            await self._renew_session()
+            renewed = True
+    
     async def _send_initialized_notification(self) -> None:
         """Send the initialized notification to complete MCP handshake.
         
@@ -234,20 +533,10 @@ class ExternalMCPClient:
             "method": MCPMethod.INITIALIZED
         }
         
-        headers = {
-            MCPHeaders.ACCEPT.value: "application/json, text/event-stream"
-        }
-        
-        # Include session ID if we have one
-        if self.session_id:
-            headers[MCPHeaders.SESSION_ID.value] = self.session_id
-        
-        # LinkedIn MCP server uses /mcp/ endpoint with trailing slash
-        endpoint = f"{self.server_url}/mcp/"
         async with self.session.post(
-            endpoint,
-            json=notification,
-            headers=headers
+            self._endpoint,
+            data=orjson.dumps(notification),
+            headers=self._build_mcp_headers()
         ) as response:
             # Accept both 200 and 202 (Accepted) as success for notifications
             # MCP spec allows async processing of notifications
@@ -265,27 +554,12 @@ class ExternalMCPClient:
             bool: True if server is responding, False otherwise
         """
         try:
-            # Create a temporary session if we don't have one
-            if not self.session:
-                async with aiohttp.ClientSession() as temp_session:
-                    async with temp_session.get(
-                        f"{self.server_url}/mcp{MCP_BASE_ENDPOINT}",
-                        headers={
-                            MCPHeaders.ACCEPT.value: ACCEPT_EVENT_STREAM,
-                            MCPHeaders.CONTENT_TYPE.value: CONTENT_TYPE_JSON
-                        }
-                    ) as response:
-                        return response.status in HEALTHY_STATUS_CODES
-            else:
-                # Use existing session
-                async with self.session.get(
-                    f"{self.server_url}/mcp{MCP_BASE_ENDPOINT}",
-                    headers={
-                        MCPHeaders.ACCEPT.value: ACCEPT_EVENT_STREAM,
-                        MCPHeaders.CONTENT_TYPE.value: CONTENT_TYPE_JSON
-                    }
-                ) as response:
-                    return response.status in HEALTHY_STATUS_CODES
+            self.session = _get_shared_session(self.server_url, self.timeout)
+            async with self.session.get(
+                self._health_check_url,
+                headers=_HEALTH_CHECK_HEADERS
+            ) as response:
+                return response.status in HEALTHY_STATUS_CODES
         except Exception as e:
             logger.warning("Health check failed", error=str(e))
             return False
@@ -293,57 +567,58 @@ class ExternalMCPClient:
     async def list_tools(self) -> List[Dict[str, Any]]:
         """Get list of available tools from the external MCP server.
         
+        Tool lists only change when the server is redeployed, so a fetched
+        list is served from cache for settings.mcp_tools_cache_ttl seconds.
+        
         Returns:
-            List[Dict[str, Any]]: List of available tools
+            List[Dict[str, Any]]: List of available tools (shared with the
+            cache; do not modify)
         """
+        from src.config.settings import settings
+        
+        cached = _TOOLS_CACHE.get(self.server_url)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        
         await self.initialize_session()
         
         # MCP protocol for listing tools
         request_data = {
             "jsonrpc": JSONRPC_VERSION,
-            "id": DEFAULT_REQUEST_ID,
+            "id": next(_REQUEST_IDS),
             "method": MCPMethod.LIST_TOOLS,
             "params": {}
         }
         
         for attempt in range(self.max_retries):
             try:
-                # Use the MCP endpoint for FastMCP servers - /mcp/ with trailing slash
-                headers = {
-                    MCPHeaders.ACCEPT.value: "application/json, text/event-stream"
-                }
-                if self.session_id:
-                    headers[MCPHeaders.SESSION_ID.value] = self.session_id
-                    
-                # Don't set Content-Type manually when using json parameter
-                # aiohttp will set it automatically
-                async with self.session.post(
-                    f"{self.server_url}/mcp/",
-                    json=request_data,
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        # Parse SSE response
-                        text = await response.text()
-                        try:
-                            success, result, error_msg = SSEParser.parse_mcp_result(text)
-                            if success and isinstance(result, dict) and "tools" in result:
-                                return result["tools"]
-                            elif not success:
-                                logger.error("MCP error listing tools", error=error_msg)
-                                return []
-                            else:
-                                logger.warning("Unexpected response format", result=result)
-                                return []
-                        except SSEParseError as e:
-                            logger.warning("Failed to parse SSE response", error=str(e), text=text[:200])
-                            return []
+                try:
+                    status, message = await self._post_rpc(request_data)
+                except SSEParseError as e:
+                    logger.warning("Failed to parse SSE response", error=str(e))
+                    return []
+                if status == 200:
+                    success, result, error_msg = SSEParser.parse_mcp_message(message)
+                    if success and isinstance(result, dict) and "tools" in result:
+                        tools = result["tools"]
+                        if settings.mcp_tools_cache_ttl > 0:
+                            _TOOLS_CACHE[self.server_url] = (
+                                tools,
+                                time.monotonic() + settings.mcp_tools_cache_ttl
+                            )
+                        return tools
+                    elif not success:
+                        logger.error("MCP error listing tools", error=error_msg)
+                        return []
                     else:
-                        logger.warning(
-                            "Failed to list tools",
-                            status=response.status,
-                            attempt=attempt + 1
-                        )
+                        logger.warning("Unexpected response format", result=result)
+                        return []
+                else:
+                    logger.warning(
+                        "Failed to list tools",
+                        status=status,
+                        attempt=attempt + 1
+                    )
             except Exception as e:
                 logger.warning(
                     "Error listing tools",
@@ -352,8 +627,7 @@ class ExternalMCPClient:
                 )
                 
             if attempt < self.max_retries - 1:
-                # Exponential backoff
-                retry_delay = min(2 ** (attempt - 1), 60)
+                retry_delay = _compute_backoff(attempt)
                 logger.debug("Retrying after delay", delay_seconds=retry_delay)
                 await asyncio.sleep(retry_delay)
                 
@@ -371,7 +645,7 @@ class ExternalMCPClient:
         """
         return {
             "jsonrpc": JSONRPC_VERSION,
-            "id": DEFAULT_REQUEST_ID,
+            "id": next(_REQUEST_IDS),
             "method": MCPMethod.CALL_TOOL,
             "params": {
                 "name": tool_name,
@@ -380,17 +654,15 @@ class ExternalMCPClient:
         }
     
     def _build_mcp_headers(self) -> Dict[str, str]:
-        """Build standard MCP request headers.
+        """Get the standard MCP request headers.
+        
+        The dict is shared across requests and updated when the session ID
+        changes, so callers must not modify it.
         
         Returns:
-            Dict[str, str]: Request headers
+            Dict[str, str]: Request headers, including the session ID if any
         """
-        headers = {
-            MCPHeaders.ACCEPT.value: "application/json, text/event-stream"
-        }
-        if self.session_id:
-            headers[MCPHeaders.SESSION_ID.value] = self.session_id
-        return headers
+        return self._headers
     
     async def _execute_tool_call(
         self,
@@ -403,7 +675,7 @@ class ExternalMCPClient:
         Args:
             tool_name: Name of the tool
             request_data: Request data
-            attempt: Current attempt number
+            attempt: Current attempt number, 0-based
             
         Returns:
             Optional[MCPToolResponse]: Tool response if successful, None if retry needed
@@ -412,72 +684,87 @@ class ExternalMCPClient:
             "Calling external MCP tool",
             tool=tool_name,
             arguments=request_data["params"]["arguments"],
-            attempt=attempt + 1
+            attempt=attempt + 1,
+            max_attempts=self.max_retries
         )
         
-        headers = self._build_mcp_headers()
-        
-        # LinkedIn MCP server uses /mcp/ endpoint with trailing slash
-        endpoint = f"{self.server_url}/mcp/"
-        async with self.session.post(
-            endpoint,
-            json=request_data,
-            headers=headers
-        ) as response:
+        try:
+            status, message = await self._post_rpc(request_data)
+        except SSEParseError as e:
+            logger.warning("Failed to parse tool response", error=str(e), tool=tool_name)
+            # Return None to trigger retry
+            return None
+        
+        if status == 200:
+            success, result, error_msg = SSEParser.parse_mcp_message(message)
             
-            if response.status == 200:
-                # Parse SSE response
-                text = await response.text()
-                try:
-                    success, result, error_msg = SSEParser.parse_mcp_result(text)
-                    
-                    if success:
-                        # Successful response
-                        content = result.get("content", []) if isinstance(result, dict) else []
-                        
-                        return MCPToolResponse(
-                            content=content,
-                            isError=False
-                        )
-                    else:
-                        # Error response
-                        logger.error(
-                            "MCP tool call error",
-                            tool=tool_name,
-                            error=error_msg
-                        )
-                        return MCPToolResponse(
-                            content=[{
-                                "type": "text",
-                                "text": f"Error: {error_msg}"
-                            }],
-                            isError=True
-                        )
-                except SSEParseError as e:
-                    logger.warning("Failed to parse tool response", error=str(e), tool=tool_name)
-                    # Return None to trigger retry
-                    return None
-                    
+            if success:
+                # Successful response
+                content = result.get("content", []) if isinstance(result, dict) else []
+                
+                return MCPToolResponse(
+                    content=content,
+                    isError=False
+                )
             else:
-                logger.warning(
-                    "HTTP error calling tool",
+                # Error response
+                logger.error(
+                    "MCP tool call error",
                     tool=tool_name,
-                    status=response.status,
-                    attempt=attempt + 1
+                    error=error_msg
                 )
-                return None
+                return MCPToolResponse(
+                    content=[{
+                        "type": "text",
+                        "text": f"Error: {error_msg}"
+                    }],
+                    isError=True
+                )
+                
+        else:
+            logger.warning(
+                "HTTP error calling tool",
+                tool=tool_name,
+                status=status,
+                attempt=attempt + 1
+            )
+            return None
+    
+    @staticmethod
+    def _response_cache_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+        """Build the response cache key for a tool call.
+        
+        Arguments are serialized with sorted keys so equal dicts give equal
+        keys regardless of insertion order.
+        
+        Args:
+            tool_name: Name of the tool
+            arguments: Tool arguments
+            
+        Returns:
+            str: Hex XXH3-128 digest of the tool name and arguments
+        """
+        payload = orjson.dumps(
+            {"arguments": arguments, "tool": tool_name},
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        return xxhash.xxh3_128_hexdigest(payload)
     
     async def call_tool(
         self,
         tool_name: str,
         arguments: Dict[str, Any],
-        tracker: Optional[Any] = None  # PerformanceTracker from utils.timing
+        tracker: Optional[Any] = None,  # PerformanceTracker from utils.timing
+        cache_ttl: Optional[float] = None
     ) -> MCPToolResponse:
         """Call a tool on the external MCP server.
         
         Args:
             tool_name: Name of the tool to call
             arguments: Tool arguments
+            cache_ttl: Seconds to reuse a successful response for identical
+                arguments. Only for deterministic tools; None or 0 always
+                calls the server.
             
         Returns:
             Tool response with success status and result
@@ -487,6 +774,17 @@ class ExternalMCPClient:
             MCPConnectionError: If connection fails
             MCPProtocolError: If protocol error occurs
         """
+        cache_key = None
+        if cache_ttl:
+            cache_key = self._response_cache_key(tool_name, arguments)
+            cached = self._response_cache.get(cache_key)
+            if cached:
+                if cached[1] > time.monotonic():
+                    self._response_cache.move_to_end(cache_key)
+                    # Callers own their response; the cached one stays untouched
+                    return copy.deepcopy(cached[0])
+                del self._response_cache[cache_key]
+        
         if not self.initialized:
             if tracker:
                 init_start = tracker.record_phase_start("mcp_init")
@@ -496,51 +794,49 @@ class ExternalMCPClient:
             
         request_data = self._build_tool_request(tool_name, arguments)
         
-        # Try calling the tool with retries
-        for attempt in range(1, self.max_retries + 1):
-            logger.debug(
-                "Calling external MCP tool",
-                tool=tool_name,
-                attempt=attempt,
-                max_attempts=self.max_retries
-            )
-            
-            if tracker and attempt == 1:
+        # Try calling the tool with retries (attempt is 0-based)
+        for attempt in range(self.max_retries):
+            if tracker and attempt == 0:
                 # Only track timing for the first attempt
                 network_start = tracker.record_phase_start("mcp_network")
             
             result = await self._execute_tool_call(tool_name, request_data, attempt)
             
-            if tracker and attempt == 1 and result is not None:
+            if tracker and attempt == 0 and result is not None:
                 tracker.record_phase_end("mcp_network", network_start)
             
             if result is not None:
+                if cache_key and not result.isError:
+                    self._response_cache[cache_key] = (copy.deepcopy(result), time.monotonic() + cache_ttl)
+                    while len(self._response_cache) > MAX_CACHED_TOOL_RESPONSES:
+                        self._response_cache.popitem(last=False)
                 return result
                 
-            if attempt < self.max_retries:
-                # Exponential backoff
-                retry_delay = min(2 ** (attempt - 1), 60)
+            if attempt < self.max_retries - 1:
+                retry_delay = _compute_backoff(attempt)
                 logger.debug("Retrying after delay", delay_seconds=retry_delay)
                 await asyncio.sleep(retry_delay)
         
         # All attempts failed
         return MCPToolResponse(
-            success=False,
-            error=f"Failed to call tool '{tool_name}' after {self.max_retries} attempts",
-            result=None
+            content=[{
+                "type": "text",
+                "text": f"Failed to call tool '{tool_name}' after {self.max_retries} attempts"
+            }],
+            isError=True
         )
     
     async def close(self) -> None:
         """Close the MCP client and cleanup resources.
         
         This method should be called when done with the client to:
-        - Close the HTTP session
+        - Release the shared HTTP session (left open for other clients)
         - Release any held resources
         - Mark the session as not initialized
         
         Safe to call multiple times.
         """
-        if self.session and not self.session.closed:
-            await self.session.close()
+        self._cancel_notification()
+        self.session = None
         self.initialized = False
         logger.info("MCP client closed") 
\ No newline at end of file
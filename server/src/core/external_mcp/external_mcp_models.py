@@ -2,20 +2,23 @@
 Data models for External MCP communication.
 
 This module contains the data structures used for communication
-with external MCP servers.
+with external MCP servers. They only carry data the client has already
+parsed, so they are plain slots dataclasses rather than validating models.
 """
 
+from dataclasses import dataclass
 from typing import Any, Dict, List
-from pydantic import BaseModel
 
 
-class MCPToolCall(BaseModel):
+@dataclass(slots=True)
+class MCPToolCall:
     """Represents an MCP tool call request."""
     name: str
     arguments: Dict[str, Any]
 
 
-class MCPToolResponse(BaseModel):
+@dataclass(slots=True)
+class MCPToolResponse:
     """Represents an MCP tool call response."""
     content: List[Dict[str, Any]]
-    isError: bool = False 
\ No newline at end of file
+    isError: bool = False
@@ -2,7 +2,7 @@
 Anthropic (Claude) LLM Provider implementation.
 """
 
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Tuple, Union
 from src.utils.logging import get_structured_logger
 from anthropic import AsyncAnthropic
 
@@ -11,6 +11,62 @@ from src.utils.logging import get_structured_logger
 
 logger = get_structured_logger(__name__)
 
+# AsyncAnthropic clients by (api_key, base_url); each holds its own
+# connection pool, so providers with the same credentials share one
+_CLIENT_CACHE: Dict[Tuple[str, Optional[str]], AsyncAnthropic] = {}
+
+
+def _get_client(api_key: str, base_url: Optional[str] = None) -> AsyncAnthropic:
+    """Get the shared Anthropic client for the given credentials.
+    
+    Args:
+        api_key: Anthropic API key
+        base_url: Optional API base URL override
+        
+    Returns:
+        AsyncAnthropic: Cached client, created on first use
+    """
+    key = (api_key, base_url)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client_kwargs = {"api_key": api_key}
+        if base_url:
+            client_kwargs["base_url"] = base_url
+        client = _CLIENT_CACHE[key] = AsyncAnthropic(**client_kwargs)
+    return client
+
+
+async def close_all_clients() -> None:
+    """Close all shared Anthropic clients (at app shutdown)."""
+    clients = list(_CLIENT_CACHE.values())
+    _CLIENT_CACHE.clear()
+    for client in clients:
+        await client.close()
+
+
+def _split_system(messages: List[Dict[str, str]]) -> Tuple[Optional[str], List[Dict[str, str]]]:
+    """Separate system messages from the conversation.
+    
+    Anthropic takes the system prompt as a separate parameter and only one
+    of it, so multiple system messages are joined instead of keeping just
+    the last one.
+    
+    Args:
+        messages: Normalized messages
+        
+    Returns:
+        Tuple of the joined system prompt (None if there is none) and the
+        remaining messages
+    """
+    systems = []
+    conversation = []
+    for msg in messages:
+        if msg["role"] == "system":
+            systems.append(msg["content"])
+        else:
+            conversation.append(msg)
+    return ("\n\n".join(systems) if systems else None), conversation
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude API provider implementation."""
@@ -24,10 +80,7 @@ class AnthropicProvider(LLMProvider):
             **kwargs: Additional configuration
         """
         super().__init__(api_key, model, **kwargs)
-        client_kwargs = {"api_key": api_key}
-        if kwargs.get("base_url"):
-            client_kwargs["base_url"] = kwargs["base_url"]
-        self.client = AsyncAnthropic(**client_kwargs)
+        self.client = _get_client(api_key, kwargs.get("base_url") or None)
         # Default max tokens for Claude
         self.default_max_tokens = kwargs.get("default_max_tokens", 4096)
     
@@ -53,15 +106,7 @@ class AnthropicProvider(LLMProvider):
             normalized_messages = self._normalize_messages(messages)
             
             # Anthropic requires system message to be separate
-            system_message = None
-            user_messages = []
-            
-            for msg in normalized_messages:
-                if msg["role"] == "system":
-                    # Anthropic only supports one system message
-                    system_message = msg["content"]
-                else:
-                    user_messages.append(msg)
+            system_message, user_messages = _split_system(normalized_messages)
             
             # Build request parameters
             params = {
@@ -124,14 +169,7 @@ class AnthropicProvider(LLMProvider):
             normalized_messages = self._normalize_messages(messages)
             
             # Anthropic requires system message to be separate
-            system_message = None
-            user_messages = []
-            
-            for msg in normalized_messages:
-                if msg["role"] == "system":
-                    system_message = msg["content"]
-                else:
-                    user_messages.append(msg)
+            system_message, user_messages = _split_system(normalized_messages)
             
             # Build request parameters
             params = {
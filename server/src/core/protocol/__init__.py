@@ -8,7 +8,7 @@ from .mcp_constants import (
     DEFAULT_REQUEST_TIMEOUT,
     DEFAULT_MAX_RETRIES,
 )
-from .sse_parser import SSEParser, SSEParseError
+from .sse_parser import IncrementalSSEParser, SSEParser, SSEParseError
 
 __all__ = [
     "MCPProtocol",
@@ -18,6 +18,7 @@ __all__ = [
     "MCPHeaders",
     "DEFAULT_REQUEST_TIMEOUT",
     "DEFAULT_MAX_RETRIES",
+    "IncrementalSSEParser",
     "SSEParser",
     "SSEParseError",
 ]
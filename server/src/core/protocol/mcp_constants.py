@@ -22,6 +22,7 @@ MCP_CLIENT_VERSION: Final[str] = "1.0.0"
 DEFAULT_REQUEST_TIMEOUT: Final[int] = 30
 DEFAULT_HEALTH_CHECK_TIMEOUT: Final[int] = 5
 DEFAULT_LINKEDIN_TIMEOUT: Final[int] = 180  # 3 minutes for LinkedIn operations
+DEFAULT_CONNECT_TIMEOUT: Final[int] = 10  # Establishing a connection, within the request timeout
 DEFAULT_STARTUP_TIMEOUT: Final[int] = 30
 LINKEDIN_STARTUP_TIMEOUT: Final[int] = 60  # LinkedIn server needs more time
 
@@ -35,6 +36,8 @@ DEFAULT_MCP_HOST: Final[str] = "127.0.0.1"
 # Retry Configuration
 DEFAULT_MAX_RETRIES: Final[int] = 3
 LINKEDIN_MAX_RETRIES: Final[int] = 1  # Reduce retries for long operations
+RETRY_BACKOFF_BASE: Final[float] = 1.0  # Delay before the first retry (seconds)
+RETRY_BACKOFF_CAP: Final[float] = 60.0  # Longest delay between retries (seconds)
 
 # HTTP Status Codes
 HEALTHY_STATUS_CODES: Final[set] = {200, 400, 405, 406}
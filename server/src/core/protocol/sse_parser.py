@@ -4,12 +4,25 @@ Server-Sent Events (SSE) Parser Utility.
 This module provides utilities for parsing SSE responses from MCP servers.
 """
 
-import json
-from typing import Any, Dict, Optional, Tuple
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 from src.utils.logging import get_structured_logger
 
 logger = get_structured_logger(__name__)
 
+# Event types MCP and Anthropic streams repeat on every event, mapped from
+# their raw bytes to one shared str so parsing them allocates nothing
+_EVENT_TYPES: Dict[bytes, str] = {
+    name.encode(): sys.intern(name)
+    for name in (
+        "message", "ping", "error",
+        "message_start", "message_delta", "message_stop",
+        "content_block_start", "content_block_delta", "content_block_stop",
+    )
+}
+
 
 class SSEParseError(Exception):
     """Exception raised when SSE parsing fails."""
@@ -48,8 +61,8 @@ class SSEParser:
                 data_line = line[6:].strip()
                 if data_line:
                     try:
-                        data = json.loads(data_line)
-                    except json.JSONDecodeError as e:
+                        data = orjson.loads(data_line)
+                    except orjson.JSONDecodeError as e:
                         logger.warning(
                             "Failed to parse SSE data as JSON",
                             data=data_line,
@@ -100,19 +113,105 @@ class SSEParser:
         """
         try:
             data = SSEParser.extract_mcp_response(text)
-            
-            if "result" in data:
-                return True, data["result"], None
-            elif "error" in data:
-                error = data["error"]
-                error_msg = error.get("message", "Unknown error") if isinstance(error, dict) else str(error)
-                return False, error, error_msg
-            else:
-                logger.warning("MCP response missing result or error", data=data)
-                return False, None, "Invalid MCP response format"
-                
+            return SSEParser.parse_mcp_message(data)
         except SSEParseError as e:
             return False, None, str(e)
         except Exception as e:
             logger.error("Unexpected error parsing MCP response", error=str(e))
-            return False, None, f"Parse error: {str(e)}" 
\ No newline at end of file
+            return False, None, f"Parse error: {str(e)}" 
+    
+    @staticmethod
+    def parse_mcp_message(data: Dict[str, Any]) -> Tuple[bool, Any, Optional[str]]:
+        """Parse MCP result from a decoded JSON-RPC response.
+        
+        Args:
+            data: JSON-RPC response message
+            
+        Returns:
+            Tuple of (success, result_or_error, error_message)
+        """
+        if "result" in data:
+            return True, data["result"], None
+        elif "error" in data:
+            error = data["error"]
+            error_msg = error.get("message", "Unknown error") if isinstance(error, dict) else str(error)
+            return False, error, error_msg
+        else:
+            logger.warning("MCP response missing result or error", data=data)
+            return False, None, "Invalid MCP response format"
+
+
+class IncrementalSSEParser:
+    """Incremental parser for Server-Sent Events streams.
+    
+    Bytes are fed as they arrive and complete events are returned as soon
+    as their terminating blank line is seen, so a response can be handled
+    without buffering and decoding the whole body first. Field names are
+    matched as bytes; only event types are decoded.
+    """
+    
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._event_type: Optional[str] = None
+        self._data: List[bytes] = []
+    
+    def feed(self, chunk: bytes) -> List[Tuple[Optional[str], bytes]]:
+        """Add bytes from the stream.
+        
+        Args:
+            chunk: Next chunk of the response body
+            
+        Returns:
+            (event_type, data) for each event completed by this chunk
+        """
+        buffer = self._buffer
+        buffer += chunk
+        events = []
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            event = self._process_line(bytes(buffer[start:end]))
+            if event:
+                events.append(event)
+            start = end + 1
+        del buffer[:start]
+        return events
+    
+    def close(self) -> Optional[Tuple[Optional[str], bytes]]:
+        """Finish the stream.
+        
+        Returns:
+            The last event if the stream ended without a blank line after it
+        """
+        if self._buffer:
+            self._process_line(bytes(self._buffer))
+            self._buffer.clear()
+        return self._process_line(b"")
+    
+    def _process_line(self, line: bytes) -> Optional[Tuple[Optional[str], bytes]]:
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        if not line:
+            # A blank line dispatches the pending event
+            if not self._data:
+                self._event_type = None
+                return None
+            event = (self._event_type, b"\n".join(self._data))
+            self._event_type = None
+            self._data = []
+            return event
+        if line.startswith(b":"):
+            # Comment (e.g. keep-alive ping)
+            return None
+        field, _, value = line.partition(b":")
+        if value.startswith(b" "):
+            value = value[1:]
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            event_type = _EVENT_TYPES.get(value)
+            self._event_type = event_type if event_type is not None else value.decode()
+        # id and retry are not used by MCP responses
+        return None
@@ -311,7 +311,7 @@ class LinkedInExternalPlugin(Plugin):
                 restart_start = tracker.record_phase_start("server_restart")
                 if self.process_manager:
                     await self.process_manager.restart()
-                await self.mcp_client.initialize_session()
+                await self.mcp_client.initialize_session(refresh=True)
                 tracker.record_phase_end("server_restart", restart_start)
                 logger.info("LinkedIn MCP server restarted and session initialized")
             
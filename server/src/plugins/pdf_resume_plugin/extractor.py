@@ -1,30 +1,76 @@
 """
 PDF text extraction functionality.
 
-This module handles downloading PDFs and extracting text using pdfminer.six.
+This module handles downloading PDFs and extracting text. PDFium (via
+pypdfium2) is the primary extractor; pdfminer.six is the fallback.
 """
 
+import asyncio
 import io
+import multiprocessing
+import os
 import re
-import requests
-from typing import Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Union
 
-from pdfminer.high_level import extract_text
+import httpx
+import pypdfium2 as pdfium
+from pdfminer.converter import TextConverter
 from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
 
 from src.utils.logging import get_structured_logger
 
 logger = get_structured_logger(__name__)
 
+PDF_MAGIC = b"%PDF-"
 
-async def download_pdf(url: str) -> bytes:
+# Read size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Default LAParams: all_texts=True forced layout analysis on every form
+# XObject, which is pdfminer's worst case and gave no better output.
+# The instance is only read during analysis, so one is shared.
+_LAPARAMS = LAParams()
+
+# Section headings recognized by split_all_sections
+SECTION_NAMES = (
+    "education", "experience", "employment", "work", "skills", "technical skills",
+    "projects", "languages", "location", "address",
+)
+
+# Headings that end a section (extract_section's default next_section_names)
+SECTION_TERMINATORS = frozenset(["education", "experience", "skills", "projects", "languages"])
+
+# A heading is a section name alone on its line, optionally followed by a colon
+_SECTION_HEADING_RE = re.compile(
+    r'^[^\S\n]*({})[^\S\n]*:?[^\S\n]*$'.format('|'.join(SECTION_NAMES)),
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Worker processes for CPU-bound PDF work: pdfminer extraction and batch
+# resume parsing (created on first use). Workers come from a forkserver so
+# they never inherit the threads and locks of the (threaded) server process.
+PDF_POOL_MAX_WORKERS = min(4, os.cpu_count() or 1)
+_PDF_POOL: Optional[ProcessPoolExecutor] = None
+# The pool is also requested from worker threads (batch parsing)
+_PDF_POOL_LOCK = threading.Lock()
+
+
+async def download_pdf(url: str) -> io.BytesIO:
     """Download PDF from URL.
     
+    The body is streamed into an in-memory buffer that can be handed to the
+    extractor as-is, without copying it into a second bytes object.
+    
     Args:
         url: URL of the PDF to download
         
     Returns:
-        bytes: PDF content
+        io.BytesIO: PDF content, rewound to the start
         
     Raises:
         Exception: If download fails
@@ -34,8 +80,14 @@ async def download_pdf(url: str) -> bytes:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
         logger.info(f"Downloading PDF from URL: {url}")
-        response = requests.get(url, headers=headers, timeout=60)  # Increase timeout for large files
-        response.raise_for_status()
+        buffer = io.BytesIO()
+        # Increase timeout for large files; Airtable attachment URLs redirect
+        async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
+            async with client.stream("GET", url, headers=headers) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    buffer.write(chunk)
+        content = buffer.getbuffer()
         
         # Check content type and URL patterns
         content_type = response.headers.get("Content-Type", "")
@@ -55,31 +107,35 @@ async def download_pdf(url: str) -> bytes:
         elif "airtableusercontent.com" in url and any(ext in response.headers.get("Content-Disposition", "").lower() for ext in [".pdf", "filename=", "filename*="]):
             logger.debug("Airtable URL with PDF content detected via Content-Disposition header")
             is_pdf = True
-        elif "airtableusercontent.com" in url and len(response.content) > 1000:
+        elif "airtableusercontent.com" in url and content.nbytes > 1000:
             # For Airtable URLs, check if the content looks like a PDF (starts with %PDF-)
-            first_bytes = response.content[:10].decode('utf-8', errors='ignore')
-            if "%PDF-" in first_bytes:
+            if content[:len(PDF_MAGIC)] == PDF_MAGIC:
                 logger.debug("Content starts with %PDF- magic bytes - confirmed PDF content")
                 is_pdf = True
             else:
-                logger.debug(f"First bytes of content: {first_bytes}")
+                logger.debug(f"First bytes of content: {content[:10].hex()}")
         
         if not is_pdf:
             logger.warning(f"Content may not be a PDF. Content-Type: {content_type}", 
                           url=url, 
                           content_type=content_type)
         
-        return response.content
+        # Release the view so the buffer stays usable, then rewind for the reader
+        content.release()
+        buffer.seek(0)
+        return buffer
     except Exception as e:
         logger.error("Failed to download PDF", url=url, error=str(e))
         raise Exception(f"Failed to download PDF from {url}: {str(e)}")
 
 
-def extract_text_from_pdf(pdf_content: bytes) -> str:
+def extract_text_from_pdf(pdf_content: Union[bytes, io.BytesIO], clean: bool = True) -> str:
     """Extract text from PDF content.
     
     Args:
-        pdf_content: PDF content as bytes
+        pdf_content: PDF content as bytes or a buffer from download_pdf
+        clean: Whether to run clean_text on the result. The LLM path skips
+            it since the model is not sensitive to whitespace noise.
         
     Returns:
         str: Extracted text
@@ -88,27 +144,32 @@ def extract_text_from_pdf(pdf_content: bytes) -> str:
         Exception: If extraction fails
     """
     try:
+        # Wrap raw bytes; buffers from download_pdf are used without a copy
+        pdf_file = pdf_content if isinstance(pdf_content, io.BytesIO) else io.BytesIO(pdf_content)
+        with pdf_file.getbuffer() as view:
+            head = bytes(view[:10])
+            size = view.nbytes
+        
         # First check if content looks like a PDF (should start with %PDF-)
-        first_bytes = pdf_content[:10].decode('utf-8', errors='ignore')
-        if "%PDF-" not in first_bytes:
-            logger.warning(f"Content doesn't appear to be a PDF. First bytes: {first_bytes}")
-            if len(pdf_content) < 200:
-                logger.debug(f"Content (short): {pdf_content.decode('utf-8', errors='ignore')}")
+        if not head.startswith(PDF_MAGIC):
+            logger.warning(f"Content doesn't appear to be a PDF. First bytes: {head.hex()}")
+            if size < 200:
+                logger.debug(f"Content (short): {pdf_file.getvalue().decode('utf-8', errors='ignore')}")
             # Continue anyway - maybe pdfminer can still extract something
         
-        # Create a file-like object from bytes
-        pdf_file = io.BytesIO(pdf_content)
-        
-        # Extract text with pdfminer.six
-        logger.info("Extracting text with pdfminer.six")
-        laparams = LAParams(
-            line_margin=0.5,
-            word_margin=0.1,
-            char_margin=2.0,
-            all_texts=True
-        )
+        # PDFium's native text extraction is an order of magnitude faster than
+        # pdfminer's pure-Python layout analysis
+        text = ""
+        try:
+            logger.info("Extracting text with pypdfium2")
+            text = _extract_text_with_pdfium(pdf_file)
+        except Exception as e:
+            logger.warning("pypdfium2 extraction failed, falling back to pdfminer.six", error=str(e))
         
-        text = extract_text(pdf_file, laparams=laparams)
+        if len(text.strip()) < 10:
+            logger.info("Extracting text with pdfminer.six")
+            pdf_file.seek(0)
+            text = _extract_text_with_pdfminer(pdf_file)
         
         # Check if we got any text
         if not text or len(text.strip()) < 10:
@@ -117,7 +178,8 @@ def extract_text_from_pdf(pdf_content: bytes) -> str:
             logger.info(f"Successfully extracted {len(text)} characters")
         
         # Clean up text
-        text = clean_text(text)
+        if clean:
+            text = clean_text(text)
         
         logger.info("Text extraction successful", text_length=len(text))
         return text
@@ -126,6 +188,120 @@ def extract_text_from_pdf(pdf_content: bytes) -> str:
         raise Exception(f"Failed to extract text from PDF: {str(e)}")
 
 
+def _extract_text_with_pdfium(pdf_file: io.BytesIO) -> str:
+    """Extract text from every page with PDFium.
+    
+    Args:
+        pdf_file: PDF content buffer
+        
+    Returns:
+        str: Page texts joined by newlines
+    """
+    pdf = pdfium.PdfDocument(pdf_file)
+    try:
+        page_texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            # PDFium uses CRLF line endings; match pdfminer's plain newlines
+            page_texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+        return "\n".join(page_texts)
+    finally:
+        pdf.close()
+
+
+def _extract_text_with_pdfminer(pdf_file: io.BytesIO) -> str:
+    """Extract text with pdfminer.six's low-level interface.
+    
+    One caching resource manager and interpreter serve every page, so fonts
+    and CMaps are decoded once per document.
+    
+    Args:
+        pdf_file: PDF content buffer
+        
+    Returns:
+        str: Extracted text
+    """
+    rsrcmgr = PDFResourceManager(caching=True)
+    with io.StringIO() as output:
+        device = TextConverter(rsrcmgr, output, laparams=_LAPARAMS)
+        try:
+            interpreter = PDFPageInterpreter(rsrcmgr, device)
+            for page in PDFPage.get_pages(pdf_file, caching=True):
+                interpreter.process_page(page)
+        finally:
+            device.close()
+        return output.getvalue()
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the shared worker pool for CPU-bound PDF work, starting it on first use."""
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is None:
+            _PDF_POOL = ProcessPoolExecutor(
+                max_workers=PDF_POOL_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver")
+            )
+        return _PDF_POOL
+
+
+def discard_pdf_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next get_pdf_pool call starts a new one.
+    
+    A pool whose worker died (e.g. a native crash on a malformed PDF or an
+    OOM kill) fails every later task, so callers replace it and retry.
+    
+    Args:
+        pool: The pool that broke; ignored if it was already replaced
+    """
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is pool:
+            _PDF_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def extract_text_from_pdf_async(pdf_content: Union[bytes, io.BytesIO], clean: bool = True) -> str:
+    """Extract text from PDF content in a worker process.
+    
+    pdfminer layout analysis is CPU-bound and can take seconds, so it runs in
+    a process pool instead of blocking the event loop. Cleanup happens in the
+    worker, so only the final text is sent back.
+    
+    If a worker died the pool is broken for good, so it is replaced and the
+    extraction retried once.
+    
+    Args:
+        pdf_content: PDF content as bytes or a buffer from download_pdf
+        clean: Whether to run clean_text on the result
+        
+    Returns:
+        str: Extracted text
+        
+    Raises:
+        Exception: If extraction fails
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_pdf_pool()
+    try:
+        return await loop.run_in_executor(pool, extract_text_from_pdf, pdf_content, clean)
+    except BrokenProcessPool:
+        logger.warning("PDF extraction worker died, restarting the worker pool")
+        discard_pdf_pool(pool)
+    return await loop.run_in_executor(get_pdf_pool(), extract_text_from_pdf, pdf_content, clean)
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the PDF worker processes, if any were started."""
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        pool, _PDF_POOL = _PDF_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def clean_text(text: str) -> str:
     """Clean extracted text.
     
@@ -197,4 +373,40 @@ def extract_section(text: str, section_name: str, next_section_names: Optional[l
     
     # Extract the section
     section_text = text[section_start:section_end].strip()
-    return section_text
\ No newline at end of file
+    return section_text
+
+
+def split_all_sections(text: str) -> Dict[str, str]:
+    """Extract every known section from the text in a single scan.
+    
+    Equivalent to calling extract_section with default next_section_names
+    for each of SECTION_NAMES, but the text is scanned for headings once
+    instead of once per section and candidate terminator. One difference:
+    a heading on the line right after another heading ends that section
+    here, while extract_section misses it (its heading match consumes the
+    newline the next heading pattern needs) and returns it as content.
+    
+    Args:
+        text: Full text
+        
+    Returns:
+        Dict[str, str]: Section text keyed by lowercase section name, for
+        the sections that were found
+    """
+    headings = [
+        (match.group(1).lower(), match.start(), match.end())
+        for match in _SECTION_HEADING_RE.finditer(text)
+    ]
+    
+    sections: Dict[str, str] = {}
+    for index, (name, _, section_start) in enumerate(headings):
+        # Only the first heading for a name starts its section
+        if name in sections:
+            continue
+        section_end = len(text)
+        for next_name, next_start, _ in headings[index + 1:]:
+            if next_name in SECTION_TERMINATORS and next_name != name:
+                section_end = next_start
+                break
+        sections[name] = text[section_start:section_end].strip()
+    return sections
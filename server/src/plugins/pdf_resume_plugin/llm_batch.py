@@ -0,0 +1,353 @@
+"""
+Batch API support for bulk LLM resume parsing.
+
+Large, non-interactive parsing jobs go through the provider's Batch API,
+which is cheaper than synchronous completions and does not consume the
+interactive rate limit. Small jobs use the concurrent synchronous path
+instead, as do the items of a batch that produced no result for them; a
+batch that fails after submission is cancelled first so no item is billed
+twice.
+
+The entry point is the PDF resume plugin's "parse_resumes" action (see
+PDFResumePlugin.parse_resume_texts).
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import orjson
+
+from src.config.settings import settings
+from src.utils.logging import get_structured_logger
+
+from .llm_cache import LLMCache, get_llm_cache
+from .llm_fallback import (
+    MAX_RESUME_TOKENS,
+    PARSE_MAX_TOKENS,
+    PARSE_TEMPERATURE,
+    PROMPT_VERSION,
+    SYSTEM_PROMPT,
+    build_parse_messages,
+    compact_resume_text,
+    extract_response_content,
+    finalize_resume_data,
+    parse_llm_response,
+    parse_many_with_llm,
+    truncate_resume_text,
+)
+
+logger = get_structured_logger(__name__)
+
+OPENAI_API_BASE = "https://api.openai.com/v1"
+ANTHROPIC_API_BASE = "https://api.anthropic.com/v1"
+ANTHROPIC_VERSION = "2023-06-01"
+
+# Status polling backoff, in seconds
+POLL_INITIAL_INTERVAL = 5.0
+POLL_MAX_INTERVAL = 60.0
+# Consecutive transient errors (network, 429, 5xx) tolerated while polling
+POLL_MAX_ERRORS = 5
+
+# Batches are guaranteed to finish within 24h
+DEFAULT_MAX_WAIT = 24 * 60 * 60
+
+
+async def parse_with_llm_batch(
+    items: List[Tuple[str, Dict[str, Any]]],
+    provider_name: str,
+    model_name: str,
+    max_wait: float = DEFAULT_MAX_WAIT
+) -> List[Dict[str, Any]]:
+    """Parse many resumes, using the provider's Batch API when enabled.
+
+    Resumes with a cached parse are not sent again, and batch results are
+    added to the cache like synchronous parses.
+
+    Args:
+        items: (text, direct_extraction_data) pairs
+        provider_name: LLM provider to use ("openai" or "anthropic")
+        model_name: LLM model to use
+        max_wait: Maximum seconds to wait for the batch to finish
+
+    Returns:
+        List[Dict[str, Any]]: Parsed data for each item, in input order. Items the
+        batch returned no result for are parsed synchronously; items whose
+        result cannot be parsed get their direct extraction data.
+    """
+    if not settings.llm_use_batch_api or len(items) < settings.llm_batch_min_items:
+        return await parse_many_with_llm(items, provider_name, model_name)
+
+    cache = get_llm_cache()
+    keys = [LLMCache.make_key(text, provider_name, model_name, PROMPT_VERSION) for text, _ in items]
+    results: List[Optional[Dict[str, Any]]] = list(await asyncio.gather(*(cache.get(key) for key in keys)))
+    pending = [index for index, result in enumerate(results) if result is None]
+
+    if len(pending) >= settings.llm_batch_min_items:
+        responses = await _run_batch(
+            [items[index] for index in pending], provider_name, model_name, max_wait
+        )
+        for position, index in enumerate(pending):
+            response = responses.get(str(position))
+            if response is None:
+                continue
+            text, direct = items[index]
+            results[index] = await _demultiplex(response, text, direct, provider_name, cache, keys[index])
+        logger.info("Resume batch parsed", count=len(pending), succeeded=len(responses))
+
+    # Cache misses of a small job, and items the batch has no result for
+    missing = [index for index, result in enumerate(results) if result is None]
+    if missing:
+        parsed = await parse_many_with_llm([items[index] for index in missing], provider_name, model_name)
+        for index, data in zip(missing, parsed):
+            results[index] = data
+    return results
+
+
+async def _run_batch(
+    items: List[Tuple[str, Dict[str, Any]]],
+    provider_name: str,
+    model_name: str,
+    max_wait: float
+) -> Dict[str, Dict[str, Any]]:
+    """Run items through the Batch API.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Raw provider responses of the items that
+        succeeded, by index in items. Empty if the batch failed; a batch
+        that fails after submission is cancelled.
+    """
+    api_class = _BATCH_APIS.get(provider_name)
+    if api_class is None:
+        logger.error("Batch API not supported for provider, parsing synchronously", provider=provider_name)
+        return {}
+
+    try:
+        api_key = settings.get_llm_api_key(provider_name)
+        params = [_build_params(text, direct, provider_name, model_name) for text, direct in items]
+        logger.info("Submitting resume batch", provider=provider_name, model=model_name, count=len(items))
+
+        async with httpx.AsyncClient(timeout=float(settings.llm_timeout)) as client:
+            api = api_class(client, api_key)
+            batch_id = await api.submit(params)
+            try:
+                return await api.collect(batch_id, max_wait)
+            except BaseException:
+                await api.cancel(batch_id)
+                raise
+    except Exception as e:
+        logger.error("Resume batch failed, parsing synchronously",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    provider=provider_name,
+                    count=len(items))
+        return {}
+
+
+def _build_params(
+    text: str,
+    direct_extraction_data: Dict[str, Any],
+    provider_name: str,
+    model_name: str
+) -> Dict[str, Any]:
+    truncated_text = truncate_resume_text(compact_resume_text(text), MAX_RESUME_TOKENS)
+    messages = build_parse_messages(truncated_text, direct_extraction_data, provider_name)
+    params = {
+        "model": model_name,
+        "messages": messages,
+        "temperature": PARSE_TEMPERATURE,
+        "max_tokens": PARSE_MAX_TOKENS,
+    }
+    if provider_name == "anthropic":
+        # The Messages API takes the system prompt as a top-level field
+        params["system"] = SYSTEM_PROMPT
+        params["messages"] = [m for m in messages if m["role"] != "system"]
+    return params
+
+
+async def _demultiplex(
+    response: Dict[str, Any],
+    text: str,
+    direct_extraction_data: Dict[str, Any],
+    provider_name: str,
+    cache: LLMCache,
+    cache_key: str
+) -> Dict[str, Any]:
+    try:
+        parsed_data, repaired = parse_llm_response(extract_response_content(provider_name, response))
+        if not parsed_data or not any(parsed_data.values()):
+            return direct_extraction_data
+        merged_data = finalize_resume_data(text, direct_extraction_data, parsed_data)
+    except Exception as e:
+        logger.error("Failed to parse batch result", error=str(e), error_type=type(e).__name__)
+        return direct_extraction_data
+    if not repaired:
+        # Repaired JSON may have lost content; leave it out of the cache
+        await cache.set(cache_key, merged_data)
+    return merged_data
+
+
+def _is_transient(error: httpx.HTTPError) -> bool:
+    """Whether a failed request is worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+async def _poll(client: httpx.AsyncClient, url: str, headers: Dict[str, str], done, max_wait: float) -> Dict[str, Any]:
+    """Poll a batch until done(batch) is true, backing off exponentially.
+
+    Transient errors are retried on the same schedule, up to POLL_MAX_ERRORS
+    in a row.
+    """
+    deadline = time.monotonic() + max_wait
+    interval = POLL_INITIAL_INTERVAL
+    errors = 0
+    while True:
+        try:
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            errors += 1
+            if not _is_transient(e) or errors >= POLL_MAX_ERRORS:
+                raise
+            logger.warning("Batch status poll failed, retrying", error=str(e), attempt=errors)
+        else:
+            errors = 0
+            batch = response.json()
+            if done(batch):
+                return batch
+        if time.monotonic() + interval > deadline:
+            raise TimeoutError(f"Batch {url} did not finish within {max_wait}s")
+        await asyncio.sleep(interval)
+        interval = min(interval * 2, POLL_MAX_INTERVAL)
+
+
+async def _cancel(client: httpx.AsyncClient, url: str, headers: Dict[str, str]) -> None:
+    """Cancel a batch, logging instead of raising on failure."""
+    try:
+        response = await client.post(url, headers=headers)
+        response.raise_for_status()
+        logger.info("Cancelled resume batch", url=url)
+    except httpx.HTTPError as e:
+        logger.warning("Failed to cancel resume batch", url=url, error=str(e))
+
+
+class _OpenAIBatchAPI:
+    """OpenAI Batch API for chat completions."""
+
+    def __init__(self, client: httpx.AsyncClient, api_key: str) -> None:
+        self.client = client
+        self.headers = {"Authorization": f"Bearer {api_key}"}
+
+    async def submit(self, params: List[Dict[str, Any]]) -> str:
+        lines = b"\n".join(
+            orjson.dumps({"custom_id": str(i), "method": "POST", "url": "/v1/chat/completions", "body": body})
+            for i, body in enumerate(params)
+        )
+
+        upload = await self.client.post(
+            f"{OPENAI_API_BASE}/files",
+            headers=self.headers,
+            data={"purpose": "batch"},
+            files={"file": ("resumes.jsonl", lines, "application/jsonl")},
+        )
+        upload.raise_for_status()
+
+        created = await self.client.post(
+            f"{OPENAI_API_BASE}/batches",
+            headers=self.headers,
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+        )
+        created.raise_for_status()
+        batch_id = created.json()["id"]
+        logger.info("OpenAI batch created", batch_id=batch_id)
+        return batch_id
+
+    async def collect(self, batch_id: str, max_wait: float) -> Dict[str, Dict[str, Any]]:
+        batch = await _poll(
+            self.client,
+            f"{OPENAI_API_BASE}/batches/{batch_id}",
+            self.headers,
+            lambda b: b.get("status") in ("completed", "failed", "expired", "cancelled"),
+            max_wait,
+        )
+        if batch["status"] != "completed" or not batch.get("output_file_id"):
+            raise RuntimeError(f"OpenAI batch {batch_id} ended with status {batch['status']}")
+
+        responses: Dict[str, Dict[str, Any]] = {}
+        async with self.client.stream(
+            "GET", f"{OPENAI_API_BASE}/files/{batch['output_file_id']}/content", headers=self.headers
+        ) as output:
+            output.raise_for_status()
+            async for line in output.aiter_lines():
+                if not line:
+                    continue
+                entry = orjson.loads(line)
+                result = entry.get("response") or {}
+                if result.get("status_code") == 200:
+                    responses[entry["custom_id"]] = result["body"]
+        return responses
+
+    async def cancel(self, batch_id: str) -> None:
+        await _cancel(self.client, f"{OPENAI_API_BASE}/batches/{batch_id}/cancel", self.headers)
+
+
+class _AnthropicBatchAPI:
+    """Anthropic Message Batches API."""
+
+    def __init__(self, client: httpx.AsyncClient, api_key: str) -> None:
+        self.client = client
+        self.headers = {
+            "x-api-key": api_key,
+            "anthropic-version": ANTHROPIC_VERSION,
+        }
+
+    async def submit(self, params: List[Dict[str, Any]]) -> str:
+        created = await self.client.post(
+            f"{ANTHROPIC_API_BASE}/messages/batches",
+            headers=self.headers,
+            json={"requests": [{"custom_id": str(i), "params": body} for i, body in enumerate(params)]},
+        )
+        created.raise_for_status()
+        batch_id = created.json()["id"]
+        logger.info("Anthropic batch created", batch_id=batch_id)
+        return batch_id
+
+    async def collect(self, batch_id: str, max_wait: float) -> Dict[str, Dict[str, Any]]:
+        batch = await _poll(
+            self.client,
+            f"{ANTHROPIC_API_BASE}/messages/batches/{batch_id}",
+            self.headers,
+            lambda b: b.get("processing_status") == "ended",
+            max_wait,
+        )
+        if not batch.get("results_url"):
+            raise RuntimeError(f"Anthropic batch {batch_id} has no results")
+
+        responses: Dict[str, Dict[str, Any]] = {}
+        async with self.client.stream("GET", batch["results_url"], headers=self.headers) as output:
+            output.raise_for_status()
+            async for line in output.aiter_lines():
+                if not line:
+                    continue
+                entry = orjson.loads(line)
+                result = entry.get("result") or {}
+                if result.get("type") == "succeeded":
+                    responses[entry["custom_id"]] = result["message"]
+        return responses
+
+    async def cancel(self, batch_id: str) -> None:
+        await _cancel(self.client, f"{ANTHROPIC_API_BASE}/messages/batches/{batch_id}/cancel", self.headers)
+
+
+_BATCH_APIS = {
+    "openai": _OpenAIBatchAPI,
+    "anthropic": _AnthropicBatchAPI,
+}
@@ -0,0 +1,153 @@
+"""
+Response cache for LLM resume parsing.
+
+Parses are keyed on the provider, model, prompt version and whitespace-normalized
+resume text, so re-uploads of the same resume (or a re-extraction that only
+differs in spacing) are served without an LLM call.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Protocol, Tuple, Union
+
+import orjson
+import xxhash
+
+from src.config.settings import settings
+from src.utils.logging import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Storage for serialized cache entries.
+
+    Entries are stored as JSON bytes; backends may return them as str.
+    """
+
+    async def get(self, key: str) -> Optional[Union[bytes, str]]:
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU with per-entry expiry."""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class RedisCacheBackend:
+    """Redis-backed entries shared across workers.
+
+    Redis errors are logged and treated as misses so parsing never fails
+    because the cache is unavailable.
+    """
+
+    def __init__(self, redis_url: str, key_prefix: str = "pdf:llm:") -> None:
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self._redis = None
+
+    async def _client(self):
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, encoding="utf-8", decode_responses=True)
+        return self._redis
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            client = await self._client()
+            return await client.get(self.key_prefix + key)
+        except Exception as e:
+            logger.warning("LLM cache read failed", error=str(e))
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        try:
+            client = await self._client()
+            await client.setex(self.key_prefix + key, ttl, value)
+        except Exception as e:
+            logger.warning("LLM cache write failed", error=str(e))
+
+
+class LLMCache:
+    """Deterministic cache of parsed LLM responses."""
+
+    def __init__(self, backend: CacheBackend, ttl: int) -> None:
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(text: str, provider_name: str, model_name: str, prompt_version: str) -> str:
+        """Build the cache key for a parse request.
+
+        Args:
+            text: Resume text sent to the LLM
+            provider_name: LLM provider
+            model_name: LLM model
+            prompt_version: Version of the prompt the response was produced with
+
+        Returns:
+            str: Hex XXH3-128 digest. Keys need a negligible collision rate, not
+            cryptographic strength, and XXH3 hashes resume-sized text many
+            times faster than SHA-256.
+        """
+        payload = orjson.dumps(
+            {
+                "model": model_name,
+                "prompt_version": prompt_version,
+                "provider": provider_name,
+                "text": " ".join(text.split()),
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return xxhash.xxh3_128_hexdigest(payload)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the cached parse, or None on a miss."""
+        cached = await self.backend.get(key)
+        if cached is None:
+            return None
+        return orjson.loads(cached)
+
+    async def set(self, key: str, data: Dict[str, Any]) -> None:
+        """Store a parse result."""
+        await self.backend.set(key, orjson.dumps(data), self.ttl)
+
+
+_LLM_CACHE: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the process-wide LLM response cache, created from settings on first use."""
+    global _LLM_CACHE
+    if _LLM_CACHE is None:
+        if settings.pdf_llm_cache_backend == "redis" and settings.redis_url:
+            backend: CacheBackend = RedisCacheBackend(settings.redis_url)
+        else:
+            backend = MemoryCacheBackend(settings.pdf_llm_cache_size)
+        _LLM_CACHE = LLMCache(backend, settings.pdf_llm_cache_ttl)
+    return _LLM_CACHE
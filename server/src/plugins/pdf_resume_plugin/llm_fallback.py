@@ -4,23 +4,65 @@ LLM fallback for PDF resume parsing.
 This module provides LLM-based parsing when direct extraction fails.
 """
 
+import asyncio
 import json
 import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import json_repair
+import orjson
 
+from src.config.settings import settings
 from src.utils.logging import get_structured_logger
 
-from src.api.llm.providers import ProviderFactory
-import unicodedata
-from typing import Any, Dict
+from src.api.llm.providers import BaseProvider, ProviderFactory
+from .llm_cache import LLMCache, get_llm_cache
 
 logger = get_structured_logger(__name__)
 
+# A reasonable resume should have at least this much content and this many non-empty fields
+MIN_CONTENT_LENGTH = 100
+MIN_NON_EMPTY_FIELDS = 3
+
+# Runs of horizontal whitespace in extracted text
+_INLINE_SPACE_RE = re.compile(r"[ \t\f\v\xa0]+")
+
+# Resume section heading at the start of a line
+_SECTION_RE = re.compile(
+    r"^[ \t]*(?:EDUCATION|EXPERIENCE|WORK|EMPLOYMENT|SKILLS|PROJECTS|LANGUAGES|PROFILE|SUMMARY"
+    r"|PUBLICATIONS|CERTIFICATIONS|AWARDS)\b",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Fenced ```json block in a model response
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+# Characters that can change _JsonObjectScanner's state
+_JSON_STRUCTURE_RE = re.compile(r'[{}"\\]')
+
+# Shared decoder; raw_decode locates and parses the JSON object in one C-level scan.
+# Complete JSON documents go through orjson; it has no raw_decode equivalent.
+_DECODER = json.JSONDecoder()
+
+# Token budget for the resume text in the prompt (~50k chars of English text)
+MAX_RESUME_TOKENS = 12500
+# Rough tokenizer ratio for ASCII text; other characters are counted as a token each
+ASCII_CHARS_PER_TOKEN = 4
+
+# Sampling settings for resume parsing requests
+PARSE_TEMPERATURE = 0.1
+PARSE_MAX_TOKENS = 8000  # Increased to allow complete resume extraction
+
+# Bump when the prompt or post-processing changes so cached parses are not reused
+PROMPT_VERSION = "v2"
+
 
 async def parse_with_llm(
     text: str,
     direct_extraction_data: Dict[str, Any],
     provider_name: str,
-    model_name: str
+    model_name: str,
+    provider: Optional[BaseProvider] = None
 ) -> Dict[str, Any]:
     """Use LLM to parse resume when direct extraction fails.
 
@@ -29,6 +71,7 @@ async def parse_with_llm(
         direct_extraction_data: Data from direct extraction (may be incomplete)
         provider_name: LLM provider to use
         model_name: LLM model to use
+        provider: Provider instance to reuse; created from provider_name if omitted
 
     Returns:
         Dict[str, Any]: Structured resume data from LLM
@@ -40,40 +83,34 @@ async def parse_with_llm(
                     provider=provider_name,
                     model=model_name)
 
-        # Truncate text if too long
-        max_text_length = 50000  # Adjust based on model context limits
-        was_truncated = len(text) > max_text_length
-        truncated_text = text[:max_text_length] if was_truncated else text
+        # Identical text re-parsed with the same model (e.g. a re-run batch) skips the LLM
+        cache = get_llm_cache()
+        cache_key = LLMCache.make_key(text, provider_name, model_name, PROMPT_VERSION)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached LLM resume parse", provider=provider_name, model=model_name)
+            return cached
+
+        # Drop layout whitespace, then truncate text if too long for the token budget
+        truncated_text = truncate_resume_text(compact_resume_text(text), MAX_RESUME_TOKENS)
 
-        if was_truncated:
+        if len(truncated_text) < len(text):
             logger.warning("PDF text truncated for LLM",
                           original_length=len(text),
-                          truncated_length=max_text_length)
-
-        # Create prompt for LLM
-        prompt = create_llm_prompt(truncated_text, direct_extraction_data)
-        logger.debug("LLM prompt created", prompt_length=len(prompt))
+                          truncated_length=len(truncated_text),
+                          estimated_tokens=estimate_tokens(text),
+                          max_tokens=MAX_RESUME_TOKENS)
 
         # Get LLM provider with appropriate timeout
-        from src.config.settings import settings
-        timeout = settings.llm_timeout  # Use general LLM timeout for PDF parsing
-        provider = ProviderFactory.get_provider(provider_name, timeout=float(timeout))
-
-        # Create request with proper message order and prefilling
-        messages = [
-            {"role": "system", "content": "You are an expert resume parser. Output ONLY valid JSON. No explanations, no text before or after the JSON."},
-            {"role": "user", "content": prompt}
-        ]
-
-        # Add prefilling for Anthropic to force JSON output
-        if provider_name == "anthropic":
-            messages.append({"role": "assistant", "content": "{"})
+        if provider is None:
+            timeout = settings.llm_timeout  # Use general LLM timeout for PDF parsing
+            provider = ProviderFactory.get_provider(provider_name, timeout=float(timeout))
 
         request = {
             "model": model_name,
-            "messages": messages,
-            "temperature": 0.1,
-            "max_tokens": 8000,  # Increased to allow complete resume extraction
+            "messages": build_parse_messages(truncated_text, direct_extraction_data, provider_name),
+            "temperature": PARSE_TEMPERATURE,
+            "max_tokens": PARSE_MAX_TOKENS,
         }
 
         # Call LLM
@@ -91,28 +128,17 @@ async def parse_with_llm(
             logger.error("API key missing for provider", provider=provider_name)
             raise ValueError(f"No API key configured for provider: {provider_name}")
 
-        response = await provider.generate(request, api_key=api_key)
+        # Stream the completion and stop reading once the JSON object is closed.
+        # The HTTP timeout only bounds each read, so one deadline covers the whole call;
+        # expiry (or cancellation of the caller) closes the stream mid-flight.
+        async with asyncio.timeout(settings.llm_timeout):
+            content = await stream_json_completion(provider, request, api_key, provider_name)
 
-        # Log response metadata
         logger.debug("LLM response received",
                     provider=provider_name,
-                    response_keys=list(response.keys()) if response else None)
-
-        # Parse the response
-        if provider_name == "openai":
-            content = response["choices"][0]["message"]["content"]
-            logger.debug("OpenAI response content extracted",
-                        content_length=len(content),
-                        content_preview=content[:200] + "..." if len(content) > 200 else content)
-        else:  # anthropic
-            content = response["content"][0]["text"]
-            # If we prefilled with "{", the response will start where we left off
-            # So we need to prepend the "{" back
-            if not content.strip().startswith("{"):
-                content = "{" + content
-                logger.debug("Prepended '{' to Anthropic response")
-
-        parsed_data = parse_llm_response(content)
+                    content_length=len(content))
+
+        parsed_data, repaired = parse_llm_response(content)
 
         # Check if parsing actually succeeded
         if not parsed_data or not any(parsed_data.values()):
@@ -130,30 +156,21 @@ async def parse_with_llm(
                     projects_count=len(parsed_data.get("projects", [])),
                     additional_sections_count=len(parsed_data.get("additional_sections", {})))
 
-        # Normalize parsed data for Unicode and minor unit fixes
-        normalized = normalize_resume_data(text, parsed_data)
-
-        # Merge with direct extraction data for any fields that might be missing
-        merged_data = merge_resume_data(direct_extraction_data, normalized)
-
-        logger.info("LLM parsing successful",
-                   total_fields=sum([
-                       bool(merged_data.get("personal_info", {}).get("name")),
-                       len(merged_data.get("education", [])),
-                       len(merged_data.get("experience", [])),
-                       len(merged_data.get("skills", [])),
-                       len(merged_data.get("projects", [])),
-                       len(merged_data.get("additional_sections", {}))
-                   ]))
-        
-        # Remove personal_info to maintain anonymity in evaluation
-        if "personal_info" in merged_data:
-            logger.debug("Removing personal_info to maintain evaluation anonymity")
-            del merged_data["personal_info"]
-            
+        merged_data = finalize_resume_data(text, direct_extraction_data, parsed_data)
+
+        if not repaired:
+            # Repaired JSON may have lost content; a later call can do better
+            await cache.set(cache_key, merged_data)
         return merged_data
 
+    except TimeoutError:
+        logger.error("LLM fallback parsing timed out",
+                    timeout=settings.llm_timeout,
+                    provider=provider_name,
+                    model=model_name)
+        return direct_extraction_data
     except Exception as e:
+        # CancelledError is not an Exception, so a cancelled request is never swallowed here
         logger.error("LLM fallback parsing failed",
                     error=str(e),
                     error_type=type(e).__name__,
@@ -164,77 +181,295 @@ async def parse_with_llm(
         return direct_extraction_data
 
 
-def create_llm_prompt(text: str, direct_extraction_data: Dict[str, Any]) -> str:
-    """Create prompt for LLM resume parsing.
+def build_parse_messages(
+    truncated_text: str,
+    direct_extraction_data: Dict[str, Any],
+    provider_name: str
+) -> List[Dict[str, Any]]:
+    """Build the chat messages for a resume parsing request.
+
+    Args:
+        truncated_text: Resume text, already cut to the token budget
+        direct_extraction_data: Data from direct extraction
+        provider_name: LLM provider the messages are sent to
+
+    Returns:
+        List[Dict[str, Any]]: System, user and (for Anthropic) prefill messages
+    """
+    content = create_llm_prompt(truncated_text, direct_extraction_data)
+    logger.debug("LLM prompt created", prompt_length=len(content))
+
+    # Create request with proper message order and prefilling
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": content}
+    ]
+
+    # Add prefilling for Anthropic to force JSON output
+    if provider_name == "anthropic":
+        messages.append({"role": "assistant", "content": "{"})
+    return messages
+
+
+class _JsonObjectScanner:
+    """Tracks brace depth over streamed text to find where the top-level object ends.
+
+    Braces inside JSON strings (including escaped quotes) are ignored.
+    """
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, chunk: str) -> int:
+        """Scan a chunk of text.
+
+        Only braces, quotes and backslashes can change the state, so the
+        scan jumps between them instead of stepping through every character.
+
+        Returns:
+            int: Index just past the closing brace of the top-level object
+            within chunk, or -1 if the object is not closed yet
+        """
+        if not chunk:
+            return -1
+        # Characters before this index were consumed by an escape
+        skip = 0
+        if self.escaped:
+            self.escaped = False
+            skip = 1
+        for match in _JSON_STRUCTURE_RE.finditer(chunk):
+            i = match.start()
+            if i < skip:
+                continue
+            ch = match.group()
+            if self.in_string:
+                if ch == "\\":
+                    skip = i + 2
+                    # The escaped character is in the next chunk
+                    self.escaped = skip > len(chunk)
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                if self.started:
+                    self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
+async def stream_json_completion(
+    provider: BaseProvider,
+    request: Dict[str, Any],
+    api_key: str,
+    provider_name: str
+) -> str:
+    """Stream a completion and return it once the top-level JSON object closes.
+
+    Anything the model would generate after the object is never downloaded,
+    and the scan runs while tokens are still arriving.
+
+    Args:
+        provider: Provider to stream from
+        request: Completion request
+        api_key: Provider API key
+        provider_name: LLM provider name
+
+    Returns:
+        str: Completion text, with the Anthropic prefill restored
+    """
+    scanner = _JsonObjectScanner()
+    chunks: List[str] = []
+    # The prefilled "{" is part of the object but usually not of the streamed output
+    restore_prefill = provider_name == "anthropic"
+
+    stream = provider.generate_stream(request, api_key=api_key)
+    try:
+        async for chunk in stream:
+            if restore_prefill and chunk.strip():
+                restore_prefill = False
+                if not chunk.lstrip().startswith("{"):
+                    chunks.append("{")
+                    scanner.feed("{")
+                    logger.debug("Prepended '{' to Anthropic response")
+            end = scanner.feed(chunk)
+            if end != -1:
+                chunks.append(chunk[:end])
+                logger.debug("JSON object complete, closing LLM stream")
+                break
+            chunks.append(chunk)
+    finally:
+        await stream.aclose()
+    return "".join(chunks)
+
+
+def extract_response_content(provider_name: str, response: Dict[str, Any]) -> str:
+    """Get the completion text from a raw provider response.
+
+    Args:
+        provider_name: LLM provider that produced the response
+        response: Raw OpenAI chat completion or Anthropic message
+
+    Returns:
+        str: Completion text, with the Anthropic prefill restored
+    """
+    if provider_name == "openai":
+        content = response["choices"][0]["message"]["content"]
+        logger.debug("OpenAI response content extracted",
+                    content_length=len(content),
+                    content_preview=content[:200] + "..." if len(content) > 200 else content)
+    else:  # anthropic
+        content = response["content"][0]["text"]
+        # If we prefilled with "{", the response will start where we left off
+        # So we need to prepend the "{" back
+        if not content.strip().startswith("{"):
+            content = "{" + content
+            logger.debug("Prepended '{' to Anthropic response")
+    return content
+
+
+def finalize_resume_data(
+    text: str,
+    direct_extraction_data: Dict[str, Any],
+    parsed_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Normalize and anonymize parsed LLM data.
 
     Args:
         text: Raw text from PDF
-        direct_extraction_data: Data from direct extraction (now empty by design)
+        direct_extraction_data: Data from direct extraction
+        parsed_data: Output of parse_llm_response
 
     Returns:
-        str: Prompt for LLM
+        Dict[str, Any]: Resume data ready for evaluation
+    """
+    # Normalize parsed data for Unicode and minor unit fixes
+    normalized = normalize_resume_data(text, parsed_data)
+
+    # Merge with direct extraction data for any fields that might be missing
+    merged_data = merge_resume_data(direct_extraction_data, normalized)
+
+    logger.info("LLM parsing successful",
+               total_fields=sum([
+                   bool(merged_data.get("personal_info", {}).get("name")),
+                   len(merged_data.get("education", [])),
+                   len(merged_data.get("experience", [])),
+                   len(merged_data.get("skills", [])),
+                   len(merged_data.get("projects", [])),
+                   len(merged_data.get("additional_sections", {}))
+               ]))
+
+    # Remove personal_info to maintain anonymity in evaluation
+    if "personal_info" in merged_data:
+        logger.debug("Removing personal_info to maintain evaluation anonymity")
+        del merged_data["personal_info"]
+    return merged_data
+
+
+async def parse_many_with_llm(
+    items: List[Tuple[str, Dict[str, Any]]],
+    provider_name: str,
+    model_name: str,
+    max_concurrency: int = 32
+) -> List[Dict[str, Any]]:
+    """Parse several resumes with the LLM concurrently.
+
+    Requests overlap on the network up to max_concurrency at a time and share
+    one provider instance.
+
+    Args:
+        items: (text, direct_extraction_data) pairs
+        provider_name: LLM provider to use
+        model_name: LLM model to use
+        max_concurrency: Maximum number of in-flight LLM calls
+
+    Returns:
+        List[Dict[str, Any]]: Parsed data for each item, in input order
     """
-    prompt = f"""
+    provider = ProviderFactory.get_provider(provider_name, timeout=float(settings.llm_timeout))
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _parse_one(text: str, direct_extraction_data: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await parse_with_llm(text, direct_extraction_data, provider_name, model_name, provider=provider)
+
+    logger.info("Parsing resumes with LLM", count=len(items), max_concurrency=max_concurrency)
+    # parse_with_llm falls back to the direct extraction data on failure, so one bad resume
+    # does not cancel the rest
+    return await asyncio.gather(*(_parse_one(text, direct) for text, direct in items))
+
+
+SYSTEM_PROMPT = "You are an expert resume parser. Output ONLY valid JSON. No explanations, no text before or after the JSON."
+
+# Schema and rules for resume parsing; create_llm_prompt appends the resume text
+_PROMPT_PREFIX = """
 Parse the following resume text into a structured JSON format that follows this schema:
 
 ```json
-{{
-  "personal_info": {{
+{
+  "personal_info": {
     "type": "object",
-    "properties": {{
-      "name": {{"type": ["string", "null"]}},
-      "email": {{"type": ["string", "null"]}},
-      "phone": {{"type": ["string", "null"]}},
-      "location": {{"type": ["string", "null"]}}
-    }}
-  }},
-  "education": {{
+    "properties": {
+      "name": {"type": ["string", "null"]},
+      "email": {"type": ["string", "null"]},
+      "phone": {"type": ["string", "null"]},
+      "location": {"type": ["string", "null"]}
+    }
+  },
+  "education": {
     "type": "array",
-    "items": {{
+    "items": {
       "type": "object",
-      "properties": {{
-        "institution": {{"type": "string"}},
-        "degree": {{"type": ["string", "null"]}},
-        "field": {{"type": ["string", "null"]}},
-        "period": {{"type": ["string", "null"]}},
-        "description": {{"type": ["string", "null"]}}
-      }}
-    }}
-  }},
-  "experience": {{
+      "properties": {
+        "institution": {"type": "string"},
+        "degree": {"type": ["string", "null"]},
+        "field": {"type": ["string", "null"]},
+        "period": {"type": ["string", "null"]},
+        "description": {"type": ["string", "null"]}
+      }
+    }
+  },
+  "experience": {
     "type": "array",
-    "items": {{
+    "items": {
       "type": "object",
-      "properties": {{
-        "organization": {{"type": "string"}},
-        "role": {{"type": ["string", "null"]}},
-        "period": {{"type": ["string", "null"]}},
-        "location": {{"type": ["string", "null"]}},
-        "description": {{"type": ["string", "null"]}}
-      }}
-    }}
-  }},
-  "skills": {{
+      "properties": {
+        "organization": {"type": "string"},
+        "role": {"type": ["string", "null"]},
+        "period": {"type": ["string", "null"]},
+        "location": {"type": ["string", "null"]},
+        "description": {"type": ["string", "null"]}
+      }
+    }
+  },
+  "skills": {
     "type": "array",
-    "items": {{"type": "string"}}
-  }},
-  "projects": {{
+    "items": {"type": "string"}
+  },
+  "projects": {
     "type": "array",
-    "items": {{
+    "items": {
       "type": "object",
-      "properties": {{
-        "name": {{"type": ["string", "null"]}},
-        "description": {{"type": ["string", "null"]}},
-        "technologies": {{"type": "array", "items": {{"type": "string"}}}},
-        "url": {{"type": ["string", "null"]}}
-      }}
-    }}
-  }},
-  "additional_sections": {{
+      "properties": {
+        "name": {"type": ["string", "null"]},
+        "description": {"type": ["string", "null"]},
+        "technologies": {"type": "array", "items": {"type": "string"}},
+        "url": {"type": ["string", "null"]}
+      }
+    }
+  },
+  "additional_sections": {
     "type": "object",
     "description": "Any other resume sections like a cover letter, publications, awards, certifications, languages, etc."
-  }}
-}}
+  }
+}
 ```
 
 REQUIREMENTS:
@@ -246,75 +481,240 @@ REQUIREMENTS:
 6. Use the main keys defined above. Put any sections that don't fit (like publications, awards, certifications, languages, etc.) in "additional_sections" as key-value pairs.
 
 RESUME TEXT:
-{text}
 """
-    return prompt
 
 
-def parse_llm_response(response_text: str) -> Dict[str, Any]:
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a model-specific tokenizer.
+
+    ASCII text averages about four characters per token for both OpenAI and
+    Anthropic tokenizers; accented and non-Latin characters are counted as a
+    token each, which keeps the estimate conservative for Unicode-heavy resumes.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        int: Estimated number of tokens
+    """
+    if text.isascii():
+        return -(-len(text) // ASCII_CHARS_PER_TOKEN)
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return -(-ascii_chars // ASCII_CHARS_PER_TOKEN) + (len(text) - ascii_chars)
+
+
+def compact_resume_text(text: str) -> str:
+    """Strip layout whitespace from extracted resume text before prompting.
+
+    PDF extraction keeps column padding and blank lines that cost input tokens
+    without helping the model. Lines are trimmed, inner runs of spaces and tabs
+    collapsed, and blank lines dropped.
+
+    Args:
+        text: Raw text from PDF
+
+    Returns:
+        str: Compacted text
+    """
+    lines = (_INLINE_SPACE_RE.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def truncate_to_token_budget(text: str, max_tokens: int) -> str:
+    """Cut text so its estimated token count fits within max_tokens.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+
+    Returns:
+        str: The original text if it fits, otherwise its longest fitting prefix (approximately)
+    """
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+    # Cut proportionally, then shrink until the estimate fits
+    cut = len(text) * max_tokens // tokens
+    while cut > 0 and estimate_tokens(text[:cut]) > max_tokens:
+        cut = cut * 19 // 20
+    return text[:cut]
+
+
+def truncate_resume_text(text: str, max_tokens: int) -> str:
+    """Fit resume text to a token budget without dropping whole sections.
+
+    A plain prefix cut can lose everything after the first long section (often
+    all of the experience). Instead, the text is split at section headings and
+    every section is capped at the same token count, chosen so the total fits:
+    short sections (name, skills) stay whole and only the long ones are cut.
+    Each section keeps its heading and first lines, which on a resume are the
+    most recent entries. Cuts fall on line boundaries.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+
+    Returns:
+        str: The original text if it fits, otherwise a shortened version
+    """
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+
+    starts = [m.start() for m in _SECTION_RE.finditer(text)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    bounds = starts + [len(text)]
+    sections = [text[bounds[i]:bounds[i + 1]] for i in range(len(starts))]
+
+    # Find the largest per-section cap that keeps the total within the budget
+    sizes = [estimate_tokens(section) for section in sections]
+    remaining = max_tokens
+    cap = max_tokens
+    for count, size in enumerate(sorted(sizes)):
+        left = len(sizes) - count
+        if size * left > remaining:
+            cap = remaining // left
+            break
+        remaining -= size
+
+    parts = []
+    for section, size in zip(sections, sizes):
+        if size <= cap:
+            parts.append(section)
+            continue
+        part = truncate_to_token_budget(section, cap)
+        # Drop the partial last line
+        newline = part.rfind("\n")
+        parts.append(part[:newline + 1] if newline != -1 else part)
+    return "".join(parts)
+
+
+def create_llm_prompt(text: str, direct_extraction_data: Dict[str, Any]) -> str:
+    """Create prompt for LLM resume parsing.
+
+    The schema and rules are a constant prefix, so prompts only differ in
+    the resume text. Together with the system prompt the prefix is well
+    under the providers' minimum cacheable length (1024 tokens, 2048 for
+    Haiku), so no prompt caching is requested.
+
+    Args:
+        text: Raw text from PDF
+        direct_extraction_data: Data from direct extraction (now empty by design)
+
+    Returns:
+        str: Prompt for LLM
+    """
+    return _PROMPT_PREFIX + text + "\n"
+
+
+def _parse_bare_json(response_text: str) -> Optional[Any]:
+    stripped = response_text.strip()
+    if not (stripped.startswith('{') and stripped.endswith('}')):
+        return None
+    try:
+        return orjson.loads(stripped)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _content_length(data: Any, limit: Optional[int] = None) -> int:
+    """Total length of the stripped strings anywhere in a parsed JSON structure.
+
+    With a limit, the walk stops as soon as the total reaches it, so the
+    result is exact only when it is below the limit.
+    """
+    total = 0
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            total += len(value.strip())
+            if limit is not None and total >= limit:
+                return total
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return total
+
+
+def _repair_json(json_str: str) -> Optional[Dict[str, Any]]:
+    try:
+        repaired = json_repair.loads(json_str)
+    except Exception:
+        return None
+    if isinstance(repaired, dict) and repaired:
+        return repaired
+    return None
+
+
+def parse_llm_response(response_text: str) -> Tuple[Dict[str, Any], bool]:
     """Parse LLM response into structured data.
 
     Args:
         response_text: Text response from LLM
 
     Returns:
-        Dict[str, Any]: Structured resume data
+        Tuple[Dict[str, Any], bool]: Structured resume data, and whether it
+            came from repairing malformed JSON. Repaired output may have lost
+            content, so callers should not cache it.
     """
     try:
         logger.debug("Starting LLM response parsing", response_length=len(response_text))
 
-        # First, try to extract JSON from code blocks
-        json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1).strip()
-            logger.debug("Found JSON in code block", json_length=len(json_str))
-        else:
-            logger.debug("No code block found, looking for raw JSON")
-            # Try to find JSON object boundaries
-            # Look for the first { and find its matching }
-            start_idx = response_text.find('{')
-            if start_idx == -1:
-                logger.error("No JSON object found in response",
-                            response_preview=response_text[:200] + "..." if len(response_text) > 200 else response_text)
-                raise ValueError("No JSON object found in response")
-
-            # Find the matching closing brace
-            brace_count = 0
-            end_idx = start_idx
-            for i in range(start_idx, len(response_text)):
-                if response_text[i] == '{':
-                    brace_count += 1
-                elif response_text[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end_idx = i + 1
-                        break
-
-            if brace_count != 0:
-                # If we can't find matching braces, try to parse the whole thing
-                logger.warning("Could not find matching braces",
-                              unmatched_braces=brace_count,
-                              text_length=len(response_text))
-                json_str = response_text.strip()
+        # Used for error previews; narrowed to the fenced block when one is found
+        json_str = response_text
+        repaired = False
+
+        try:
+            # The system prompt and Anthropic prefill usually yield bare JSON, so try
+            # that directly before searching for a code fence
+            parsed_data = _parse_bare_json(response_text)
+            if parsed_data is not None:
+                logger.debug("Parsed bare JSON response")
             else:
-                json_str = response_text[start_idx:end_idx]
-                logger.debug("Extracted JSON by brace matching",
-                            json_length=len(json_str),
-                            start_idx=start_idx,
-                            end_idx=end_idx)
-
-        # Clean up the JSON string
-        json_str = json_str.strip()
-
-        # Log a preview if parsing is about to fail
-        if not json_str.startswith('{') or not json_str.endswith('}'):
-            logger.warning("JSON extraction may fail - invalid boundaries",
-                          starts_with_brace=json_str.startswith('{'),
-                          ends_with_brace=json_str.endswith('}'),
-                          preview=json_str[:100] + "..." if len(json_str) > 100 else json_str)
-
-        # Parse JSON
-        parsed_data = json.loads(json_str)
+                # Otherwise, try to extract JSON from code blocks
+                json_match = _JSON_BLOCK_RE.search(response_text)
+                if json_match:
+                    json_str = json_match.group(1).strip()
+                    logger.debug("Found JSON in code block", json_length=len(json_str))
+
+                    # Log a preview if parsing is about to fail
+                    if not json_str.startswith('{') or not json_str.endswith('}'):
+                        logger.warning("JSON extraction may fail - invalid boundaries",
+                                      starts_with_brace=json_str.startswith('{'),
+                                      ends_with_brace=json_str.endswith('}'),
+                                      preview=json_str[:100] + "..." if len(json_str) > 100 else json_str)
+
+                    parsed_data = orjson.loads(json_str)
+                else:
+                    logger.debug("No code block found, looking for raw JSON")
+                    # Parse from the first { and let the decoder find where the object ends
+                    start_idx = response_text.find('{')
+                    if start_idx == -1:
+                        logger.error("No JSON object found in response",
+                                    response_preview=response_text[:200] + "..." if len(response_text) > 200 else response_text)
+                        raise ValueError("No JSON object found in response")
+
+                    json_str = response_text[start_idx:]
+                    parsed_data, end_idx = _DECODER.raw_decode(response_text, start_idx)
+                    logger.debug("Extracted JSON with raw_decode",
+                                json_length=end_idx - start_idx,
+                                start_idx=start_idx,
+                                end_idx=end_idx)
+        except json.JSONDecodeError as e:
+            # Known LLM breakage (trailing commas, unterminated strings, cut-off
+            # output) is usually repairable; that beats another LLM round-trip
+            parsed_data = _repair_json(json_str)
+            if parsed_data is None:
+                raise
+            repaired = True
+            logger.warning("Repaired malformed LLM JSON",
+                          json_repair_used=True,
+                          error=str(e),
+                          json_length=len(json_str))
+
         logger.debug("JSON parsed successfully", keys=list(parsed_data.keys()))
 
         # Basic validation - just check for expected keys and non-empty content
@@ -323,21 +723,7 @@ def parse_llm_response(response_text: str) -> Dict[str, Any]:
         if missing_keys:
             logger.warning("Parsed JSON missing expected keys", missing_keys=list(missing_keys))
 
-        # Check if we have meaningful content by measuring total data length
-        def get_content_length(data):
-            """Recursively calculate the total content length in the data structure."""
-            if isinstance(data, str):
-                return len(data.strip())
-            elif isinstance(data, dict):
-                return sum(get_content_length(v) for v in data.values() if v is not None)
-            elif isinstance(data, list):
-                return sum(get_content_length(item) for item in data)
-            else:
-                return 0
-
-        total_content_length = get_content_length(parsed_data)
-
-        # Also count non-empty fields
+        # Count non-empty fields
         non_empty_fields = 0
         if parsed_data.get("personal_info", {}).get("name"):
             non_empty_fields += 1
@@ -349,6 +735,13 @@ def parse_llm_response(response_text: str) -> Dict[str, Any]:
         non_empty_fields += len(parsed_data.get("projects", []))
         non_empty_fields += len(parsed_data.get("additional_sections", {}))
 
+        # Check if we have meaningful content by measuring data length; the walk
+        # stops once the threshold is met, and is skipped (None) when too few
+        # fields have data
+        total_content_length = None
+        if non_empty_fields >= MIN_NON_EMPTY_FIELDS:
+            total_content_length = _content_length(parsed_data, limit=MIN_CONTENT_LENGTH)
+
         # Log detailed content analysis
         logger.debug("Content analysis",
                     total_content_length=total_content_length,
@@ -358,17 +751,17 @@ def parse_llm_response(response_text: str) -> Dict[str, Any]:
                     experience_count=len(parsed_data.get("experience", [])),
                     skills_count=len(parsed_data.get("skills", [])))
 
-        # Fail if total content is too short or too few fields have data
-        # A reasonable resume should have at least 100 chars of content and 3+ non-empty fields
-        if total_content_length < 100 or non_empty_fields < 3:
+        # Fail if too few fields have data or total content is too short
+        if total_content_length is None or total_content_length < MIN_CONTENT_LENGTH:
             logger.error("Parsed JSON has insufficient content - treating as parsing failure",
                         content_length=total_content_length,
                         non_empty_fields=non_empty_fields,
                         parsed_data_preview=str(parsed_data)[:500] + "..." if len(str(parsed_data)) > 500 else str(parsed_data))
-            raise ValueError(f"LLM returned insufficient resume data (content_length={total_content_length}, fields={non_empty_fields})")
+            measured = "not measured" if total_content_length is None else total_content_length
+            raise ValueError(f"LLM returned insufficient resume data (content_length={measured}, fields={non_empty_fields})")
 
         # Return the raw parsed data - no Pydantic validation
-        return parsed_data
+        return parsed_data, repaired
 
     except json.JSONDecodeError as e:
         logger.error("JSON parsing failed",
@@ -378,7 +771,7 @@ def parse_llm_response(response_text: str) -> Dict[str, Any]:
                     json_preview=json_str[:500] + "..." if len(json_str) > 500 else json_str,
                     response_preview=response_text[:200] + "..." if len(response_text) > 200 else response_text)
         # Return empty structure if parsing fails
-        return {}
+        return {}, False
     except Exception as e:
         logger.error("Failed to parse LLM response",
                     error=str(e),
@@ -386,7 +779,7 @@ def parse_llm_response(response_text: str) -> Dict[str, Any]:
                     json_str_length=len(json_str) if 'json_str' in locals() else None,
                     response_text_length=len(response_text))
         # Return empty structure if parsing fails
-        return {}
+        return {}, False
 
 
 def merge_resume_data(direct_data: Dict[str, Any], llm_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -408,76 +801,102 @@ def merge_resume_data(direct_data: Dict[str, Any], llm_data: Dict[str, Any]) ->
 # Normalization utilities
 # ----------------------
 
+# Spacing acute accent U+00B4 before a vowel → precomposed accented vowel
+_ACUTE_RE = re.compile("\u00b4([aeiouAEIOU])")
+_ACUTE_MAP = {
+    "a": "á", "e": "é", "i": "í", "o": "ó", "u": "ú",
+    "A": "Á", "E": "É", "I": "Í", "O": "Ó", "U": "Ú",
+}
+
+
+# Numbers written as percentages in the original text, and bare numbers in parsed lines
+_PERCENT_NUM_RE = re.compile(r"(\d{1,3})%")
+_BARE_NUM_RE = re.compile(r"\b(\d{1,3})(?=\b(?!%))\b(?!\s*%)")
+
+
+def _replace_acute(match: "re.Match[str]") -> str:
+    return _ACUTE_MAP[match.group(1)]
+
+
 def _normalize_string(value: str) -> str:
     if not isinstance(value, str):
         return value
+    # ASCII has nothing to compose or accent-fix; only collapse whitespace.
+    # split/join is ~5x faster than re.sub(r"\s+", ...) on resume-sized strings.
+    if value.isascii():
+        return " ".join(value.split())
     # Unicode normalization first
     normalized = unicodedata.normalize("NFC", value)
-    # Fix spacing acute accent U+00B4 before vowels → precomposed accented vowels
-    replacements = {
-        "´a": "á", "´e": "é", "´i": "í", "´o": "ó", "´u": "ú",
-        "´A": "Á", "´E": "É", "´I": "Í", "´O": "Ó", "´U": "Ú",
-    }
-    for seq, rep in replacements.items():
-        normalized = normalized.replace(seq, rep)
+    # Fix spacing acute accents in one pass, only when one is present. Translating
+    # U+00B4 to combining U+0301 and re-running NFC would not work: a combining
+    # mark attaches to the character before it, not the vowel after it.
+    if "\u00b4" in normalized:
+        normalized = _ACUTE_RE.sub(_replace_acute, normalized)
     # Collapse excessive internal whitespace
     normalized = " ".join(normalized.split())
     return normalized
 
 
-def _walk_and_normalize(obj: Any) -> Any:
-    if isinstance(obj, dict):
-        return {k: _walk_and_normalize(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_walk_and_normalize(v) for v in obj]
+def _fix_percent(line: str, percent_numbers: Set[str]) -> str:
+    # Append % to the first bare number that appears as a percentage in the original text
+    if "%" in line:
+        return line
+    m = _BARE_NUM_RE.search(line)
+    if m and m.group(1) in percent_numbers:
+        num = m.group(1)
+        line = line.replace(num, num + "%", 1)
+    return line
+
+
+def _walk_and_normalize(obj: Any, percent_numbers: Optional[Set[str]] = None) -> Any:
     if isinstance(obj, str):
         return _normalize_string(obj)
+    if not isinstance(obj, (dict, list)):
+        return obj
+    # Containers are updated in place, walked with an explicit stack. Entries carry
+    # where the container sits on the path to experience[].responsibilities, the
+    # only lists that get the percent fix: "root", "experience", "entry",
+    # "responsibilities", or None anywhere else.
+    stack = [(obj, "root")]
+    while stack:
+        container, role = stack.pop()
+        fix_percent = role == "responsibilities"
+        entries = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in entries:
+            if isinstance(value, str):
+                new = _normalize_string(value)
+                if fix_percent:
+                    new = _fix_percent(new, percent_numbers)
+                if new is not value:
+                    container[key] = new
+            elif isinstance(value, list):
+                if role == "root" and key == "experience":
+                    stack.append((value, "experience"))
+                elif role == "entry" and key == "responsibilities" and percent_numbers:
+                    stack.append((value, "responsibilities"))
+                else:
+                    stack.append((value, None))
+            elif isinstance(value, dict):
+                stack.append((value, "entry" if role == "experience" else None))
     return obj
 
 
-def _maybe_fix_percent_units(original_text: str, parsed: Dict[str, Any]) -> None:
-    # Guard: only attempt for responsibilities lists
-    if not isinstance(parsed, dict):
-        return
-    text = original_text or ""
-    # Build a small index of percents present in original
-    # e.g., find numbers followed by % and cache as strings
-    import re
-    percent_numbers = set(re.findall(r"(\d{1,3})%", text))
-
-    exp_list = parsed.get("experience", []) if isinstance(parsed.get("experience"), list) else []
-    for exp in exp_list:
-        if not isinstance(exp, dict):
-            continue
-        responsibilities = exp.get("responsibilities", [])
-        if not isinstance(responsibilities, list):
-            continue
-        fixed = []
-        for line in responsibilities:
-            if isinstance(line, str):
-                m = re.search(r"\b(\d{1,3})(?=\b(?!%))\b(?!\s*%)", line)
-                if m and m.group(1) in percent_numbers and "%" not in line:
-                    # Append % to the number occurrence conservatively
-                    num = m.group(1)
-                    line = line.replace(num, num + "%", 1)
-            fixed.append(line)
-        exp["responsibilities"] = fixed
-
-
 def normalize_resume_data(original_text: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize Unicode and minor unit formatting without removing diacritics.
-    Also conservatively add % symbol when the original text contains the same number followed by %.
+    Also conservatively add % symbol to experience responsibilities when the original text contains the same number followed by %.
+    Dict input is normalized in place, in a single walk, and returned.
     """
     # If it's already a dict, use it directly. Otherwise try to convert
     if isinstance(data, dict):
         as_dict = data
     else:
         try:
-            as_dict = data.dict()
+            as_dict = data.model_dump()
         except Exception:
             return data
-    # Unicode/whitespace normalization across the structure
-    normalized = _walk_and_normalize(as_dict)
-    # Minor percent fix based on original text context
-    _maybe_fix_percent_units(original_text, normalized.get("parsed_resume", normalized))
-    return normalized
+    # Numbers written as percentages in the original; nothing to restore without a % sign
+    percent_numbers = None
+    if original_text and "%" in original_text:
+        percent_numbers = set(_PERCENT_NUM_RE.findall(original_text))
+    # Unicode/whitespace normalization and percent fix across the structure
+    return _walk_and_normalize(as_dict, percent_numbers)
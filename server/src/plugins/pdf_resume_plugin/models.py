@@ -5,12 +5,14 @@ This module defines the data models used by the PDF resume parser.
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PersonalInfo(BaseModel):
     """Personal information from a resume."""
     
+    model_config = ConfigDict(frozen=True)
+    
     name: Optional[str] = Field(None, description="Full name of the candidate")
     email: Optional[str] = Field(None, description="Email address")
     phone: Optional[str] = Field(None, description="Phone number")
@@ -20,6 +22,8 @@ class PersonalInfo(BaseModel):
 class Education(BaseModel):
     """Education entry from a resume."""
     
+    model_config = ConfigDict(frozen=True)
+    
     institution: Optional[str] = Field(None, description="Name of the educational institution")
     degree: Optional[str] = Field(None, description="Degree earned or program of study")
     period: Optional[str] = Field(None, description="Time period of study")
@@ -29,6 +33,8 @@ class Education(BaseModel):
 class Experience(BaseModel):
     """Work experience entry from a resume."""
     
+    model_config = ConfigDict(frozen=True)
+    
     company: Optional[str] = Field(None, description="Company name")
     title: Optional[str] = Field(None, description="Job title")
     period: Optional[str] = Field(None, description="Employment period")
@@ -38,6 +44,8 @@ class Experience(BaseModel):
 class Skill(BaseModel):
     """Skill entry from a resume."""
     
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Skill name")
     level: Optional[str] = Field(None, description="Skill level or proficiency")
 
@@ -45,6 +53,8 @@ class Skill(BaseModel):
 class Project(BaseModel):
     """Project entry from a resume."""
     
+    model_config = ConfigDict(frozen=True)
+    
     name: Optional[str] = Field(None, description="Project name")
     description: Optional[str] = Field(None, description="Project description")
     technologies: List[str] = Field(default_factory=list, description="Technologies used")
@@ -54,6 +64,8 @@ class Project(BaseModel):
 class Language(BaseModel):
     """Language proficiency entry from a resume."""
     
+    model_config = ConfigDict(frozen=True)
+    
     language: str = Field(..., description="Language name")
     proficiency: Optional[str] = Field(None, description="Proficiency level")
 
@@ -61,6 +73,8 @@ class Language(BaseModel):
 class ResumeData(BaseModel):
     """Structured resume data."""
     
+    model_config = ConfigDict(frozen=True)
+    
     personal_info: PersonalInfo = Field(default_factory=PersonalInfo, description="Basic contact information")
     education: List[Education] = Field(default_factory=list, description="Education history")
     experience: List[Experience] = Field(default_factory=list, description="Work experience")
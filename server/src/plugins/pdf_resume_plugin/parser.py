@@ -4,103 +4,398 @@ PDF resume parsing functionality.
 This module handles parsing resume text into structured data.
 """
 
+import asyncio
 import re
-from typing import List
+import sys
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import xxhash
 
 from src.utils.logging import get_structured_logger
 
 from .models import ResumeData, PersonalInfo, Education, Experience, Project, Language
-from .extractor import extract_section
+from .extractor import PDF_POOL_MAX_WORKERS, discard_pdf_pool, get_pdf_pool, split_all_sections
 
 logger = get_structured_logger(__name__)
 
+# Strings up to this length from small vocabularies (degrees, languages,
+# proficiency levels) are interned so batches share one copy of each
+INTERN_MAX_LENGTH = 32
+
+# Sections (with alternate headings) that direct extraction cannot do without
+_REQUIRED_SECTIONS = (
+    ("education",),
+    ("experience", "employment", "work"),
+    ("skills", "technical skills"),
+)
+
+# Parsed resumes kept for repeat parses of the same text
+PARSE_CACHE_SIZE = 256
+_PARSE_CACHE: "OrderedDict[bytes, ResumeData]" = OrderedDict()
+
+# Patterns are compiled once at import instead of on every extractor call
+# Header lines that hold contact details or a document title, not a name
+_NAME_REJECT_RE = re.compile(r'@|http|\.com|resume|cv', re.IGNORECASE)
+# Email, phone and city/state location (e.g., "San Francisco, CA") in one
+# alternation, so contact details are found in a single pass over the text.
+# The city is at most four words on one line; an unbounded [a-zA-Z\s]+
+# backtracked through every split of long capitalized lines. The state code
+# must not be the start of an email ("Berlin, JD@foo.com"), or the location
+# would consume it.
+_CONTACT_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<phone>\b(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b)'
+    r'|(?P<location>\b[A-Z][a-zA-Z]*(?:[ \t]+[A-Za-z]+){0,3},\s+[A-Z]{2}\b(?![\w.%+-]*@))'
+)
+# Same pattern for ASCII-only text; re matches bytes slightly faster than str
+_CONTACT_RE_BYTES = re.compile(_CONTACT_RE.pattern.encode('ascii'))
+_DEGREE_RES = [
+    re.compile(
+        r'(?:Bachelor|Master|Ph\.?D\.?|B\.S\.|M\.S\.|M\.B\.A\.|B\.A\.|M\.A\.|B\.Tech|M\.Tech)[\s\.]+'
+        r'(?:of|in|on)?[\s\.]+'
+        r'(?:Science|Arts|Engineering|Business|Administration|Technology|Computer Science|[A-Za-z\s]+)',
+        re.IGNORECASE
+    ),
+    re.compile(
+        r'(?:BS|MS|BA|MA|MBA|PhD)[\s\.]+'
+        r'(?:in|on)?[\s\.]+'
+        r'(?:[A-Za-z\s]+)',
+        re.IGNORECASE
+    ),
+]
+_TITLE_RES = [
+    re.compile(
+        r'(?:Senior|Junior|Lead|Principal|Staff|Chief|Director|Manager|Engineer|Developer|Analyst|Consultant|Intern|Associate)\s+'
+        r'(?:[A-Za-z\s]+)',
+        re.IGNORECASE
+    ),
+]
+_DATE_RE = re.compile(r'(?:19|20)\d{2}\s*(?:-|–|to)\s*(?:(?:19|20)\d{2}|present|current|now)', re.IGNORECASE)
+# Bullet markers: "-" and "*" only at the start of a line (inside a line they
+# are dates and compound words), "•" anywhere since pdfminer often puts a
+# whole list on one line ("Python • Java • SQL")
+_BULLET_MARKER_RE = re.compile(r'^[ \t]*[\-*][ \t]*|[ \t]*•[ \t]*', re.MULTILINE)
+# A sentence runs to a terminal mark followed by whitespace, or to the end
+_SENTENCE_RE = re.compile(r'(?=\S).*?(?:[.!?](?=\s)|\Z)', re.DOTALL)
+_URL_RE = re.compile(r'https?://[^\s]+')
+# Only the label is matched; the list runs to the next blank line
+_TECH_LABEL_RE = re.compile(r'(?:Technologies|Tech Stack|Tools|Built with):', re.IGNORECASE)
+# "Language: level", else "Language - level", else "Language (level)". Each
+# alternative captures (language, proficiency) as consecutive groups, so the
+# last group matched is the proficiency and the one before it the language.
+_LANGUAGE_LINE_RE = re.compile(
+    r'([^:]*):(.*)'
+    r'|([^-]*)-(.*)'
+    r'|(.*?)\s*\((.*?)\)'
+)
+_SKILLS_HEADING_RE = re.compile(r'^skills|^technical\s+skills', re.IGNORECASE)
+_LANGUAGES_HEADING_RE = re.compile(r'^languages', re.IGNORECASE)
+_PARA_SPLIT_RE = re.compile(r'\n\s*\n')
+# Look for year patterns like "2018-2022" or "2018 - Present"
+_YEAR_SPLIT_RE = re.compile(r'\n(?=.*\b(?:19|20)\d{2}\b)')
+# Entry starts at lines beginning with a bullet. A single C-level split is
+# about twice as fast as walking the lines and testing line[:1] against a
+# set of bullet characters, so the regex is kept for this line-start test.
+_BULLET_SPLIT_RE = re.compile(r'\n(?=[•\-*])')
+
+
+def _iter_bullets(text: str) -> Iterator[str]:
+    """Yield the text of each bullet point in a block.
+    
+    A bullet runs until the next marker or a blank line. Splitting on the
+    markers is a single linear pass, where a lazy match with a
+    bullet-or-paragraph lookahead backtracks on long lists. Hyphens inside
+    a line (dates, compound words) do not start a bullet, but "•" does, and
+    the text before the first inline "•" on its line is the first item of
+    that list.
+    
+    Args:
+        text: Block of text that may contain bullet points
+        
+    Yields:
+        str: Stripped, non-empty bullet text
+    """
+    parts = _BULLET_MARKER_RE.split(text)
+    if len(parts) > 1:
+        lead = parts[0].rsplit('\n', 1)[-1].strip()
+        if lead:
+            yield lead
+    for part in parts[1:]:
+        bullet = part.split('\n\n', 1)[0].strip()
+        if bullet:
+            yield bullet
+
+
+def _intern_short(value: str) -> str:
+    """Intern a stripped value if it is short enough to be a vocabulary term."""
+    value = value.strip()
+    return sys.intern(value) if len(value) <= INTERN_MAX_LENGTH else value
+
+
+def _remove_first_occurrences(text: str, parts: Iterable[Optional[str]]) -> str:
+    """Remove the first occurrence of each part from text.
+    
+    Chained str.replace(part, '', 1) calls copy the whole string once per
+    part; locating every part first lets the result be built in one join.
+    
+    Args:
+        text: Text to remove parts from
+        parts: Substrings to remove; empty or None parts are ignored
+        
+    Returns:
+        str: Text without the parts
+    """
+    spans = []
+    for part in parts:
+        if part:
+            start = text.find(part)
+            if start >= 0:
+                spans.append((start, start + len(part)))
+    if not spans:
+        return text
+    
+    pieces = []
+    pos = 0
+    for start, end in sorted(spans):
+        if start > pos:
+            pieces.append(text[pos:start])
+        pos = max(pos, end)
+    pieces.append(text[pos:])
+    return ''.join(pieces)
+
+
+def _get_section(text: str, sections: Optional[Dict[str, str]], *names: str) -> Optional[str]:
+    """Return the first non-empty section among names.
+    
+    Args:
+        text: Resume text
+        sections: Sections from split_all_sections, or None to split text here
+        names: Section names to try, in order
+        
+    Returns:
+        Optional[str]: Section text or None if none was found
+    """
+    if sections is None:
+        sections = split_all_sections(text)
+    for name in names:
+        section = sections.get(name)
+        if section:
+            return section
+    return None
+
+
+def should_attempt_direct_parse(text: str, sections: Optional[Dict[str, str]] = None) -> bool:
+    """Check whether direct extraction can possibly succeed.
+    
+    needs_llm_fallback rejects any result without education, experience or
+    skills, and each of those comes from its own section. If one of the
+    sections is missing, the full parse is certain to be discarded.
+    
+    Args:
+        text: Extracted text from PDF
+        sections: Sections from split_all_sections, split from text if omitted
+        
+    Returns:
+        bool: False if direct extraction is certain to need the LLM fallback
+    """
+    if sections is None:
+        sections = split_all_sections(text)
+    return all(_get_section(text, sections, *names) for names in _REQUIRED_SECTIONS)
+
 
-def parse_resume_text(text: str) -> ResumeData:
+def parse_resume_text(text: str, sections: Optional[Dict[str, str]] = None) -> ResumeData:
     """Parse resume text into structured data.
     
     Args:
         text: Extracted text from PDF
+        sections: Sections from split_all_sections, split from text if omitted
         
     Returns:
         ResumeData: Structured resume data
     """
-    # Initialize resume data
-    resume_data = ResumeData()
-    
-    # Extract personal information
-    resume_data.personal_info = extract_personal_info(text)
+    # Split every section in one scan and hand the results to each extractor
+    if sections is None:
+        sections = split_all_sections(text)
+    # Models are frozen, so every section is extracted before construction
+    return ResumeData(
+        personal_info=extract_personal_info(text, sections),
+        education=extract_education(text, sections),
+        experience=extract_experience(text, sections),
+        skills=extract_skills(text, sections),
+        projects=extract_projects(text, sections),
+        languages=extract_languages(text, sections),
+    )
+
+
+def _parse_if_complete(text: str) -> Optional[ResumeData]:
+    """Parse resume text unless should_attempt_direct_parse rules it out.
     
-    # Extract education
-    resume_data.education = extract_education(text)
+    The gate and the parse share one split_all_sections call.
+    """
+    sections = split_all_sections(text)
+    if not should_attempt_direct_parse(text, sections):
+        return None
+    return parse_resume_text(text, sections)
+
+
+async def parse_resume_text_async(text: str, require_sections: bool = False) -> Optional[ResumeData]:
+    """Parse resume text in a worker thread, reusing earlier results.
     
-    # Extract experience
-    resume_data.experience = extract_experience(text)
+    The same resume is often re-parsed (retries, scoring one candidate
+    against several rubrics), so results are kept in a small LRU keyed on a
+    hash of the text. ResumeData being frozen does not stop callers from
+    mutating its lists, so every call gets its own deep copy.
     
-    # Extract skills
-    resume_data.skills = extract_skills(text)
+    A miss runs parse_resume_text in a thread so the regex work does not
+    block the event loop. The cache itself is only touched from the loop.
     
-    # Extract projects
-    resume_data.projects = extract_projects(text)
+    Args:
+        text: Extracted text from PDF
+        require_sections: Return None without parsing when
+            should_attempt_direct_parse fails; the check runs in the same
+            thread call and reuses the parse's section split
+        
+    Returns:
+        Optional[ResumeData]: Structured resume data, or None if
+        require_sections is set and a required section is missing
+    """
+    key = xxhash.xxh3_128_digest(text.encode('utf-8', 'surrogatepass'))
+    resume_data = _PARSE_CACHE.get(key)
+    if resume_data is not None:
+        _PARSE_CACHE.move_to_end(key)
+        return resume_data.model_copy(deep=True)
+    
+    if require_sections:
+        resume_data = await asyncio.to_thread(_parse_if_complete, text)
+        if resume_data is None:
+            return None
+    else:
+        resume_data = await asyncio.to_thread(parse_resume_text, text)
+    _PARSE_CACHE[key] = resume_data
+    if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+        _PARSE_CACHE.popitem(last=False)
+    return resume_data.model_copy(deep=True)
+
+
+class ResumeBatchParser:
+    """Parse many resumes in parallel worker processes.
+    
+    Direct extraction is pure Python and holds the GIL, so batches (e.g.
+    re-scoring every candidate in a round) are spread across processes.
+    They run in the persistent PDF worker pool shared with text extraction,
+    so a batch does not pay for starting processes, and each worker
+    compiles the module patterns once for its lifetime.
+    """
     
-    # Extract languages
-    resume_data.languages = extract_languages(text)
+    # Chunks per worker: enough to balance uneven resumes across workers
+    # while still amortizing the per-task IPC
+    CHUNKS_PER_WORKER = 4
     
-    return resume_data
+    def __init__(self, chunksize: Optional[int] = None) -> None:
+        """Initialize the batch parser.
+        
+        Args:
+            chunksize: Resumes sent to a worker per task (default: derived
+                from the batch size so every worker gets work)
+        """
+        self.chunksize = chunksize
+    
+    def parse(self, text: str) -> ResumeData:
+        """Parse a single resume in the current process."""
+        return parse_resume_text(text)
+    
+    def _chunksize(self, count: int) -> int:
+        if self.chunksize:
+            return self.chunksize
+        return max(1, -(-count // (PDF_POOL_MAX_WORKERS * self.CHUNKS_PER_WORKER)))
+    
+    def parse_many(self, texts: Sequence[str]) -> List[ResumeData]:
+        """Parse resumes in worker processes.
+        
+        If a worker died the shared pool is replaced and the batch retried
+        once.
+        
+        Args:
+            texts: Extracted resume texts
+            
+        Returns:
+            List[ResumeData]: Structured resume data, in input order
+        """
+        # Shipping one resume to a worker costs more than parsing it here
+        if len(texts) <= 1:
+            return [self.parse(text) for text in texts]
+        
+        chunksize = self._chunksize(len(texts))
+        logger.info("Parsing resume batch", count=len(texts), chunksize=chunksize)
+        pool = get_pdf_pool()
+        try:
+            return list(pool.map(parse_resume_text, texts, chunksize=chunksize))
+        except BrokenProcessPool:
+            logger.warning("Resume parsing worker died, restarting the worker pool")
+            discard_pdf_pool(pool)
+        return list(get_pdf_pool().map(parse_resume_text, texts, chunksize=chunksize))
 
 
-def extract_personal_info(text: str) -> PersonalInfo:
+def extract_personal_info(text: str, sections: Optional[Dict[str, str]] = None) -> PersonalInfo:
     """Extract personal information from resume text.
     
     Args:
         text: Resume text
+        sections: Sections from split_all_sections, split from text if omitted
         
     Returns:
         PersonalInfo: Personal information
     """
-    personal_info = PersonalInfo()
+    name = email = phone = location = None
+    
+    # Only the header (first 10 lines) is needed, so stop splitting there
+    lines = text.split('\n', 10)[:10]
     
     # Extract name from the first few lines
-    lines = text.split('\n')
     if lines:
         # Assume the name is in the first non-empty line
         for line in lines[:5]:
-            if line.strip() and not any(x in line.lower() for x in ['@', 'http', '.com', 'resume', 'cv']):
-                personal_info.name = line.strip()
+            if line.strip() and not _NAME_REJECT_RE.search(line):
+                name = line.strip()
                 break
     
-    # Extract email using regex
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_matches = re.findall(email_pattern, text)
-    if email_matches:
-        personal_info.email = email_matches[0]
-    
-    # Extract phone using regex
-    phone_pattern = r'\b(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b'
-    phone_matches = re.findall(phone_pattern, text)
-    if phone_matches:
-        personal_info.phone = phone_matches[0]
-    
     # Extract location - look for common location patterns
-    location_section = extract_section(text, "location") or extract_section(text, "address")
+    location_section = _get_section(text, sections, "location", "address")
     if location_section:
-        personal_info.location = location_section.strip()
+        location = location_section.strip()
+    
+    # Email and phone can be anywhere; a city/state location is only taken
+    # from the header (first 10 lines) when there is no location section
+    header_end = len('\n'.join(lines))
+    # Most resumes are ASCII; scanning them as bytes keeps offsets identical
+    is_ascii = text.isascii()
+    if is_ascii:
+        matches = _CONTACT_RE_BYTES.finditer(text.encode('ascii'))
     else:
-        # Try to find location in the header
-        header_text = '\n'.join(lines[:10])
-        # Look for city, state format (e.g., "San Francisco, CA")
-        location_pattern = r'\b[A-Z][a-zA-Z\s]+,\s+[A-Z]{2}\b'
-        location_matches = re.findall(location_pattern, header_text)
-        if location_matches:
-            personal_info.location = location_matches[0]
-    
-    return personal_info
+        matches = _CONTACT_RE.finditer(text)
+    for match in matches:
+        kind = match.lastgroup
+        value = match.group(0).decode('ascii') if is_ascii else match.group(0)
+        if kind == 'email':
+            email = email or value
+        elif kind == 'phone':
+            phone = phone or value
+        elif not location and match.end() <= header_end:
+            location = value
+        if email and phone and (location or match.start() >= header_end):
+            break
+    
+    return PersonalInfo(name=name, email=email, phone=phone, location=location)
 
 
-def extract_education(text: str) -> List[Education]:
+def extract_education(text: str, sections: Optional[Dict[str, str]] = None) -> List[Education]:
     """Extract education information from resume text.
     
     Args:
         text: Resume text
+        sections: Sections from split_all_sections, split from text if omitted
         
     Returns:
         List[Education]: Education entries
@@ -108,7 +403,7 @@ def extract_education(text: str) -> List[Education]:
     education_entries = []
     
     # Get education section
-    education_section = extract_section(text, "education")
+    education_section = _get_section(text, sections, "education")
     if not education_section:
         return education_entries
     
@@ -119,60 +414,48 @@ def extract_education(text: str) -> List[Education]:
         if len(entry.strip()) < 10:  # Skip very short entries
             continue
             
-        education = Education()
-        
-        lines = entry.split('\n')
+        lines = entry.splitlines()
         if not lines:
             continue
             
         # First line is usually institution
-        education.institution = lines[0].strip()
+        institution = lines[0].strip()
+        degree = period = details_text = None
         
         # Look for degree
-        degree_patterns = [
-            r'(?:Bachelor|Master|Ph\.?D\.?|B\.S\.|M\.S\.|M\.B\.A\.|B\.A\.|M\.A\.|B\.Tech|M\.Tech)[\s\.]+'
-            r'(?:of|in|on)?[\s\.]+'
-            r'(?:Science|Arts|Engineering|Business|Administration|Technology|Computer Science|[A-Za-z\s]+)',
-            r'(?:BS|MS|BA|MA|MBA|PhD)[\s\.]+'
-            r'(?:in|on)?[\s\.]+'
-            r'(?:[A-Za-z\s]+)'
-        ]
-        
-        for pattern in degree_patterns:
-            degree_match = re.search(pattern, entry, re.IGNORECASE)
+        for pattern in _DEGREE_RES:
+            degree_match = pattern.search(entry)
             if degree_match:
-                education.degree = degree_match.group(0).strip()
+                degree = _intern_short(degree_match.group(0))
                 break
         
         # If no degree found, try second line
-        if not education.degree and len(lines) > 1:
-            education.degree = lines[1].strip()
+        if not degree and len(lines) > 1:
+            degree = lines[1].strip()
         
         # Look for dates
-        date_pattern = r'(?:19|20)\d{2}\s*(?:-|–|to)\s*(?:(?:19|20)\d{2}|present|current|now)'
-        date_match = re.search(date_pattern, entry, re.IGNORECASE)
+        date_match = _DATE_RE.search(entry)
         if date_match:
-            education.period = date_match.group(0).strip()
+            period = date_match.group(0).strip()
         
         # Add any remaining text as details
         if len(lines) > 2:
-            details = []
-            for line in lines[2:]:
-                if line.strip() and not (education.period and education.period in line):
-                    details.append(line.strip())
-            if details:
-                education.details = ' '.join(details)
+            details_text = ' '.join(
+                clean_line for clean_line in map(str.strip, lines[2:])
+                if clean_line and not (period and period in clean_line)
+            ) or None
         
-        education_entries.append(education)
+        education_entries.append(Education(institution=institution, degree=degree, period=period, details=details_text))
     
     return education_entries
 
 
-def extract_experience(text: str) -> List[Experience]:
+def extract_experience(text: str, sections: Optional[Dict[str, str]] = None) -> List[Experience]:
     """Extract work experience from resume text.
     
     Args:
         text: Resume text
+        sections: Sections from split_all_sections, split from text if omitted
         
     Returns:
         List[Experience]: Work experience entries
@@ -180,7 +463,7 @@ def extract_experience(text: str) -> List[Experience]:
     experience_entries = []
     
     # Get experience section
-    experience_section = extract_section(text, "experience") or extract_section(text, "employment") or extract_section(text, "work")
+    experience_section = _get_section(text, sections, "experience", "employment", "work")
     if not experience_section:
         return experience_entries
     
@@ -191,120 +474,92 @@ def extract_experience(text: str) -> List[Experience]:
         if len(entry.strip()) < 10:  # Skip very short entries
             continue
             
-        experience = Experience()
-        
-        lines = entry.split('\n')
+        lines = entry.splitlines()
         if not lines:
             continue
             
         # First line is usually company
-        experience.company = lines[0].strip()
+        company = lines[0].strip()
+        title = period = None
         
         # Look for job title
-        title_patterns = [
-            r'(?:Senior|Junior|Lead|Principal|Staff|Chief|Director|Manager|Engineer|Developer|Analyst|Consultant|Intern|Associate)\s+'
-            r'(?:[A-Za-z\s]+)'
-        ]
-        
-        for pattern in title_patterns:
-            title_match = re.search(pattern, entry, re.IGNORECASE)
+        for pattern in _TITLE_RES:
+            title_match = pattern.search(entry)
             if title_match:
-                experience.title = title_match.group(0).strip()
+                title = title_match.group(0).strip()
                 break
         
         # If no title found, try second line
-        if not experience.title and len(lines) > 1:
-            experience.title = lines[1].strip()
+        if not title and len(lines) > 1:
+            title = lines[1].strip()
         
         # Look for dates
-        date_pattern = r'(?:19|20)\d{2}\s*(?:-|–|to)\s*(?:(?:19|20)\d{2}|present|current|now)'
-        date_match = re.search(date_pattern, entry, re.IGNORECASE)
+        date_match = _DATE_RE.search(entry)
         if date_match:
-            experience.period = date_match.group(0).strip()
+            period = date_match.group(0).strip()
         
         # Extract responsibilities (bullet points)
-        responsibilities = []
-        bullet_pattern = r'[•\-*]\s*(.*?)(?=(?:[•\-*]|\n\n|\Z))'
-        bullet_matches = re.findall(bullet_pattern, entry, re.DOTALL)
-        if bullet_matches:
-            for match in bullet_matches:
-                clean_resp = match.strip()
-                if clean_resp:
-                    responsibilities.append(clean_resp)
+        responsibilities = list(_iter_bullets(entry))
         
         # If no bullet points, try to extract sentences
         if not responsibilities:
             # Find the text after title and dates
-            main_text = entry
-            if experience.title:
-                main_text = main_text.replace(experience.title, '', 1)
-            if experience.period:
-                main_text = main_text.replace(experience.period, '', 1)
-            if experience.company:
-                main_text = main_text.replace(experience.company, '', 1)
-                
-            # Split by sentences
-            sentences = re.split(r'(?<=[.!?])\s+', main_text)
-            for sentence in sentences:
-                clean_sent = sentence.strip()
-                if clean_sent and len(clean_sent) > 20:  # Only include meaningful sentences
+            main_text = _remove_first_occurrences(entry, (title, period, company))
+            
+            # Scan sentences, keeping only meaningful ones
+            for match in _SENTENCE_RE.finditer(main_text):
+                clean_sent = match.group(0).rstrip()
+                if len(clean_sent) > 20:
                     responsibilities.append(clean_sent)
         
-        experience.responsibilities = responsibilities
-        experience_entries.append(experience)
+        experience_entries.append(Experience(company=company, title=title, period=period, responsibilities=responsibilities))
     
     return experience_entries
 
 
-def extract_skills(text: str) -> List[str]:
+def extract_skills(text: str, sections: Optional[Dict[str, str]] = None) -> List[str]:
     """Extract skills from resume text.
     
     Args:
         text: Resume text
+        sections: Sections from split_all_sections, split from text if omitted
         
     Returns:
         List[str]: Skills
     """
-    skills = []
-    
     # Get skills section
-    skills_section = extract_section(text, "skills") or extract_section(text, "technical skills")
+    skills_section = _get_section(text, sections, "skills", "technical skills")
     if not skills_section:
-        return skills
+        return []
     
     # Try bullet points first
-    bullet_pattern = r'[•\-*]\s*(.*?)(?=(?:[•\-*]|\n\n|\Z))'
-    bullet_matches = re.findall(bullet_pattern, skills_section, re.DOTALL)
-    if bullet_matches:
-        for match in bullet_matches:
-            clean_skill = match.strip()
-            if clean_skill:
-                skills.append(clean_skill)
+    skills = list(_iter_bullets(skills_section))
     
     # If no bullet points, try comma separation
     if not skills:
         # Remove the section title
-        section_text = re.sub(r'^.*?:', '', skills_section, 1, re.IGNORECASE)
+        section_text = _strip_heading(skills_section)
         # Split by commas
         comma_skills = [s.strip() for s in section_text.split(',')]
         skills.extend([s for s in comma_skills if s])
     
     # If still no skills, try line by line
     if not skills:
-        lines = skills_section.split('\n')
+        lines = skills_section.splitlines()
         for line in lines:
             clean_line = line.strip()
-            if clean_line and not re.match(r'^skills|^technical\s+skills', clean_line, re.IGNORECASE):
+            if clean_line and not _SKILLS_HEADING_RE.match(clean_line):
                 skills.append(clean_line)
     
     return skills
 
 
-def extract_projects(text: str) -> List[Project]:
+def extract_projects(text: str, sections: Optional[Dict[str, str]] = None) -> List[Project]:
     """Extract projects from resume text.
     
     Args:
         text: Resume text
+        sections: Sections from split_all_sections, split from text if omitted
         
     Returns:
         List[Project]: Projects
@@ -312,7 +567,7 @@ def extract_projects(text: str) -> List[Project]:
     project_entries = []
     
     # Get projects section
-    projects_section = extract_section(text, "projects")
+    projects_section = _get_section(text, sections, "projects")
     if not projects_section:
         return project_entries
     
@@ -323,48 +578,45 @@ def extract_projects(text: str) -> List[Project]:
         if len(entry.strip()) < 10:  # Skip very short entries
             continue
             
-        project = Project()
-        
-        lines = entry.split('\n')
+        lines = entry.splitlines()
         if not lines:
             continue
             
         # First line is usually project name
-        project.name = lines[0].strip()
+        name = lines[0].strip()
+        url = description = None
+        technologies = []
         
         # Look for URL
-        url_pattern = r'https?://[^\s]+'
-        url_match = re.search(url_pattern, entry)
+        url_match = _URL_RE.search(entry)
         if url_match:
-            project.url = url_match.group(0).strip()
+            url = url_match.group(0).strip()
         
         # Extract description
         if len(lines) > 1:
-            description_lines = []
-            for line in lines[1:]:
-                if line.strip() and not (project.url and project.url in line):
-                    description_lines.append(line.strip())
-            if description_lines:
-                project.description = ' '.join(description_lines)
+            description = ' '.join(
+                clean_line for clean_line in map(str.strip, lines[1:])
+                if clean_line and not (url and url in clean_line)
+            ) or None
         
         # Extract technologies
-        tech_pattern = r'(?:Technologies|Tech Stack|Tools|Built with):\s*(.*?)(?=\n\n|\Z)'
-        tech_match = re.search(tech_pattern, entry, re.IGNORECASE | re.DOTALL)
+        tech_match = _TECH_LABEL_RE.search(entry)
         if tech_match:
-            tech_text = tech_match.group(1).strip()
+            tech_text = entry[tech_match.end():].lstrip().partition('\n\n')[0].strip()
             technologies = [t.strip() for t in tech_text.split(',')]
-            project.technologies = [t for t in technologies if t]
+            technologies = [t for t in technologies if t]
         
-        project_entries.append(project)
+        project_entries.append(Project(name=name, description=description, technologies=technologies, url=url))
     
     return project_entries
 
 
-def extract_languages(text: str) -> List[Language]:
+def extract_languages(text: str, sections: Optional[Dict[str, str]] = None) -> List[Language]:
     """Extract languages from resume text.
     
     Args:
         text: Resume text
+        sections: Sections from split_all_sections, split from text if omitted
         
     Returns:
         List[Language]: Languages
@@ -372,45 +624,50 @@ def extract_languages(text: str) -> List[Language]:
     language_entries = []
     
     # Get languages section
-    languages_section = extract_section(text, "languages")
+    languages_section = _get_section(text, sections, "languages")
     if not languages_section:
         return language_entries
     
     # Try bullet points first
-    bullet_pattern = r'[•\-*]\s*(.*?)(?=(?:[•\-*]|\n\n|\Z))'
-    bullet_matches = re.findall(bullet_pattern, languages_section, re.DOTALL)
-    if bullet_matches:
-        for match in bullet_matches:
-            clean_lang = match.strip()
-            if clean_lang:
-                if ':' in clean_lang:
-                    lang, prof = clean_lang.split(':', 1)
-                    language_entries.append(Language(language=lang.strip(), proficiency=prof.strip()))
-                else:
-                    language_entries.append(Language(language=clean_lang))
+    for clean_lang in _iter_bullets(languages_section):
+        if ':' in clean_lang:
+            lang, prof = clean_lang.split(':', 1)
+            language_entries.append(Language(language=_intern_short(lang), proficiency=_intern_short(prof)))
+        else:
+            language_entries.append(Language(language=_intern_short(clean_lang)))
     
     # If no bullet points, try line by line
     if not language_entries:
-        lines = languages_section.split('\n')
+        lines = languages_section.splitlines()
         for line in lines:
             clean_line = line.strip()
-            if clean_line and not re.match(r'^languages', clean_line, re.IGNORECASE):
-                if ':' in clean_line:
-                    lang, prof = clean_line.split(':', 1)
-                    language_entries.append(Language(language=lang.strip(), proficiency=prof.strip()))
-                elif '-' in clean_line:
-                    lang, prof = clean_line.split('-', 1)
-                    language_entries.append(Language(language=lang.strip(), proficiency=prof.strip()))
-                elif '(' in clean_line and ')' in clean_line:
-                    match = re.match(r'(.*?)\s*\((.*?)\)', clean_line)
-                    if match:
-                        language_entries.append(Language(language=match.group(1).strip(), proficiency=match.group(2).strip()))
+            if clean_line and not _LANGUAGES_HEADING_RE.match(clean_line):
+                match = _LANGUAGE_LINE_RE.match(clean_line)
+                if match:
+                    lang, prof = match.group(match.lastindex - 1, match.lastindex)
+                    language_entries.append(Language(language=_intern_short(lang), proficiency=_intern_short(prof)))
                 else:
-                    language_entries.append(Language(language=clean_line))
+                    language_entries.append(Language(language=_intern_short(clean_line)))
     
     return language_entries
 
 
+def _strip_heading(section_text: str) -> str:
+    """Remove everything up to the first colon on the first line, if any.
+    
+    Args:
+        section_text: Text of a section
+        
+    Returns:
+        str: Text without its leading "Heading:" label
+    """
+    first_line_end = section_text.find('\n')
+    if first_line_end < 0:
+        first_line_end = len(section_text)
+    colon = section_text.find(':', 0, first_line_end)
+    return section_text[colon + 1:] if colon >= 0 else section_text
+
+
 def split_into_entries(section_text: str) -> List[str]:
     """Split a section into individual entries.
     
@@ -421,21 +678,17 @@ def split_into_entries(section_text: str) -> List[str]:
         List[str]: List of entries
     """
     # Remove the section heading
-    section_text = re.sub(r'^.*?:', '', section_text, 1, re.IGNORECASE)
+    section_text = _strip_heading(section_text)
     
     # Try to split by double newlines (paragraph breaks)
-    entries = re.split(r'\n\s*\n', section_text)
+    entries = _PARA_SPLIT_RE.split(section_text)
     
     # If we only got one entry, try to split by years (common in resumes)
     if len(entries) <= 1:
-        # Look for year patterns like "2018-2022" or "2018 - Present"
-        year_pattern = r'\n(?=.*\b(19|20)\d{2}\b)'
-        entries = re.split(year_pattern, section_text)
+        entries = _YEAR_SPLIT_RE.split(section_text)
     
     # If we still only got one entry, try to split by bullet points
     if len(entries) <= 1:
-        # Look for bullet point patterns
-        bullet_pattern = r'\n(?=[•\-*])'
-        entries = re.split(bullet_pattern, section_text)
+        entries = _BULLET_SPLIT_RE.split(section_text)
     
-    return [e.strip() for e in entries if e.strip()]
\ No newline at end of file
+    return [e for e in (entry.strip() for entry in entries) if e]
\ No newline at end of file
@@ -4,16 +4,18 @@ PDF Resume Parser Plugin implementation.
 This module provides the main plugin class for the PDF resume parser.
 """
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 from src.utils.logging import get_structured_logger
 
 from src.core.plugin_system.plugin_interface import Plugin, PluginMetadata, PluginRequest, PluginResponse
 
-# ResumeData is used by parse_resume_text in direct extraction modes
+# ResumeData is used by parse_resume_text_async in direct extraction modes
 from .models import ResumeData
-from .extractor import download_pdf, extract_text_from_pdf
-from .parser import parse_resume_text
+from .extractor import download_pdf, extract_text_from_pdf_async, shutdown_pdf_pool
+from .parser import ResumeBatchParser, parse_resume_text_async
 from .llm_fallback import parse_with_llm
+from .llm_batch import parse_with_llm_batch
 
 logger = get_structured_logger(__name__)
 
@@ -36,7 +38,8 @@ class PDFResumePlugin(Plugin):
             optional_params={
                 "parsing_mode": "Parsing mode: 'llm_first' (default), 'direct_first', or 'direct_only' (string)",
                 "llm_provider": "LLM provider to use for fallback (string, default: 'anthropic')",
-                "llm_model": "LLM model to use for fallback (string, default: 'claude-3-5-sonnet-20241022')"
+                "llm_model": "LLM model to use for fallback (string, default: 'claude-3-5-sonnet-20241022')",
+                "pdf_urls": "List of PDF resume URLs for the 'parse_resumes' batch action, instead of pdf_url"
             },
             examples=[
                 {
@@ -50,6 +53,13 @@ class PDFResumePlugin(Plugin):
                 {
                     "query": "Parse resume with direct extraction and LLM fallback",
                     "parameters": {"pdf_url": "https://example.com/resume.pdf", "parsing_mode": "direct_first"}
+                },
+                {
+                    "query": "Parse a batch of resumes",
+                    "parameters": {
+                        "pdf_urls": ["https://example.com/a.pdf", "https://example.com/b.pdf"],
+                        "parsing_mode": "direct_first"
+                    }
                 }
             ]
         )
@@ -103,6 +113,9 @@ class PDFResumePlugin(Plugin):
                        llm_provider=llm_provider,
                        llm_model=llm_model)
 
+            if request.action == "parse_resumes":
+                return await self._execute_batch(request, parsing_mode, llm_provider, llm_model)
+
             if not pdf_url:
                 logger.error("Missing required parameter: pdf_url")
                 return PluginResponse(
@@ -121,7 +134,8 @@ class PDFResumePlugin(Plugin):
 
                 # Extract text from PDF properly using pdfminer
                 logger.info("Extracting text from PDF for LLM parsing")
-                pdf_text = extract_text_from_pdf(pdf_content)
+                # The LLM copes with raw whitespace, so skip the regex cleanup
+                pdf_text = await extract_text_from_pdf_async(pdf_content, clean=False)
                 logger.info("Text extraction complete", text_length=len(pdf_text))
 
                 # Call LLM parser as primary method
@@ -134,20 +148,28 @@ class PDFResumePlugin(Plugin):
             elif parsing_mode == "direct_only" or parsing_mode == "direct_first":
                 # Extract text from PDF using pdfminer.six (original path)
                 logger.info("Extracting text from PDF")
-                pdf_text = extract_text_from_pdf(pdf_content)
+                pdf_text = await extract_text_from_pdf_async(pdf_content)
                 logger.info("Text extraction complete", text_length=len(pdf_text))
 
-                # Parse resume data using direct extraction
+                # Parse resume data using direct extraction. In direct_first mode
+                # a resume missing a required section is not parsed: the direct
+                # result would be discarded for the LLM's anyway
                 logger.info("Parsing resume data using direct extraction")
-                resume_data = parse_resume_text(pdf_text)
-                logger.info("Direct extraction results",
-                          personal_info=resume_data.personal_info.name is not None,
-                          education_entries=len(resume_data.education),
-                          experience_entries=len(resume_data.experience),
-                          skills_found=len(resume_data.skills))
-
-                # Check if we need LLM fallback
-                needs_fallback = needs_llm_fallback(resume_data)
+                resume_data = await parse_resume_text_async(
+                    pdf_text, require_sections=parsing_mode == "direct_first"
+                )
+                if resume_data is None:
+                    logger.info("Required resume sections missing, skipping direct extraction")
+                    needs_fallback = True
+                else:
+                    logger.info("Direct extraction results",
+                              personal_info=resume_data.personal_info.name is not None,
+                              education_entries=len(resume_data.education),
+                              experience_entries=len(resume_data.experience),
+                              skills_found=len(resume_data.skills))
+
+                    # Check if we need LLM fallback
+                    needs_fallback = needs_llm_fallback(resume_data)
 
                 if parsing_mode == "direct_first" and needs_fallback:
                     logger.info("Direct extraction incomplete, using LLM fallback",
@@ -167,6 +189,10 @@ class PDFResumePlugin(Plugin):
                                        "skills": len(resume_data.skills) == 0,
                                    })
 
+                # Serialize once at the response boundary; the models are only used during extraction
+                if isinstance(resume_data, ResumeData):
+                    resume_data = resume_data.model_dump()
+
             else:
                 # Invalid parsing mode
                 logger.error("Invalid parsing mode", parsing_mode=parsing_mode)
@@ -212,9 +238,136 @@ class PDFResumePlugin(Plugin):
                 error=f"PDF resume parsing failed: {str(e)}"
             )
 
+    async def validate_request(self, request: PluginRequest) -> bool:
+        """Validate a request; the parse_resumes action takes pdf_urls instead of pdf_url.
+
+        Args:
+            request: The request to validate
+
+        Returns:
+            bool: True if valid, False otherwise
+        """
+        if request.action == "parse_resumes":
+            pdf_urls = request.parameters.get("pdf_urls")
+            return isinstance(pdf_urls, list) and bool(pdf_urls)
+        return await super().validate_request(request)
+
+    async def _execute_batch(
+        self,
+        request: PluginRequest,
+        parsing_mode: str,
+        llm_provider: str,
+        llm_model: str
+    ) -> PluginResponse:
+        """Parse the PDF resumes of a parse_resumes request.
+
+        Args:
+            request: The plugin request, with the resume URLs in pdf_urls
+            parsing_mode: Parsing mode, as for a single resume
+            llm_provider: LLM provider for LLM parsing
+            llm_model: LLM model for LLM parsing
+
+        Returns:
+            PluginResponse: One parsed resume per URL, in input order
+        """
+        pdf_urls = request.parameters.get("pdf_urls")
+        if not pdf_urls:
+            logger.error("Missing required parameter: pdf_urls")
+            return PluginResponse(
+                request_id=request.request_id,
+                status="error",
+                error="Missing required parameter: pdf_urls"
+            )
+        if parsing_mode not in ("llm_first", "direct_first", "direct_only"):
+            logger.error("Invalid parsing mode", parsing_mode=parsing_mode)
+            return PluginResponse(
+                request_id=request.request_id,
+                status="error",
+                error=f"Invalid parsing mode: {parsing_mode}. Must be 'llm_first', 'direct_first', or 'direct_only'"
+            )
+
+        logger.info("Downloading PDF batch", count=len(pdf_urls))
+        pdf_contents = await asyncio.gather(*(download_pdf(url) for url in pdf_urls))
+        # The LLM copes with raw whitespace, so llm_first skips the regex cleanup
+        clean = parsing_mode != "llm_first"
+        texts = list(await asyncio.gather(
+            *(extract_text_from_pdf_async(content, clean=clean) for content in pdf_contents)
+        ))
+
+        resumes = await self.parse_resume_texts(texts, parsing_mode, llm_provider, llm_model)
+        logger.info("PDF resume batch parsing complete", count=len(resumes), parsing_mode=parsing_mode)
+
+        return PluginResponse(
+            request_id=request.request_id,
+            status="success",
+            data={
+                "parsed_resumes": [
+                    {"parsed_resume": resume, "text_length": len(text), "source_url": url}
+                    for resume, text, url in zip(resumes, texts, pdf_urls)
+                ]
+            },
+            metadata={
+                "plugin": "pdf_resume_parser",
+                "version": self._metadata.version if self._metadata else None,
+                "parsing_mode": parsing_mode,
+                "batch_size": len(resumes)
+            }
+        )
+
+    async def parse_resume_texts(
+        self,
+        texts: List[str],
+        parsing_mode: str = "direct_only",
+        llm_provider: Optional[str] = None,
+        llm_model: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Parse already-extracted resume texts in bulk.
+
+        For evaluators that score many candidates at once. Direct extraction
+        runs in worker processes instead of one execute call per resume, and
+        LLM parses go through parse_with_llm_batch, which uses the provider's
+        Batch API when it is enabled.
+
+        Args:
+            texts: Extracted resume texts
+            parsing_mode: 'direct_only' (default), 'direct_first' (LLM for the
+                resumes direct extraction cannot handle) or 'llm_first'
+            llm_provider: LLM provider, defaults to the plugin's
+            llm_model: LLM model, defaults to the plugin's
+
+        Returns:
+            List[Dict[str, Any]]: Parsed resume data for each text, in input order
+
+        Raises:
+            ValueError: If parsing_mode is unknown
+        """
+        if parsing_mode not in ("llm_first", "direct_first", "direct_only"):
+            raise ValueError(f"Invalid parsing mode: {parsing_mode}")
+        llm_provider = llm_provider or self._llm_provider
+        llm_model = llm_model or self._llm_model
+
+        if parsing_mode == "llm_first":
+            return await parse_with_llm_batch([(text, {}) for text in texts], llm_provider, llm_model)
+
+        resumes = await asyncio.to_thread(ResumeBatchParser().parse_many, texts)
+        results = [resume.model_dump() for resume in resumes]
+        if parsing_mode == "direct_first":
+            # As for a single resume, the LLM gets no direct extraction data
+            fallback = [index for index, resume in enumerate(resumes) if needs_llm_fallback(resume)]
+            if fallback:
+                logger.info("Direct extraction incomplete for part of the batch, using LLM",
+                           count=len(fallback), provider=llm_provider, model=llm_model)
+                parsed = await parse_with_llm_batch(
+                    [(texts[index], {}) for index in fallback], llm_provider, llm_model
+                )
+                for index, data in zip(fallback, parsed):
+                    results[index] = data
+        return results
+
     async def shutdown(self) -> None:
         """Shutdown the plugin."""
         logger.info("Shutting down PDF Resume Parser plugin")
+        shutdown_pdf_pool()
         self._initialized = False
 
     def get_metadata(self) -> PluginMetadata:
@@ -229,6 +382,9 @@ class PDFResumePlugin(Plugin):
 def needs_llm_fallback(resume_data) -> bool:
     """Check if LLM fallback is needed based on the quality of direct extraction.
 
+    The O(1) section checks run first; the per-entry experience scan only
+    runs when every section is present, and stops at the first gap.
+
     Args:
         resume_data: Resume data from direct extraction (ResumeData or dict)
 
@@ -255,9 +411,7 @@ def needs_llm_fallback(resume_data) -> bool:
             return True
 
         # Check if experience entries have missing roles or descriptions
-        for exp in resume_data.experience:
-            if not exp.title or not exp.responsibilities:
-                return True
+        return any(not exp.title or not exp.responsibilities for exp in resume_data.experience)
     else:
         # It's a dictionary
         # Check personal info
@@ -277,9 +431,4 @@ def needs_llm_fallback(resume_data) -> bool:
             return True
 
         # Check if experience entries have missing roles or descriptions
-        for exp in resume_data.get('experience', []):
-            if not exp.get('role') or not exp.get('description'):
-                return True
-
-    # If we have at least basic info in all key sections, no need for fallback
-    return False
+        return any(not exp.get('role') or not exp.get('description') for exp in resume_data['experience'])
@@ -8,19 +8,66 @@ standard Python logging backend.
 """
 
 import logging
+import logging.handlers
 import sys
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 from fastapi import FastAPI
 from fastapi.logger import logger as fastapi_logger
 
+# (level, buffer_size, syslog_address) the last configure_logging call applied, if any
+_CONFIGURED: Optional[Tuple[str, int, Optional[str]]] = None
 
-def configure_logging(level: str = "INFO") -> None:
+
+def _build_handler(buffer_size: int, syslog_address: Optional[str]) -> logging.Handler:
+    """Create the root log handler.
+    
+    Writing each record to stdout is a blocking write per record; under
+    high log volume, records can instead be buffered and written in
+    batches, or sent to the local syslog daemon over its UNIX socket.
+    """
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    if syslog_address:
+        handler: logging.Handler = logging.handlers.SysLogHandler(address=syslog_address)
+        handler.setFormatter(formatter)
+        return handler
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(formatter)
+    if buffer_size > 0:
+        # Flushes when full, on ERROR records and at shutdown
+        return logging.handlers.MemoryHandler(buffer_size, flushLevel=logging.ERROR, target=handler)
+    return handler
+
+
+def configure_logging(
+    level: str = "INFO",
+    buffer_size: int = 0,
+    syslog_address: Optional[str] = None
+) -> None:
     """Configure logging for the application.
     
+    Repeated calls with the same configuration are no-ops; every setLevel
+    call clears the level cache of every logger in the process. A call with
+    a different configuration replaces the root handler (flushing and
+    closing the previous one).
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        buffer_size: Records to buffer before writing to stdout; 0 writes
+            each record as it is logged
+        syslog_address: UNIX socket path of a syslog daemon (e.g. /dev/log)
+            to log to instead of stdout
     """
+    global _CONFIGURED
+    configuration = (level.upper(), buffer_size, syslog_address)
+    if _CONFIGURED == configuration:
+        return
+    
     # Convert string level to logging level
     numeric_level = getattr(logging, level.upper(), None)
     if not isinstance(numeric_level, int):
@@ -29,9 +76,10 @@ def configure_logging(level: str = "INFO") -> None:
     # Configure root logger
     logging.basicConfig(
         level=numeric_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[logging.StreamHandler(sys.stdout)]
+        handlers=[_build_handler(buffer_size, syslog_address)],
+        # basicConfig ignores a root logger that already has handlers, so
+        # replace our own handler from an earlier call
+        force=_CONFIGURED is not None
     )
     
     # Configure FastAPI logger
@@ -69,52 +117,94 @@ def configure_logging(level: str = "INFO") -> None:
         # Even in DEBUG mode, set pdfminer to WARNING to avoid overwhelming logs
         logging.getLogger("pdfminer").setLevel(logging.WARNING)
     
+    _CONFIGURED = configuration
+    
     # Log configuration complete
     logging.info(f"Logging configured with level: {level}")
 
 
+def _safe_str(value: Any) -> str:
+    """Format a log value, falling back to repr when str() raises."""
+    try:
+        return str(value)
+    except Exception:
+        return repr(value)
+
+
 class StructuredLoggerAdapter:
     """Lightweight adapter to allow logger.info("msg", key=value) usage.
 
     Converts keyword arguments into a simple " key=value" suffix appended to the
-    log message and forwards to the standard library logger.
+    log message and forwards to the standard library logger. Calls below the
+    logger's effective level return before the message is built.
     """
 
+    _DEBUG = logging.DEBUG
+    _INFO = logging.INFO
+    _WARNING = logging.WARNING
+    _ERROR = logging.ERROR
+
     def __init__(self, base_logger: logging.Logger) -> None:
         self._logger = base_logger
+        # Logger.isEnabledFor memoizes per level (cleared on setLevel), so
+        # binding it once leaves a single dict lookup per filtered call
+        self._is_enabled = base_logger.isEnabledFor
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a message at level would be logged.
+
+        Lets call sites skip computing expensive keyword values.
+        """
+        return self._is_enabled(level)
+
+    # logging.Logger's name, so the adapter can be passed to helpers such as
+    # PerformanceTracker.log_summary that are typed against Logger
+    isEnabledFor = is_enabled_for
 
     @staticmethod
-    def _merge_message(msg: str, kwargs: Dict[str, Any]) -> str:
+    def _merge_message(msg: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+        """Append a " | key=value ..." suffix to the message.
+
+        Values are formatted now rather than when the record is emitted: a
+        buffered record must show the values as they were when it was
+        logged, and the level check has already passed.
+        """
         if not kwargs:
             return msg
-        suffix_parts = []
-        for k, v in kwargs.items():
-            # Avoid extremely long or binary outputs; fall back to repr for clarity
-            try:
-                text = str(v)
-            except Exception:
-                text = repr(v)
-            suffix_parts.append(f"{k}={text}")
-        return f"{msg} | " + " ".join(suffix_parts)
+        suffix = " | " + " ".join(f"{k}={_safe_str(v)}" for k, v in kwargs.items())
+        if args:
+            # The message is still %-formatted with args; keep the values literal
+            suffix = suffix.replace("%", "%%")
+        return msg + suffix
 
     def debug(self, msg: str, *args: Any, exc_info: Optional[bool] = None, stack_info: bool = False, stacklevel: int = 1, extra: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
-        self._logger.debug(self._merge_message(msg, kwargs), *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
+        if not self._is_enabled(self._DEBUG):
+            return
+        self._logger.debug(self._merge_message(msg, args, kwargs), *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
 
     def info(self, msg: str, *args: Any, exc_info: Optional[bool] = None, stack_info: bool = False, stacklevel: int = 1, extra: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
-        self._logger.info(self._merge_message(msg, kwargs), *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
+        if not self._is_enabled(self._INFO):
+            return
+        self._logger.info(self._merge_message(msg, args, kwargs), *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
 
     def warning(self, msg: str, *args: Any, exc_info: Optional[bool] = None, stack_info: bool = False, stacklevel: int = 1, extra: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
-        self._logger.warning(self._merge_message(msg, kwargs), *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
+        if not self._is_enabled(self._WARNING):
+            return
+        self._logger.warning(self._merge_message(msg, args, kwargs), *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
 
     # Alias warn to warning to support existing calls
     warn = warning
 
     def error(self, msg: str, *args: Any, exc_info: Optional[bool] = None, stack_info: bool = False, stacklevel: int = 1, extra: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
-        self._logger.error(self._merge_message(msg, kwargs), *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
+        if not self._is_enabled(self._ERROR):
+            return
+        self._logger.error(self._merge_message(msg, args, kwargs), *args, exc_info=exc_info, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
 
     def exception(self, msg: str, *args: Any, exc_info: Optional[bool] = True, stack_info: bool = False, stacklevel: int = 1, extra: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
         # By default, include exception info
-        self._logger.error(self._merge_message(msg, kwargs), *args, exc_info=True, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
+        if not self._is_enabled(self._ERROR):
+            return
+        self._logger.error(self._merge_message(msg, args, kwargs), *args, exc_info=True, stack_info=stack_info, stacklevel=stacklevel, extra=extra)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -129,9 +219,13 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+@lru_cache(maxsize=1024)
 def get_structured_logger(name: str) -> StructuredLoggerAdapter:
     """Get a structured logger adapter that supports key=value kwargs.
 
+    Adapters are cached, so each name has a single shared adapter and
+    request-scoped calls do not allocate a new one.
+
     Args:
         name: Logger name
 
@@ -152,9 +246,13 @@ def setup_app_logging(app: FastAPI, config: Dict[str, Any]) -> None:
     configure_logging(log_level)
     
     # Add logging middleware
+    logger = logging.getLogger("src.api")
+    
     @app.middleware("http")
     async def log_requests(request, call_next):
-        logger = logging.getLogger("src.api")
+        # Skip formatting the per-request messages unless DEBUG is on
+        if not logger.isEnabledFor(logging.DEBUG):
+            return await call_next(request)
         logger.debug(f"Request: {request.method} {request.url.path}")
         response = await call_next(request)
         logger.debug(f"Response: {response.status_code}")
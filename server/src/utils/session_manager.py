@@ -1,38 +1,70 @@
 """Session management for the MCP Server."""
 
-from typing import Any, Dict, Optional, List
-from datetime import datetime, timedelta
-import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, List, Tuple, Union
+from datetime import datetime, timezone
+import asyncio
+import heapq
+import time
 import uuid
 from src.utils.logging import get_structured_logger
+import orjson
 import redis.asyncio as redis
-from pydantic import BaseModel, Field
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ResponseError, WatchError
 
 from src.config.settings import settings
 
 logger = get_structured_logger(__name__)
 
+# The in-memory store is split into this many dicts (a power of two)
+IN_MEMORY_SHARDS = 16
 
-class Session(BaseModel):
-    """Session model."""
+# Expired sessions removed between event loop yields during cleanup
+CLEANUP_BATCH_SIZE = 500
+
+# Hash field prefix for entries of Session.data
+_DATA_FIELD_PREFIX = "data:"
+
+
+def _to_epoch(value: Union[float, int, str]) -> float:
+    """Convert a stored timestamp to epoch seconds.
+    
+    Sessions written before timestamps were stored as epoch seconds hold
+    naive UTC ISO strings.
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+    return value
+
+
+@dataclass(slots=True)
+class Session:
+    """Session model.
+    
+    Timestamps are epoch seconds, so storage needs no datetime formatting
+    or parsing and expiry checks are a float comparison. Sessions are only
+    built from trusted data, so a plain slots dataclass is used rather
+    than a validating model.
+    """
     
-    session_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    expires_at: datetime
-    data: Dict[str, Any] = Field(default_factory=dict)
+    expires_at: float
+    session_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: float = field(default_factory=time.time)
+    data: Dict[str, Any] = field(default_factory=dict)
     
     def is_expired(self) -> bool:
         """Check if session is expired."""
-        return datetime.utcnow() > self.expires_at
+        return time.time() > self.expires_at
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
         return {
             "session_id": self.session_id,
             "user_id": self.user_id,
-            "created_at": self.created_at.isoformat(),
-            "expires_at": self.expires_at.isoformat(),
+            "created_at": self.created_at,
+            "expires_at": self.expires_at,
             "data": self.data
         }
     
@@ -42,12 +74,55 @@ class Session(BaseModel):
         return cls(
             session_id=data["session_id"],
             user_id=data["user_id"],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            expires_at=datetime.fromisoformat(data["expires_at"]),
+            created_at=_to_epoch(data["created_at"]),
+            expires_at=_to_epoch(data["expires_at"]),
             data=data.get("data", {})
         )
 
 
+def _data_fields(data: Dict[str, Any]) -> Dict[str, bytes]:
+    """Map session data entries to Redis hash fields, one per key.
+
+    Values are orjson-encoded; OPT_NON_STR_KEYS keeps json.dumps' handling
+    of int/float keys in nested dicts.
+    """
+    return {
+        f"{_DATA_FIELD_PREFIX}{key}": orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        for key, value in data.items()
+    }
+
+
+def _session_fields(session: Session) -> Dict[str, Any]:
+    """Flatten a session into Redis hash fields.
+
+    Each data entry gets its own field, so updates only rewrite the
+    entries that changed.
+    """
+    fields: Dict[str, Any] = {
+        "session_id": session.session_id,
+        "user_id": session.user_id,
+        "created_at": session.created_at,
+        "expires_at": session.expires_at,
+    }
+    fields.update(_data_fields(session.data))
+    return fields
+
+
+def _session_dict_from_fields(fields: Dict[bytes, bytes]) -> Dict[str, Any]:
+    """Rebuild the Session.to_dict form from a Redis hash."""
+    data: Dict[str, Any] = {}
+    session_data: Dict[str, Any] = {"data": data}
+    for name, value in fields.items():
+        name = name.decode()
+        if name.startswith(_DATA_FIELD_PREFIX):
+            data[name[len(_DATA_FIELD_PREFIX):]] = orjson.loads(value)
+        elif name in ("created_at", "expires_at"):
+            session_data[name] = float(value)
+        else:
+            session_data[name] = value.decode()
+    return session_data
+
+
 class SessionManager:
     """Manages user sessions with Redis backend."""
     
@@ -55,7 +130,8 @@ class SessionManager:
         self,
         redis_url: Optional[str] = None,
         default_ttl: int = 3600,
-        key_prefix: str = "mcp:session:"
+        key_prefix: str = "mcp:session:",
+        user_index_prefix: str = "mcp:user_sessions:"
     ) -> None:
         """Initialize the session manager.
         
@@ -63,23 +139,28 @@ class SessionManager:
             redis_url: Redis connection URL
             default_ttl: Default session TTL in seconds
             key_prefix: Prefix for Redis keys
+            user_index_prefix: Prefix for the per-user sets of session IDs
         """
         self.redis_url = redis_url or settings.redis_url
         self.default_ttl = default_ttl
         self.key_prefix = key_prefix
+        self.user_index_prefix = user_index_prefix
         self._redis: Optional[redis.Redis] = None
-        self._in_memory_store: Dict[str, Session] = {}
+        # Sessions are spread over shards by hash(session_id) so each dict
+        # stays small
+        self._shards: List[Dict[str, Session]] = [{} for _ in range(IN_MEMORY_SHARDS)]
+        # (expires_at, session_id) for in-memory sessions; entries left behind
+        # by updates and deletes are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._cleanup_task: Optional[asyncio.Task] = None
         self._use_redis = bool(self.redis_url)
     
     async def initialize(self) -> None:
         """Initialize the session manager."""
         if self._use_redis:
             try:
-                self._redis = await redis.from_url(
-                    self.redis_url,
-                    encoding="utf-8",
-                    decode_responses=True
-                )
+                # Sessions are stored as orjson bytes, so responses are not decoded
+                self._redis = await redis.from_url(self.redis_url)
                 await self._redis.ping()
                 logger.info("Redis session store initialized")
             except Exception as e:
@@ -91,6 +172,25 @@ class SessionManager:
                 self._redis = None
         else:
             logger.info("Using in-memory session store")
+        
+        if self._use_redis:
+            try:
+                await self._migrate_user_index()
+            except Exception as e:
+                # Sessions already in the index are unaffected
+                logger.error("Failed to migrate the user session index", error=str(e))
+        else:
+            # Redis expires its own keys; the in-memory store is swept periodically
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+    
+    async def _cleanup_loop(self) -> None:
+        """Sweep expired in-memory sessions every session_cleanup_interval seconds."""
+        while True:
+            await asyncio.sleep(settings.session_cleanup_interval)
+            try:
+                await self.cleanup_expired_sessions()
+            except Exception as e:
+                logger.error("Session cleanup failed", error=str(e))
     
     async def create_session(
         self,
@@ -109,7 +209,7 @@ class SessionManager:
             Session: The created session
         """
         ttl = ttl or self.default_ttl
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+        expires_at = time.time() + ttl
         
         session = Session(
             user_id=user_id,
@@ -139,23 +239,37 @@ class SessionManager:
         """
         if self._use_redis and self._redis:
             try:
-                data = await self._redis.get(f"{self.key_prefix}{session_id}")
-                if data:
-                    session_data = json.loads(data)
+                key = f"{self.key_prefix}{session_id}"
+                try:
+                    fields = await self._redis.hgetall(key)
+                    session_data = _session_dict_from_fields(fields) if fields else None
+                    legacy = False
+                except ResponseError:
+                    # Sessions written before the hash layout are JSON strings
+                    data = await self._redis.get(key)
+                    session_data = orjson.loads(data) if data else None
+                    legacy = True
+                if session_data:
                     session = Session.from_dict(session_data)
                     
                     if session.is_expired():
                         await self.delete_session(session_id)
                         return None
                     
+                    if legacy:
+                        # Rewrite as a hash so later updates can write single fields
+                        await self._redis.delete(key)
+                        await self._store_session(session, int(session.expires_at - time.time()) or 1)
+                    
                     return session
             except Exception as e:
                 logger.error("Failed to get session from Redis", error=str(e))
         else:
             # In-memory fallback
-            session = self._in_memory_store.get(session_id)
+            shard = self._shard(session_id)
+            session = shard.get(session_id)
             if session and session.is_expired():
-                del self._in_memory_store[session_id]
+                del shard[session_id]
                 return None
             return session
         
@@ -184,10 +298,17 @@ class SessionManager:
         session.data.update(data)
         
         if extend_ttl:
-            session.expires_at = datetime.utcnow() + timedelta(seconds=self.default_ttl)
+            session.expires_at = time.time() + self.default_ttl
         
-        ttl = int((session.expires_at - datetime.utcnow()).total_seconds())
-        await self._store_session(session, ttl)
+        ttl = int(session.expires_at - time.time())
+        if self._use_redis and self._redis:
+            # Only the updated data entries and the expiry are written to Redis
+            fields = _data_fields(data)
+            fields["expires_at"] = session.expires_at
+            if not await self._update_stored_session(session, ttl, fields):
+                return None
+        else:
+            self._store_in_memory(session)
         
         logger.info("Session updated", session_id=session_id)
         return session
@@ -203,14 +324,16 @@ class SessionManager:
         """
         if self._use_redis and self._redis:
             try:
+                # The user index entry is pruned by the next get_user_sessions
                 result = await self._redis.delete(f"{self.key_prefix}{session_id}")
                 logger.info("Session deleted", session_id=session_id)
                 return bool(result)
             except Exception as e:
                 logger.error("Failed to delete session from Redis", error=str(e))
         else:
-            if session_id in self._in_memory_store:
-                del self._in_memory_store[session_id]
+            shard = self._shard(session_id)
+            if session_id in shard:
+                del shard[session_id]
                 logger.info("Session deleted", session_id=session_id)
                 return True
         
@@ -228,15 +351,20 @@ class SessionManager:
             # Redis handles expiration automatically
             logger.info("Redis handles session expiration automatically")
         else:
-            # Clean up in-memory store
-            expired_ids = [
-                sid for sid, session in self._in_memory_store.items()
-                if session.is_expired()
-            ]
-            
-            for sid in expired_ids:
-                del self._in_memory_store[sid]
-                cleaned += 1
+            # Pop only the sessions that are due instead of scanning the store
+            now = time.time()
+            heap = self._expiry_heap
+            while heap and heap[0][0] < now:
+                expires_at, sid = heapq.heappop(heap)
+                shard = self._shard(sid)
+                session = shard.get(sid)
+                # Skip entries for sessions since deleted or extended
+                if session is not None and session.expires_at == expires_at:
+                    del shard[sid]
+                    cleaned += 1
+                    if cleaned % CLEANUP_BATCH_SIZE == 0:
+                        # Let other requests run during a large sweep
+                        await asyncio.sleep(0)
             
             if cleaned > 0:
                 logger.info("Cleaned up expired sessions", count=cleaned)
@@ -252,17 +380,157 @@ class SessionManager:
         """
         if self._use_redis and self._redis:
             try:
-                await self._redis.setex(
-                    f"{self.key_prefix}{session.session_id}",
-                    ttl,
-                    json.dumps(session.to_dict())
-                )
+                # All writes go out in one round trip
+                key = f"{self.key_prefix}{session.session_id}"
+                pipe = self._redis.pipeline(transaction=False)
+                pipe.hset(key, mapping=_session_fields(session))
+                pipe.expire(key, ttl)
+                self._index_session(pipe, session, ttl)
+                await pipe.execute()
             except Exception as e:
                 logger.error("Failed to store session in Redis", error=str(e))
                 # Fallback to in-memory
-                self._in_memory_store[session.session_id] = session
+                self._store_in_memory(session)
         else:
-            self._in_memory_store[session.session_id] = session
+            self._store_in_memory(session)
+    
+    async def _update_stored_session(
+        self,
+        session: Session,
+        ttl: int,
+        fields: Dict[str, Any]
+    ) -> bool:
+        """Write changed fields of a session stored in Redis.
+        
+        The write is a WATCH/MULTI transaction that only runs while the key
+        exists, so a session that expires or is deleted after it was read
+        is not recreated as a hash holding just the changed fields.
+        
+        Args:
+            session: Updated session
+            ttl: TTL in seconds
+            fields: Redis hash fields to write
+            
+        Returns:
+            bool: False if the session no longer exists
+        """
+        key = f"{self.key_prefix}{session.session_id}"
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                while True:
+                    try:
+                        await pipe.watch(key)
+                        if not await pipe.exists(key):
+                            return False
+                        pipe.multi()
+                        pipe.hset(key, mapping=fields)
+                        pipe.expire(key, ttl)
+                        self._index_session(pipe, session, ttl)
+                        await pipe.execute()
+                        return True
+                    except WatchError:
+                        # Another write touched the session; check it again
+                        continue
+        except Exception as e:
+            logger.error("Failed to store session in Redis", error=str(e))
+            # Fallback to in-memory
+            self._store_in_memory(session)
+            return True
+    
+    def _index_session(self, pipe: Pipeline, session: Session, ttl: int) -> None:
+        """Queue the commands that index a session under its user.
+        
+        The index lives as long as the user's longest-lived session: NX sets
+        the first expiry, GT only ever extends it (both need Redis 7.0+).
+        """
+        user_key = f"{self.user_index_prefix}{session.user_id}"
+        pipe.sadd(user_key, session.session_id)
+        pipe.expire(user_key, ttl, nx=True)
+        pipe.expire(user_key, ttl, gt=True)
+    
+    def _shard(self, session_id: str) -> Dict[str, Session]:
+        """Get the in-memory shard that holds a session ID."""
+        return self._shards[hash(session_id) & (IN_MEMORY_SHARDS - 1)]
+    
+    def _store_in_memory(self, session: Session) -> None:
+        """Store a session in the in-memory store and schedule its expiry."""
+        self._shard(session.session_id)[session.session_id] = session
+        heapq.heappush(self._expiry_heap, (session.expires_at, session.session_id))
+    
+    async def _migrate_user_index(self) -> None:
+        """Add sessions stored before the per-user index existed to the index.
+        
+        Runs once per Redis database: a marker key is set before the scan, so
+        later startups (and other workers starting at the same time) skip it,
+        and get_user_sessions never has to scan.
+        """
+        marker_key = f"{self.user_index_prefix.rstrip(':')}_migrated"
+        if not await self._redis.set(marker_key, 1, nx=True):
+            return
+        try:
+            # user_id -> (session IDs, latest expiry)
+            found: Dict[str, Tuple[List[bytes], float]] = {}
+            prefix_length = len(self.key_prefix.encode())
+            keys: List[bytes] = []
+            async for key in self._redis.scan_iter(match=f"{self.key_prefix}*", count=CLEANUP_BATCH_SIZE):
+                keys.append(key)
+                if len(keys) >= CLEANUP_BATCH_SIZE:
+                    await self._collect_session_owners(keys, found, prefix_length)
+                    keys = []
+            if keys:
+                await self._collect_session_owners(keys, found, prefix_length)
+            
+            if found:
+                now = time.time()
+                pipe = self._redis.pipeline(transaction=False)
+                for user_id, (session_ids, expires_at) in found.items():
+                    user_key = f"{self.user_index_prefix}{user_id}"
+                    ttl = max(int(expires_at - now), 1)
+                    pipe.sadd(user_key, *session_ids)
+                    pipe.expire(user_key, ttl, nx=True)
+                    pipe.expire(user_key, ttl, gt=True)
+                await pipe.execute()
+            logger.info(
+                "Migrated sessions to the per-user index",
+                users=len(found),
+                sessions=sum(len(ids) for ids, _ in found.values())
+            )
+        except Exception:
+            # Let the next startup retry
+            await self._redis.delete(marker_key)
+            raise
+    
+    async def _collect_session_owners(
+        self,
+        keys: List[bytes],
+        found: Dict[str, Tuple[List[bytes], float]],
+        prefix_length: int
+    ) -> None:
+        """Group a batch of session keys by user for _migrate_user_index."""
+        pipe = self._redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.hmget(key, "user_id", "expires_at")
+        values = await pipe.execute(raise_on_error=False)
+        for key, value in zip(keys, values):
+            if isinstance(value, ResponseError):
+                # Sessions written before the hash layout are JSON strings
+                data = await self._redis.get(key)
+                if not data:
+                    continue
+                session_data = orjson.loads(data)
+                user_id = session_data.get("user_id")
+                expires_at = _to_epoch(session_data["expires_at"])
+            else:
+                raw_user_id, raw_expires_at = value
+                if raw_user_id is None or raw_expires_at is None:
+                    continue
+                user_id = raw_user_id.decode()
+                expires_at = float(raw_expires_at)
+            if not user_id:
+                continue
+            session_ids, latest = found.get(user_id, ([], 0.0))
+            session_ids.append(key[prefix_length:])
+            found[user_id] = (session_ids, max(latest, expires_at))
     
     async def get_user_sessions(self, user_id: str) -> List[Session]:
         """Get all sessions for a user.
@@ -277,32 +545,45 @@ class SessionManager:
         
         if self._use_redis and self._redis:
             try:
-                # Scan for all session keys
-                cursor = 0
-                while True:
-                    cursor, keys = await self._redis.scan(
-                        cursor,
-                        match=f"{self.key_prefix}*",
-                        count=100
-                    )
-                    
-                    for key in keys:
-                        data = await self._redis.get(key)
-                        if data:
-                            session_data = json.loads(data)
-                            if session_data.get("user_id") == user_id:
-                                session = Session.from_dict(session_data)
-                                if not session.is_expired():
-                                    sessions.append(session)
-                    
-                    if cursor == 0:
-                        break
+                # Look up the user's index instead of scanning every session key
+                user_key = f"{self.user_index_prefix}{user_id}"
+                session_ids = list(await self._redis.smembers(user_key))
+                if session_ids:
+                    pipe = self._redis.pipeline(transaction=False)
+                    for sid in session_ids:
+                        pipe.hgetall(self.key_prefix.encode() + sid)
+                    values = await pipe.execute(raise_on_error=False)
+                    stale_ids = []
+                    now = time.time()
+                    raw_user_id = user_id.encode()
+                    for sid, fields in zip(session_ids, values):
+                        if isinstance(fields, ResponseError):
+                            # Sessions written before the hash layout are JSON strings
+                            data = await self._redis.get(self.key_prefix.encode() + sid)
+                            if not data:
+                                continue
+                            session_data = orjson.loads(data)
+                            if session_data.get("user_id") == user_id and _to_epoch(session_data["expires_at"]) >= now:
+                                sessions.append(Session.from_dict(session_data))
+                            continue
+                        if not fields:
+                            # Expired or deleted; drop it from the index
+                            stale_ids.append(sid)
+                            continue
+                        # Filter on the raw fields so skipped entries are never decoded
+                        if fields.get(b"user_id") != raw_user_id:
+                            continue
+                        if float(fields[b"expires_at"]) < now:
+                            continue
+                        sessions.append(Session.from_dict(_session_dict_from_fields(fields)))
+                    if stale_ids:
+                        await self._redis.srem(user_key, *stale_ids)
             except Exception as e:
                 logger.error("Failed to get user sessions from Redis", error=str(e))
         else:
             # In-memory fallback
             sessions = [
-                session for session in self._in_memory_store.values()
+                session for shard in self._shards for session in shard.values()
                 if session.user_id == user_id and not session.is_expired()
             ]
         
@@ -310,6 +591,9 @@ class SessionManager:
     
     async def shutdown(self) -> None:
         """Shutdown the session manager."""
+        if self._cleanup_task:
+            self._cleanup_task.cancel()
+            self._cleanup_task = None
         if self._redis:
             await self._redis.close()
             logger.info("Redis connection closed") 
\ No newline at end of file
@@ -23,16 +23,19 @@ class PerformanceTracker:
         self.operation_name = operation_name
         self.timings: Dict[str, float] = {}
         self.metadata: Dict[str, Any] = {}
-        self.start_time = time.time()
+        # Durations use the monotonic performance counter, which is not
+        # affected by wall-clock adjustments
+        self.start_time = time.perf_counter()
         
     def record_duration(self, phase_name: str, duration: float) -> None:
         """Record the duration of a specific phase.
         
         Args:
             phase_name: Name of the phase (e.g., "plugin_init", "mcp_session")
-            duration: Duration in seconds
+            duration: Duration in seconds (kept unrounded; rounded for
+                display in log_summary)
         """
-        self.timings[phase_name] = round(duration, 2)
+        self.timings[phase_name] = duration
         
     def record_phase_start(self, phase_name: str) -> float:
         """Record the start of a phase and return the start time.
@@ -41,9 +44,10 @@ class PerformanceTracker:
             phase_name: Name of the phase
             
         Returns:
-            The start time for this phase
+            The start time for this phase (a perf_counter value, only
+            meaningful for record_phase_end)
         """
-        return time.time()
+        return time.perf_counter()
         
     def record_phase_end(self, phase_name: str, start_time: float) -> None:
         """Record the end of a phase using its start time.
@@ -52,7 +56,7 @@ class PerformanceTracker:
             phase_name: Name of the phase
             start_time: When the phase started (from record_phase_start)
         """
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         self.record_duration(phase_name, duration)
         
     def add_metadata(self, **kwargs) -> None:
@@ -65,7 +69,7 @@ class PerformanceTracker:
         
     def get_total_time(self) -> float:
         """Get the total elapsed time since tracker creation."""
-        return round(time.time() - self.start_time, 2)
+        return round(time.perf_counter() - self.start_time, 2)
         
     def log_summary(self, logger: logging.Logger) -> None:
         """Log a single-line summary of all collected metrics at INFO level.
@@ -73,29 +77,14 @@ class PerformanceTracker:
         Args:
             logger: Logger instance to use
         """
-        total_time = self.get_total_time()
-        
-        # Build the timing breakdown string
-        timing_parts = [f"{k}={v}s" for k, v in sorted(self.timings.items())]
-        timing_str = " | ".join(timing_parts) if timing_parts else "no_breakdown"
-        
-        # Build the metadata string
-        metadata_parts = [f"{k}={v}" for k, v in sorted(self.metadata.items())]
-        metadata_str = " | ".join(metadata_parts) if metadata_parts else ""
-        
-        # Construct the final log message
-        message_parts = [
-            f"{self.operation_name} completed",
-            f"total_time={total_time}s"
-        ]
-        
-        if timing_str != "no_breakdown":
-            message_parts.append(timing_str)
-            
-        if metadata_str:
-            message_parts.append(metadata_str)
-            
-        message = " | ".join(message_parts)
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        # Phases and metadata are listed in the order they were recorded
+        parts = [f"{self.operation_name} completed", f"total_time={self.get_total_time()}s"]
+        parts.extend(f"{k}={v:.2f}s" for k, v in self.timings.items())
+        parts.extend(f"{k}={v}" for k, v in self.metadata.items())
+        message = " | ".join(parts)
         
         # Always log at INFO level as requested
         logger.info(message)
@@ -0,0 +1,140 @@
+"""Tests for the external MCP HTTP client."""
+
+import asyncio
+
+import orjson
+import pytest
+
+from src.core.external_mcp import external_mcp_client
+from src.core.external_mcp.external_mcp_client import ExternalMCPClient
+from src.core.external_mcp.external_mcp_models import MCPToolResponse
+
+
+class FakeContent:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def iter_any(self):
+        yield self.body
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: bytes = b"", headers=None, on_enter=None):
+        self.status = status
+        self.headers = headers or {}
+        self.content_type = "text/event-stream"
+        self.content = FakeContent(body)
+        self.on_enter = on_enter
+
+    async def __aenter__(self):
+        if self.on_enter is not None:
+            await self.on_enter()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeMCPServer:
+    """Stands in for the shared aiohttp session, answering like a streamable-http server."""
+
+    closed = False
+
+    def __init__(self, notification_delay: float = 0):
+        self.methods = []
+        self.notification_delay = notification_delay
+        self.notified = False
+        # Requests the server received before the handshake completed
+        self.early_requests = []
+
+    def post(self, url, data, headers):
+        request = orjson.loads(data)
+        method = request["method"]
+        self.methods.append(method)
+        if method == "initialize":
+            return FakeResponse(200, self._sse(request["id"], {}), {"mcp-session-id": "session-1"})
+        if method == "notifications/initialized":
+            return FakeResponse(202, on_enter=self._notify)
+        if not self.notified:
+            self.early_requests.append(method)
+        if method == "tools/list":
+            return FakeResponse(200, self._sse(request["id"], {"tools": [{"name": "search"}]}))
+        if method == "tools/call":
+            content = [{"type": "text", "text": request["params"]["name"]}]
+            return FakeResponse(200, self._sse(request["id"], {"content": content}))
+        return FakeResponse(404)
+
+    async def _notify(self):
+        await asyncio.sleep(self.notification_delay)
+        self.notified = True
+
+    @staticmethod
+    def _sse(request_id, result) -> bytes:
+        message = orjson.dumps({"jsonrpc": "2.0", "id": request_id, "result": result})
+        return b"event: message\r\ndata: " + message + b"\r\n\r\n"
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    external_mcp_client._MCP_SESSION_CACHE.clear()
+    external_mcp_client._TOOLS_CACHE.clear()
+    yield
+    external_mcp_client._MCP_SESSION_CACHE.clear()
+    external_mcp_client._TOOLS_CACHE.clear()
+
+
+@pytest.mark.asyncio
+async def test_list_tools_after_initialize_reuses_the_session():
+    """initialize_session then list_tools performs a single handshake."""
+    server = FakeMCPServer()
+    client = ExternalMCPClient("http://mcp.test")
+    client.session = server
+
+    await client.initialize_session()
+    tools = await client.list_tools()
+
+    assert tools == [{"name": "search"}]
+    assert server.methods == ["initialize", "notifications/initialized", "tools/list"]
+    assert client.session_id == "session-1"
+    assert external_mcp_client._MCP_SESSION_CACHE["http://mcp.test"][0] == "session-1"
+
+
+@pytest.mark.asyncio
+async def test_cached_tool_responses_are_copies(monkeypatch):
+    """Mutating a returned response does not change what later cache hits return."""
+    client = ExternalMCPClient("http://mcp.test")
+    client.initialized = True
+    calls = []
+
+    async def execute(tool_name, request_data, attempt):
+        calls.append(tool_name)
+        return MCPToolResponse(content=[{"type": "text", "text": "profile"}])
+
+    monkeypatch.setattr(client, "_execute_tool_call", execute)
+
+    first = await client.call_tool("get_profile", {"id": 1}, cache_ttl=60)
+    first.content.append({"type": "text", "text": "injected"})
+    second = await client.call_tool("get_profile", {"id": 1}, cache_ttl=60)
+    second.content[0]["text"] = "changed"
+    third = await client.call_tool("get_profile", {"id": 1}, cache_ttl=60)
+
+    assert calls == ["get_profile"]
+    assert third.content == [{"type": "text", "text": "profile"}]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_wait_for_the_initialized_notification():
+    """No coroutine sharing the client sends a request before the handshake completes."""
+    server = FakeMCPServer(notification_delay=0.05)
+    client = ExternalMCPClient("http://mcp.test")
+    client.session = server
+
+    await client.initialize_session()
+    first, second = await asyncio.gather(
+        client.call_tool("search", {"q": "a"}),
+        client.call_tool("lookup", {"q": "b"}),
+    )
+
+    assert server.early_requests == []
+    assert [first.content[0]["text"], second.content[0]["text"]] == ["search", "lookup"]
+    assert server.methods.count("initialize") == 1
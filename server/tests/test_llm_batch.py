@@ -0,0 +1,164 @@
+"""Tests for Batch API resume parsing."""
+
+import httpx
+import orjson
+import pytest
+
+from src.plugins.pdf_resume_plugin import llm_batch, llm_cache
+from src.plugins.pdf_resume_plugin.llm_cache import LLMCache, MemoryCacheBackend
+from src.plugins.pdf_resume_plugin.llm_fallback import parse_llm_response
+
+RESUME_JSON = orjson.dumps({
+    "personal_info": {"name": "Jane Doe", "email": "jane@example.com"},
+    "education": [{"institution": "State University", "degree": "BSc", "field": "Computer Science"}],
+    "experience": [{"organization": "Acme Corp", "role": "Software Engineer",
+                    "description": "Built data pipelines and internal tooling for analytics teams"}],
+    "skills": ["Python", "SQL"],
+    "projects": [],
+    "additional_sections": {},
+}).decode()
+
+
+class FakeBatchServer:
+    """Anthropic Message Batches endpoints backed by canned responses."""
+
+    def __init__(self, statuses, succeeded, text=RESUME_JSON[1:]):
+        self.statuses = list(statuses)
+        self.succeeded = succeeded
+        self.text = text
+        self.submitted = []
+        self.cancelled = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v1/messages/batches":
+            self.submitted = orjson.loads(request.content)["requests"]
+            return httpx.Response(200, json={"id": "batch_1"})
+        if path == "/v1/messages/batches/batch_1":
+            status = self.statuses.pop(0)
+            if isinstance(status, int):
+                return httpx.Response(status)
+            return httpx.Response(200, json={
+                "id": "batch_1",
+                "processing_status": status,
+                "results_url": "https://api.anthropic.com/v1/messages/batches/batch_1/results",
+            })
+        if path == "/v1/messages/batches/batch_1/results":
+            lines = []
+            for request_entry in self.submitted:
+                custom_id = request_entry["custom_id"]
+                if custom_id in self.succeeded:
+                    result = {"type": "succeeded",
+                              "message": {"content": [{"type": "text", "text": self.text}]}}
+                else:
+                    result = {"type": "errored"}
+                lines.append(orjson.dumps({"custom_id": custom_id, "result": result}))
+            return httpx.Response(200, content=b"\n".join(lines))
+        if path == "/v1/messages/batches/batch_1/cancel":
+            self.cancelled = True
+            return httpx.Response(200, json={"id": "batch_1"})
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def batch_env(monkeypatch):
+    """Enable the Batch API, stub the synchronous path and use a fresh cache."""
+    monkeypatch.setattr(llm_batch.settings, "llm_use_batch_api", True)
+    monkeypatch.setattr(llm_batch.settings, "llm_batch_min_items", 2)
+    monkeypatch.setattr(llm_batch.settings, "anthropic_api_key", "test-key")
+    monkeypatch.setattr(llm_batch, "POLL_INITIAL_INTERVAL", 0)
+    cache = LLMCache(MemoryCacheBackend(16), ttl=60)
+    monkeypatch.setattr(llm_cache, "_LLM_CACHE", cache)
+
+    sync_parsed = []
+
+    async def fake_parse_many(items, provider_name, model_name):
+        sync_parsed.extend(text for text, _ in items)
+        return [{"sync": text} for text, _ in items]
+
+    monkeypatch.setattr(llm_batch, "parse_many_with_llm", fake_parse_many)
+
+    def use_server(server):
+        transport = httpx.MockTransport(server.handler)
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            llm_batch.httpx, "AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs)
+        )
+
+    return cache, sync_parsed, use_server
+
+
+@pytest.mark.asyncio
+async def test_batch_results_are_cached_and_only_missing_items_reparsed(batch_env):
+    """Transient poll errors are retried; errored items fall back individually."""
+    cache, sync_parsed, use_server = batch_env
+    server = FakeBatchServer(["in_progress", 503, "ended"], succeeded={"0", "2"})
+    use_server(server)
+    items = [("resume one", {}), ("resume two", {}), ("resume three", {})]
+
+    results = await llm_batch.parse_with_llm_batch(items, "anthropic", "claude-test")
+
+    assert results[0]["skills"] == ["Python", "SQL"]
+    assert results[2]["skills"] == ["Python", "SQL"]
+    assert results[1] == {"sync": "resume two"}
+    assert sync_parsed == ["resume two"]
+    assert not server.cancelled
+
+    key = LLMCache.make_key("resume one", "anthropic", "claude-test", llm_batch.PROMPT_VERSION)
+    assert (await cache.get(key))["skills"] == ["Python", "SQL"]
+
+
+@pytest.mark.asyncio
+async def test_cached_items_are_not_submitted(batch_env):
+    """Items with a cached parse are served from the cache, not the batch."""
+    cache, sync_parsed, use_server = batch_env
+    server = FakeBatchServer(["ended"], succeeded={"0", "1"})
+    use_server(server)
+    key = LLMCache.make_key("resume one", "anthropic", "claude-test", llm_batch.PROMPT_VERSION)
+    await cache.set(key, {"cached": True})
+    items = [("resume one", {}), ("resume two", {}), ("resume three", {})]
+
+    results = await llm_batch.parse_with_llm_batch(items, "anthropic", "claude-test")
+
+    assert results[0] == {"cached": True}
+    assert len(server.submitted) == 2
+    assert results[1]["skills"] == results[2]["skills"] == ["Python", "SQL"]
+    assert sync_parsed == []
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_cancelled_before_fallback(batch_env):
+    """A non-transient poll error cancels the batch, then every item parses synchronously."""
+    _, sync_parsed, use_server = batch_env
+    server = FakeBatchServer([400], succeeded=set())
+    use_server(server)
+    items = [("resume one", {}), ("resume two", {})]
+
+    results = await llm_batch.parse_with_llm_batch(items, "anthropic", "claude-test")
+
+    assert server.cancelled
+    assert results == [{"sync": "resume one"}, {"sync": "resume two"}]
+    assert sync_parsed == ["resume one", "resume two"]
+
+
+def test_parse_llm_response_flags_repaired_json():
+    assert parse_llm_response(RESUME_JSON) == (orjson.loads(RESUME_JSON), False)
+
+    parsed, repaired = parse_llm_response(RESUME_JSON[:-1] + ",}")
+    assert repaired
+    assert parsed["skills"] == ["Python", "SQL"]
+
+
+@pytest.mark.asyncio
+async def test_repaired_batch_results_are_not_cached(batch_env):
+    cache, _, use_server = batch_env
+    server = FakeBatchServer(["ended"], succeeded={"0", "1"}, text=RESUME_JSON[1:-1] + ",}")
+    use_server(server)
+    items = [("resume one", {}), ("resume two", {})]
+
+    results = await llm_batch.parse_with_llm_batch(items, "anthropic", "claude-test")
+
+    assert results[0]["skills"] == ["Python", "SQL"]
+    key = LLMCache.make_key("resume one", "anthropic", "claude-test", llm_batch.PROMPT_VERSION)
+    assert await cache.get(key) is None
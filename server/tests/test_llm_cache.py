@@ -0,0 +1,65 @@
+"""Tests for the LLM resume parse cache."""
+
+import fakeredis
+import pytest
+
+from src.plugins.pdf_resume_plugin import llm_cache
+from src.plugins.pdf_resume_plugin.llm_cache import LLMCache, MemoryCacheBackend, RedisCacheBackend
+
+
+def test_key_ignores_whitespace_but_not_provider_model_or_prompt():
+    key = LLMCache.make_key("Jane Doe\n  Python", "openai", "gpt-test", "v1")
+
+    assert LLMCache.make_key(" Jane  Doe Python\n", "openai", "gpt-test", "v1") == key
+    assert LLMCache.make_key("Jane Doe Python", "anthropic", "gpt-test", "v1") != key
+    assert LLMCache.make_key("Jane Doe Python", "openai", "gpt-other", "v1") != key
+    assert LLMCache.make_key("Jane Doe Python", "openai", "gpt-test", "v2") != key
+    assert LLMCache.make_key("Jane Doe Java", "openai", "gpt-test", "v1") != key
+
+
+@pytest.mark.asyncio
+async def test_memory_entries_expire_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "monotonic", lambda: now[0])
+    cache = LLMCache(MemoryCacheBackend(8), ttl=60)
+    await cache.set("key", {"skills": ["Python"]})
+
+    now[0] += 59
+    assert await cache.get("key") == {"skills": ["Python"]}
+    now[0] += 2
+    assert await cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_the_least_recently_used_entry():
+    cache = LLMCache(MemoryCacheBackend(2), ttl=60)
+    await cache.set("a", {"n": 1})
+    await cache.set("b", {"n": 2})
+    await cache.get("a")
+    await cache.set("c", {"n": 3})
+
+    assert await cache.get("a") == {"n": 1}
+    assert await cache.get("b") is None
+    assert await cache.get("c") == {"n": 3}
+
+
+@pytest.mark.asyncio
+async def test_hits_are_independent_copies():
+    cache = LLMCache(MemoryCacheBackend(8), ttl=60)
+    await cache.set("key", {"skills": ["Python"]})
+
+    (await cache.get("key"))["skills"].append("Injected")
+
+    assert await cache.get("key") == {"skills": ["Python"]}
+
+
+@pytest.mark.asyncio
+async def test_redis_entries_are_stored_with_the_ttl():
+    backend = RedisCacheBackend("redis://test")
+    backend._redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    cache = LLMCache(backend, ttl=120)
+
+    await cache.set("key", {"skills": ["Python"]})
+
+    assert await cache.get("key") == {"skills": ["Python"]}
+    assert 0 < await backend._redis.ttl("pdf:llm:key") <= 120
@@ -0,0 +1,95 @@
+"""Tests for LLM response handling in the resume fallback parser."""
+
+import logging
+
+from src.plugins.pdf_resume_plugin.llm_fallback import (
+    _JsonObjectScanner,
+    estimate_tokens,
+    normalize_resume_data,
+    parse_llm_response,
+    truncate_resume_text,
+)
+
+STREAMED = 'Sure: {"a": "x}\\"{\\\\", "b": {"c": "\\\\\\"}"}} trailing {"d": 1}'
+OBJECT_END = STREAMED.index(" trailing")
+
+
+def _scan(chunks):
+    scanner = _JsonObjectScanner()
+    offset = 0
+    for chunk in chunks:
+        end = scanner.feed(chunk)
+        if end != -1:
+            return offset + end
+        offset += len(chunk)
+    return -1
+
+
+def test_scanner_finds_object_end_for_every_chunk_split():
+    """Splits inside strings, between a backslash and the escaped char, and at braces."""
+    assert _scan([STREAMED]) == OBJECT_END
+    for i in range(len(STREAMED) + 1):
+        for j in range(i, len(STREAMED) + 1):
+            assert _scan([STREAMED[:i], STREAMED[i:j], STREAMED[j:]]) == OBJECT_END, (i, j)
+
+
+def test_scanner_carries_an_escape_into_the_next_chunk():
+    assert _scan(['{"a": "}', '\\"}']) == -1
+    assert _scan(['{"a": "\\', '"}"}']) == 12
+
+
+def test_percent_fix_only_touches_experience_responsibilities():
+    original = "Grew revenue 30% and cut costs 15%"
+    data = {
+        "experience": [{"role": "Manager", "responsibilities": ["Grew revenue 30", "Cut  costs 15%"]}],
+        "projects": [{"name": "Pilot", "responsibilities": ["Led 30 people"]}],
+        "additional_sections": {"responsibilities": ["Mentored 30 students"]},
+    }
+
+    normalized = normalize_resume_data(original, data)
+
+    assert normalized["experience"][0]["responsibilities"] == ["Grew revenue 30%", "Cut costs 15%"]
+    assert normalized["projects"][0]["responsibilities"] == ["Led 30 people"]
+    assert normalized["additional_sections"]["responsibilities"] == ["Mentored 30 students"]
+
+
+def test_content_length_is_not_reported_when_the_walk_is_skipped(caplog):
+    """Too few fields fail before content is measured, and the log says so."""
+    sparse = '{"personal_info": {"name": "' + "x" * 500 + '"}}'
+
+    with caplog.at_level(logging.DEBUG):
+        assert parse_llm_response(sparse) == ({}, False)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("content_length=None" in message for message in messages)
+    assert any("content_length=not measured" in message for message in messages)
+    assert not any("content_length=0" in message for message in messages)
+
+
+RESUME = (
+    "Jane Doe\njane@example.com\n"
+    "EXPERIENCE\n" + "".join(f"Role {i}: built and maintained data pipelines for analytics\n" for i in range(200))
+    + "EDUCATION\nState University, BSc Computer Science\n"
+    "SKILLS\nPython, SQL, Go\n"
+)
+
+
+def test_truncation_keeps_every_section_within_the_budget():
+    """The long section is cut on a line boundary; short sections stay whole."""
+    truncated = truncate_resume_text(RESUME, 300)
+
+    assert estimate_tokens(truncated) <= 300
+    assert truncated.startswith("Jane Doe\njane@example.com\nEXPERIENCE\nRole 0:")
+    assert truncated.endswith("EDUCATION\nState University, BSc Computer Science\nSKILLS\nPython, SQL, Go\n")
+    original_lines = set(RESUME.splitlines())
+    assert all(line in original_lines for line in truncated.splitlines())
+
+
+def test_text_within_the_budget_is_unchanged():
+    assert truncate_resume_text(RESUME, estimate_tokens(RESUME)) is RESUME
+
+
+def test_non_ascii_characters_count_as_a_token_each():
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("abcdéfgh") == 3
+    assert estimate_tokens("履歴書") == 3
@@ -0,0 +1,73 @@
+"""Tests for the structured logging adapter and configuration."""
+
+import logging
+import logging.handlers
+
+from src.utils.logging import StructuredLoggerAdapter
+
+
+class _Unprintable:
+    def __str__(self):
+        raise RuntimeError("no str")
+
+    def __repr__(self):
+        return "<unprintable>"
+
+
+def _buffered_logger(name: str):
+    target = logging.handlers.BufferingHandler(capacity=100)
+    buffer = logging.handlers.MemoryHandler(100, flushLevel=logging.CRITICAL, target=target)
+    base = logging.getLogger(name)
+    base.handlers = [buffer]
+    base.propagate = False
+    base.setLevel(logging.DEBUG)
+    return StructuredLoggerAdapter(base), buffer, target
+
+
+def test_buffered_records_keep_values_from_log_time():
+    """Mutating a logged value before the buffer flushes does not change the record."""
+    logger, buffer, target = _buffered_logger("tests.logging.snapshot")
+    params = {"page": 1}
+
+    logger.info("Fetched page", params=params)
+    params["page"] = 2
+    buffer.flush()
+
+    assert target.buffer[0].getMessage() == "Fetched page | params={'page': 1}"
+
+
+def test_values_fall_back_to_repr_and_percent_stays_literal():
+    logger, buffer, target = _buffered_logger("tests.logging.format")
+
+    logger.info("Value", value=_Unprintable())
+    logger.info("Progress %s", "half", ratio="50%")
+    buffer.flush()
+
+    assert target.buffer[0].getMessage() == "Value | value=<unprintable>"
+    assert target.buffer[1].getMessage() == "Progress half | ratio=50%"
+
+
+def test_configure_logging_applies_changed_buffer_size(monkeypatch):
+    """Calling again with the same level but another buffer size replaces the handler."""
+    from src.utils import logging as app_logging
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    monkeypatch.setattr(app_logging, "_CONFIGURED", None)
+    root.handlers = []
+    try:
+        app_logging.configure_logging("INFO")
+        assert isinstance(root.handlers[0], logging.StreamHandler)
+
+        app_logging.configure_logging("INFO", buffer_size=10)
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0], logging.handlers.MemoryHandler)
+
+        handler = root.handlers[0]
+        app_logging.configure_logging("INFO", buffer_size=10)
+        assert root.handlers == [handler]
+    finally:
+        for handler in root.handlers:
+            handler.close()
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
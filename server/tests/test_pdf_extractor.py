@@ -0,0 +1,94 @@
+"""Tests for PDF text extraction."""
+
+import pytest
+
+from src.plugins.pdf_resume_plugin import extractor
+
+
+def make_pdf(text: str) -> bytes:
+    """Build a minimal one-page PDF showing the given text."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b"%010d 00000 n \n" % offset
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref
+    )
+    return bytes(pdf)
+
+
+@pytest.mark.asyncio
+async def test_extraction_recovers_after_worker_dies():
+    """A killed worker breaks the pool; the next extraction rebuilds it."""
+    pdf = make_pdf("Jane Doe Software Engineer")
+    try:
+        assert await extractor.extract_text_from_pdf_async(pdf) == "Jane Doe Software Engineer"
+
+        pool = extractor._PDF_POOL
+        for process in list(pool._processes.values()):
+            process.kill()
+            process.join()
+
+        assert await extractor.extract_text_from_pdf_async(pdf) == "Jane Doe Software Engineer"
+        assert extractor._PDF_POOL is not pool
+    finally:
+        extractor.shutdown_pdf_pool()
+
+
+SECTION_LAYOUTS = [
+    # Upper-case headings separated by blank lines
+    "Jane Doe\njane@example.com\n\nEDUCATION\nState University\nBSc 2018\n\nEXPERIENCE\nAcme Corp\n"
+    "- Built things\n\nSKILLS\nPython, SQL\n\nPROJECTS\nParser\n\nLANGUAGES\nEnglish\n",
+    # Title case, colons, and names that only start a heading
+    "Jane Doe\nEducation:\nState University\nWork Experience\nExperience :\nAcme\n"
+    "Technical Skills\nPython\nSkills:\nSQL\n",
+    # Indented headings with trailing spaces
+    "Jane\n   Skills  \n Python\n  Education:\n  Uni\n",
+    # A repeated heading; only the first one starts the section
+    "EXPERIENCE\nA\nSKILLS\nPy\nEXPERIENCE\nB\nEDUCATION\nU",
+    # Section words inside sentences are not headings
+    "Summary mentions education and skills in passing\nSKILLS\nPython skills\n"
+    "Experience with SQL\nEDUCATION\nUni\n",
+    # Windows line endings
+    "Jane\r\nSKILLS\r\nPython\r\nEDUCATION\r\nUni\r\n",
+    # Headings that are not terminators run until the next terminator
+    "Jane\nEMPLOYMENT\nAcme\nWORK\nBeta\nLOCATION\nBerlin\nADDRESS\nMain St\nSKILLS\nPy",
+    # Lower-case headings at the end of the text
+    "Jane\nprojects\nX\nlanguages\nFrench",
+]
+
+
+def _sections_one_at_a_time(text):
+    sections = {}
+    for name in extractor.SECTION_NAMES:
+        section = extractor.extract_section(text, name)
+        if section is not None:
+            sections[name] = section
+    return sections
+
+
+@pytest.mark.parametrize("text", SECTION_LAYOUTS)
+def test_split_all_sections_matches_extract_section(text):
+    assert extractor.split_all_sections(text) == _sections_one_at_a_time(text)
+
+
+def test_split_all_sections_ends_a_section_at_the_next_line_heading():
+    """The documented difference: an empty section directly above another heading."""
+    text = "Name\nSKILLS\nEDUCATION\nUni\n"
+
+    assert extractor.split_all_sections(text) == {"skills": "", "education": "Uni"}
+    assert extractor.extract_section(text, "skills") == "EDUCATION\nUni"
@@ -0,0 +1,70 @@
+"""Tests for the PDF resume plugin's batch entry point."""
+
+import pytest
+
+from src.core.plugin_system.plugin_interface import PluginRequest
+from src.plugins.pdf_resume_plugin import extractor
+from src.plugins.pdf_resume_plugin import plugin as plugin_module
+from src.plugins.pdf_resume_plugin.plugin import PDFResumePlugin
+
+TEXTS = {
+    "https://example.com/a.pdf": "Jane Doe\n\nSKILLS\nPython • SQL\n\nEDUCATION\nState University",
+    "https://example.com/b.pdf": "John Roe\n\nSKILLS\nGo\n\nEDUCATION\nState University",
+}
+
+
+@pytest.fixture
+def plugin_env(monkeypatch):
+    """Serve canned PDF texts and record what goes to the LLM batch."""
+    async def download_pdf(url):
+        return url.encode()
+
+    async def extract_text(content, clean=True):
+        return TEXTS[content.decode()]
+
+    llm_items = []
+
+    async def parse_with_llm_batch(items, provider_name, model_name):
+        llm_items.extend(items)
+        return [{"llm": text.split("\n", 1)[0]} for text, _ in items]
+
+    monkeypatch.setattr(plugin_module, "download_pdf", download_pdf)
+    monkeypatch.setattr(plugin_module, "extract_text_from_pdf_async", extract_text)
+    monkeypatch.setattr(plugin_module, "parse_with_llm_batch", parse_with_llm_batch)
+    # Resumes without Python count as incomplete direct extractions
+    monkeypatch.setattr(plugin_module, "needs_llm_fallback", lambda resume: "Python" not in resume.skills)
+    yield llm_items
+    extractor.shutdown_pdf_pool()
+
+
+@pytest.mark.asyncio
+async def test_batch_request_sends_only_incomplete_resumes_to_the_llm(plugin_env):
+    plugin = PDFResumePlugin()
+    await plugin.initialize()
+    request = PluginRequest(
+        request_id="batch-1",
+        action="parse_resumes",
+        parameters={"pdf_urls": list(TEXTS), "parsing_mode": "direct_first"},
+    )
+
+    assert await plugin.validate_request(request)
+    assert not await plugin.validate_request(PluginRequest(action="parse_resumes", parameters={}))
+    response = await plugin.execute(request)
+
+    assert response.status == "success"
+    resumes = response.data["parsed_resumes"]
+    assert [resume["source_url"] for resume in resumes] == list(TEXTS)
+    assert resumes[0]["parsed_resume"]["skills"] == ["Python", "SQL"]
+    assert resumes[1]["parsed_resume"] == {"llm": "John Roe"}
+    assert plugin_env == [(TEXTS["https://example.com/b.pdf"], {})]
+
+
+@pytest.mark.asyncio
+async def test_llm_first_batch_parses_every_resume_with_the_llm(plugin_env):
+    plugin = PDFResumePlugin()
+    await plugin.initialize()
+
+    results = await plugin.parse_resume_texts(list(TEXTS.values()), parsing_mode="llm_first")
+
+    assert results == [{"llm": "Jane Doe"}, {"llm": "John Roe"}]
+    assert len(plugin_env) == 2
@@ -0,0 +1,102 @@
+"""Tests for direct resume text parsing."""
+
+import pytest
+
+from src.plugins.pdf_resume_plugin import extractor
+from src.plugins.pdf_resume_plugin import parser as parser_module
+from src.plugins.pdf_resume_plugin.parser import (
+    ResumeBatchParser,
+    _iter_bullets,
+    extract_personal_info,
+    extract_skills,
+    parse_resume_text_async,
+)
+
+
+def test_inline_bullets_are_separate_items():
+    """pdfminer often puts a whole "•" list on one line."""
+    assert list(_iter_bullets("Python • Java • SQL")) == ["Python", "Java", "SQL"]
+
+    text = "Jane Doe\n\nSKILLS\nPython • Java • SQL\n\nEDUCATION\nState University"
+    assert extract_skills(text) == ["Python", "Java", "SQL"]
+
+
+def test_hyphens_inside_a_line_do_not_start_bullets():
+    """Only line-start "-" and "*" are markers; dates keep their hyphens."""
+    entry = "Acme Corp 2019 - 2021\n- Built data-heavy services\n* Led a team\n\nNext entry"
+    assert list(_iter_bullets(entry)) == ["Built data-heavy services", "Led a team"]
+
+
+def test_batch_parser_reuses_the_shared_pool():
+    """Batches run in the persistent PDF worker pool and keep input order."""
+    texts = [
+        f"Candidate {i}\n\nSKILLS\nPython • SQL • Skill{i}\n\nEDUCATION\nState University"
+        for i in range(6)
+    ]
+    parser = ResumeBatchParser()
+    try:
+        first = parser.parse_many(texts)
+        pool = extractor._PDF_POOL
+        second = parser.parse_many(texts)
+
+        assert extractor._PDF_POOL is pool
+        assert [resume.skills for resume in first] == [resume.skills for resume in second]
+        assert [resume.skills[-1] for resume in first] == [f"Skill{i}" for i in range(6)]
+    finally:
+        extractor.shutdown_pdf_pool()
+
+
+def test_batch_chunksize_spreads_work_across_workers(monkeypatch):
+    monkeypatch.setattr(parser_module, "PDF_POOL_MAX_WORKERS", 4)
+    parser = ResumeBatchParser()
+    assert parser._chunksize(16) == 1
+    assert parser._chunksize(160) == 10
+    assert ResumeBatchParser(chunksize=8)._chunksize(16) == 8
+
+
+@pytest.mark.asyncio
+async def test_cached_parses_are_independent_copies():
+    """Mutating a returned resume does not change later cache hits."""
+    text = "Jane Doe\n\nSKILLS\nPython • SQL\n\nEDUCATION\nState University"
+    first = await parse_resume_text_async(text)
+    first.skills.append("Injected")
+
+    second = await parse_resume_text_async(text)
+
+    assert second.skills == ["Python", "SQL"]
+    assert second is not first
+
+
+def test_location_does_not_swallow_the_start_of_an_email():
+    info = extract_personal_info("Jane Doe\nBerlin, JD@foo.com\n555-123-4567\n")
+
+    assert info.email == "JD@foo.com"
+    assert info.phone == "555-123-4567"
+
+    info = extract_personal_info("Jane Doe\nSan Francisco, CA jane@foo.com\n")
+    assert info.location == "San Francisco, CA"
+    assert info.email == "jane@foo.com"
+
+
+@pytest.mark.asyncio
+async def test_section_gate_shares_the_parse_split(monkeypatch):
+    """With require_sections, the gate and the parse split the text once."""
+    calls = []
+    split = parser_module.split_all_sections
+
+    def counting_split(text):
+        calls.append(text)
+        return split(text)
+
+    monkeypatch.setattr(parser_module, "split_all_sections", counting_split)
+    complete = (
+        "Gate Tester\n\nEDUCATION\nState University\nBSc Computer Science\n\n"
+        "EXPERIENCE\nAcme Corp 2019 - 2021\n- Built services\n\nSKILLS\nPython • SQL"
+    )
+
+    resume = await parse_resume_text_async(complete, require_sections=True)
+    assert resume.skills == ["Python", "SQL"]
+    assert len(calls) == 1
+
+    assert await parse_resume_text_async("Gate Tester\n\nSKILLS\nPython", require_sections=True) is None
+    assert len(calls) == 2
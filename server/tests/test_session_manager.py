@@ -0,0 +1,130 @@
+"""Tests for the Redis session store."""
+
+import time
+
+import fakeredis
+import orjson
+import pytest
+
+from src.utils import session_manager
+from src.utils.session_manager import SessionManager
+
+
+@pytest.fixture
+def manager():
+    manager = SessionManager(redis_url="redis://test")
+    manager._redis = fakeredis.FakeAsyncRedis()
+    return manager
+
+
+async def _store_pre_index_sessions(client):
+    expires_at = time.time() + 600
+    await client.hset("mcp:session:hash-1", mapping={
+        "session_id": "hash-1",
+        "user_id": "alice",
+        "created_at": time.time(),
+        "expires_at": expires_at,
+        "data:step": orjson.dumps(1),
+    })
+    await client.set("mcp:session:json-1", orjson.dumps({
+        "session_id": "json-1",
+        "user_id": "alice",
+        "created_at": time.time(),
+        "expires_at": expires_at,
+        "data": {},
+    }))
+    await client.hset("mcp:session:other", mapping={
+        "session_id": "other",
+        "user_id": "bob",
+        "created_at": time.time(),
+        "expires_at": expires_at,
+    })
+
+
+def _connect_to(monkeypatch, client):
+    async def from_url(url):
+        return client
+
+    monkeypatch.setattr(session_manager.redis, "from_url", from_url)
+
+
+@pytest.mark.asyncio
+async def test_startup_indexes_sessions_stored_before_the_index(monkeypatch):
+    """The first startup indexes old sessions; later startups skip the scan."""
+    client = fakeredis.FakeAsyncRedis()
+    await _store_pre_index_sessions(client)
+    _connect_to(monkeypatch, client)
+    manager = SessionManager(redis_url="redis://test")
+
+    await manager.initialize()
+
+    sessions = await manager.get_user_sessions("alice")
+    assert sorted(session.session_id for session in sessions) == ["hash-1", "json-1"]
+    assert await client.smembers("mcp:user_sessions:alice") == {b"hash-1", b"json-1"}
+    assert await client.smembers("mcp:user_sessions:bob") == {b"other"}
+    assert await client.ttl("mcp:user_sessions:alice") > 0
+
+    await client.delete("mcp:user_sessions:alice")
+    await SessionManager(redis_url="redis://test").initialize()
+    assert not await client.exists("mcp:user_sessions:alice")
+
+
+@pytest.mark.asyncio
+async def test_users_without_sessions_are_not_looked_up_by_scanning(manager, monkeypatch):
+    def scan_iter(*args, **kwargs):
+        raise AssertionError("get_user_sessions scanned the keyspace")
+
+    monkeypatch.setattr(manager._redis, "scan_iter", scan_iter)
+
+    assert await manager.get_user_sessions("carol") == []
+    assert await manager.get_user_sessions("carol") == []
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_hashes_and_updates_write_changed_fields(manager):
+    session = await manager.create_session("alice", data={"step": 1, "name": "a"})
+    key = f"mcp:session:{session.session_id}"
+
+    await manager.update_session(session.session_id, {"step": 2})
+
+    fields = await manager._redis.hgetall(key)
+    assert orjson.loads(fields[b"data:step"]) == 2
+    assert orjson.loads(fields[b"data:name"]) == "a"
+    assert fields[b"user_id"] == b"alice"
+    assert (await manager.get_session(session.session_id)).data == {"step": 2, "name": "a"}
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_session_is_rewritten_as_a_hash(manager):
+    await manager._redis.set("mcp:session:legacy", orjson.dumps({
+        "session_id": "legacy",
+        "user_id": "alice",
+        "created_at": "2024-01-01T00:00:00",
+        "expires_at": "2999-01-01T00:00:00",
+        "data": {"step": 1},
+    }))
+
+    session = await manager.get_session("legacy")
+
+    assert session.data == {"step": 1}
+    assert await manager._redis.type("mcp:session:legacy") == b"hash"
+    assert await manager._redis.ttl("mcp:session:legacy") > 0
+    updated = await manager.update_session("legacy", {"step": 2})
+    assert updated.data == {"step": 2}
+    assert orjson.loads(await manager._redis.hget("mcp:session:legacy", "data:step")) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_does_not_recreate_a_session_deleted_after_it_was_read(manager, monkeypatch):
+    session = await manager.create_session("alice", data={"step": 1})
+    get_session = manager.get_session
+
+    async def get_then_delete(session_id):
+        found = await get_session(session_id)
+        await manager._redis.delete(f"mcp:session:{session_id}")
+        return found
+
+    monkeypatch.setattr(manager, "get_session", get_then_delete)
+
+    assert await manager.update_session(session.session_id, {"step": 2}) is None
+    assert not await manager._redis.exists(f"mcp:session:{session.session_id}")
@@ -0,0 +1,54 @@
+"""Tests for the incremental Server-Sent Events parser."""
+
+import pytest
+
+from src.core.protocol.sse_parser import IncrementalSSEParser
+
+STREAM = (
+    b": keep-alive\r\n"
+    b"\r\n"
+    b"event: message\r\n"
+    b'data: {"jsonrpc": "2.0",\r\n'
+    b'data:"id": 1}\r\n'
+    b"\r\n"
+    b"id: 7\n"
+    b"data: second\n"
+    b"\n"
+)
+EVENTS = [("message", b'{"jsonrpc": "2.0",\n"id": 1}'), (None, b"second")]
+
+
+def _parse(chunks):
+    parser = IncrementalSSEParser()
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    last = parser.close()
+    if last:
+        events.append(last)
+    return events
+
+
+def test_events_are_the_same_for_every_chunk_boundary():
+    """Splits inside field names, between CR and LF, and inside the blank line."""
+    assert _parse([STREAM]) == EVENTS
+    for i in range(len(STREAM) + 1):
+        assert _parse([STREAM[:i], STREAM[i:]]) == EVENTS, i
+    assert _parse([STREAM[i:i + 1] for i in range(len(STREAM))]) == EVENTS
+
+
+def test_events_are_returned_as_soon_as_they_complete():
+    parser = IncrementalSSEParser()
+
+    assert parser.feed(b"event: message\r\ndata: one\r\n") == []
+    assert parser.feed(b"\r\ndata: tw") == [("message", b"one")]
+    assert parser.feed(b"o\r\n\r\n") == [(None, b"two")]
+
+
+@pytest.mark.parametrize("ending", [b"", b"\r\n", b"\n"])
+def test_close_dispatches_an_unterminated_event(ending):
+    parser = IncrementalSSEParser()
+
+    assert parser.feed(b"event: message\r\ndata: last" + ending) == []
+    assert parser.close() == ("message", b"last")
+    assert parser.close() is None